@@ -4,8 +4,8 @@ Configuration management module
 
 import os
 import yaml
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass, asdict, field, fields
 from pathlib import Path
 from enum import Enum
 
@@ -30,6 +30,9 @@ class DatabaseConfig:
     ssl_cert: Optional[str] = None
     timeout: int = 30
     pool_size: int = 5
+    pool_timeout: int = 30
+    pool_max_lifetime: int = 1800
+    pool_validate_on_borrow: bool = True
 
 @dataclass
 class AppConfig:
@@ -38,6 +41,7 @@ class AppConfig:
     timestamp_column: str = "history_timestamp"
     operation_column: str = "history_operation"
     user_column: str = "history_user"
+    changes_column: str = "history_changes"
     include_system_tables: bool = False
     include_views: bool = False
     auto_commit: bool = False
@@ -45,6 +49,53 @@ class AppConfig:
     default_schema: str = "public"
     max_retries: int = 3
     retry_delay: int = 2
+    parallel_workers: int = 1
+    pipeline_batch_size: int = 50
+    lock_timeout_ms: int = 0
+    lock_retries: int = 3
+    lock_retry_delay: float = 0.5
+    lock_max_deferrals: int = 2
+    capture_mode: str = "row"
+    trigger_timing: str = "before"
+    skip_unchanged_updates: bool = False
+    storage_mode: str = "full"
+    history_layout: str = "per_table"
+    audit_table: str = "history_audit"
+    audit_schema: Optional[str] = None
+    partition_by: str = "none"
+    partition_premake: int = 4
+    timestamp_index: str = "brin"
+    key_index: bool = True
+    hist_id_strategy: str = "sequence"
+    sequence_cache: int = 1
+    storage_profile: str = "default"
+    toast_compression: Optional[str] = None
+    history_tablespace: Optional[str] = None
+    # Columns recorded in history (empty = all); primary keys are always kept
+    include_columns: List[str] = field(default_factory=list)
+    exclude_columns: List[str] = field(default_factory=list)
+    # Storage parameters of history tables, merged over storage_profile
+    storage_options: Dict[str, Any] = field(default_factory=dict)
+    # Per-table overrides of the settings above, keyed by table name
+    tables: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+def table_config(app_config: Dict[str, Any], table_name: str) -> Dict[str, Any]:
+    """Resolve app settings for one table (app.tables.<name> overrides globals)"""
+    overrides = (app_config.get('tables') or {}).get(table_name) or {}
+    return {**app_config, **overrides}
+
+_APP_FIELDS = frozenset(f.name for f in fields(AppConfig))
+
+def resolve_app_config(config: Union[AppConfig, Dict[str, Any]]) -> AppConfig:
+    """
+    AppConfig for an app settings dict, with defaults filled in
+    
+    Unknown keys are ignored and an AppConfig is returned as is, so
+    callers can resolve a table's settings once and reuse the object.
+    """
+    if isinstance(config, AppConfig):
+        return config
+    return AppConfig(**{key: value for key, value in config.items() if key in _APP_FIELDS})
 
 class ConfigManager:
     """Manages application configuration"""
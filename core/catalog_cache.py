@@ -0,0 +1,194 @@
+"""
+Catalog metadata caching
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from utils.logger import get_logger
+
+class CatalogSnapshotCache:
+    """
+    Persistent catalog snapshots stored on disk per host/database/schema
+
+    A snapshot holds the table list and column metadata of one schema,
+    tagged with the catalog version it was read at. Callers pass the
+    current version (obtained from a cheap probe query) when loading, and
+    a snapshot taken at any other version is treated as stale.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, cache_dir: str, host: str, port: Any, database: Optional[str]):
+        self.cache_dir = Path(cache_dir)
+        self.host = host or 'localhost'
+        self.port = port
+        self.database = database or ''
+        self.logger = get_logger("catalog_cache")
+
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        """Make a value usable as a path component"""
+        return re.sub(r'[^A-Za-z0-9_.-]', '_', str(name)) or '_'
+
+    def _path(self, schema: str) -> Path:
+        """Snapshot file location for a schema"""
+        return (
+            self.cache_dir
+            / self._safe_name(f"{self.host}_{self.port}")
+            / self._safe_name(self.database)
+            / f"{self._safe_name(schema)}.json"
+        )
+
+    def load(self, schema: str, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a snapshot if it was taken at the given catalog version
+
+        Args:
+            schema: Schema name
+            version: Current catalog version token
+
+        Returns:
+            Snapshot dict with 'tables' and 'columns', or None if missing/stale
+        """
+        path = self._path(schema)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable catalog snapshot {path}: {str(e)}")
+            return None
+
+        if snapshot.get('format') != self.FORMAT_VERSION or snapshot.get('version') != version:
+            self.logger.debug(f"Catalog snapshot for schema '{schema}' is stale")
+            return None
+
+        self.logger.info(f"Using catalog snapshot for schema '{schema}' taken at {snapshot.get('created_at')}")
+        return snapshot
+
+    def save(self, schema: str, version: str, tables: List[Dict[str, Any]],
+             columns: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Write a snapshot to disk and return it"""
+        snapshot = {
+            'format': self.FORMAT_VERSION,
+            'version': version,
+            'created_at': datetime.now().isoformat(),
+            'tables': [dict(table) for table in tables],
+            'columns': {
+                table_name: [dict(col) for col in table_columns]
+                for table_name, table_columns in columns.items()
+            }
+        }
+
+        path = self._path(schema)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so a concurrent run never reads a partial file
+            tmp_path = path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(tmp_path, path)
+            self.logger.debug(f"Saved catalog snapshot for schema '{schema}' to {path}")
+        except OSError as e:
+            self.logger.warning(f"Failed to save catalog snapshot for schema '{schema}': {str(e)}")
+
+        # Return the JSON-normalized form so cached and fresh reads look identical
+        return json.loads(json.dumps(snapshot, default=str))
+
+    def invalidate(self, schema: str):
+        """Remove the snapshot for a schema"""
+        try:
+            self._path(schema).unlink()
+            self.logger.debug(f"Invalidated catalog snapshot for schema '{schema}'")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to invalidate catalog snapshot for schema '{schema}': {str(e)}")
+
+class MetadataCache:
+    """
+    Session-scoped in-memory cache for catalog metadata
+
+    Entries are keyed by (kind, schema, table) tuples, expire after a TTL
+    and are evicted least-recently-used once the cache is full. Unlike
+    utils.decorators.memoize it supports invalidating a single table or
+    schema, which is needed once DDL has been executed.
+    """
+
+    # Sentinel returned on a miss (None is a valid cached value)
+    MISSING = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Any:
+        """
+        Get a cached value
+
+        Returns:
+            The cached value, or MetadataCache.MISSING if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self.ttl is None or (time.monotonic() - stored_at) < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return self.MISSING
+
+    def put(self, key: Tuple[Any, ...], value: Any):
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while self.maxsize and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, schema: Optional[str] = None, table_name: Optional[str] = None):
+        """
+        Invalidate cached entries
+
+        Args:
+            schema: Schema to invalidate (None clears everything)
+            table_name: Table to invalidate; the schema's table list is
+                always dropped too since DDL may have added relations
+        """
+        with self._lock:
+            if schema is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if key[1] != schema:
+                    continue
+                if table_name is None or len(key) < 3 or key[2] == table_name:
+                    del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries)
+            }
@@ -0,0 +1,226 @@
+"""
+Database connection pooling
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+from utils.logger import get_logger
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection became available in time"""
+    pass
+
+class ConnectionPool:
+    """
+    Thread-safe pool of driver connections
+
+    Connections are created lazily up to max_size. A borrowed connection is
+    health-checked first (when validation is enabled) and replaced if it is
+    broken or older than max_lifetime. Callers that find the pool exhausted
+    wait for a checkin, and the time spent waiting is recorded.
+    """
+
+    def __init__(self, create: Callable[[], Any], close: Callable[[Any], None],
+                 validate: Optional[Callable[[Any], bool]] = None,
+                 reset: Optional[Callable[[Any], None]] = None,
+                 max_size: int = 5, max_lifetime: Optional[float] = 1800.0,
+                 acquire_timeout: float = 30.0, name: str = "pool"):
+        """
+        Args:
+            create: Opens a new driver connection
+            close: Closes a driver connection
+            validate: Returns False if a connection is no longer usable
+            reset: Cleans up a connection on checkin (e.g. rolls back)
+            max_size: Maximum number of open connections
+            max_lifetime: Seconds after which a connection is recycled (None for no limit)
+            acquire_timeout: Seconds to wait for a free connection
+            name: Name used in log messages
+        """
+        self._create = create
+        self._close = close
+        self._validate = validate
+        self._reset = reset
+        self.max_size = max(1, int(max_size))
+        self.max_lifetime = max_lifetime
+        self.acquire_timeout = acquire_timeout
+        self.name = name
+        self.logger = get_logger(f"pool.{name}")
+
+        self._condition = threading.Condition()
+        self._idle: deque = deque()  # (connection, created_at)
+        self._in_use: Dict[int, float] = {}  # id(connection) -> created_at
+        self._closed = False
+        self._metrics = {
+            'created': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'recycled': 0,
+            'invalidated': 0
+        }
+
+    def _expired(self, created_at: float) -> bool:
+        """Whether a connection exceeded its maximum lifetime"""
+        return self.max_lifetime is not None and (time.monotonic() - created_at) >= self.max_lifetime
+
+    def _discard(self, connection: Any):
+        """Close a connection, ignoring errors"""
+        try:
+            self._close(connection)
+        except Exception as e:
+            self.logger.debug(f"Error closing pooled connection: {str(e)}")
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a connection
+
+        Args:
+            timeout: Seconds to wait (defaults to the pool's acquire_timeout)
+
+        Returns:
+            A healthy driver connection
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        wait_started = None
+
+        while True:
+            candidate = None
+            create_new = False
+
+            with self._condition:
+                if self._closed:
+                    raise PoolTimeoutError(f"Connection pool '{self.name}' is closed")
+
+                while not self._idle and len(self._in_use) >= self.max_size:
+                    if wait_started is None:
+                        wait_started = time.monotonic()
+                        self._metrics['waits'] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"Timed out after {timeout}s waiting for a connection from pool '{self.name}'"
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    candidate = self._idle.popleft()
+                else:
+                    create_new = True
+                # Reserve the slot while the connection is validated or opened
+                slot = object()
+                self._in_use[id(slot)] = time.monotonic()
+
+            try:
+                if create_new:
+                    connection = self._create()
+                    created_at = time.monotonic()
+                    with self._condition:
+                        self._metrics['created'] += 1
+                else:
+                    connection, created_at = candidate
+                    if self._expired(created_at):
+                        self._discard(connection)
+                        with self._condition:
+                            self._metrics['recycled'] += 1
+                        connection = None
+                    elif self._validate is not None and not self._validate(connection):
+                        self._discard(connection)
+                        with self._condition:
+                            self._metrics['invalidated'] += 1
+                        connection = None
+            except Exception:
+                with self._condition:
+                    del self._in_use[id(slot)]
+                    self._condition.notify()
+                raise
+
+            with self._condition:
+                del self._in_use[id(slot)]
+                if connection is None:
+                    # Replacement will be created on the next loop iteration
+                    continue
+                self._in_use[id(connection)] = created_at
+                self._metrics['checkouts'] += 1
+                if wait_started is not None:
+                    waited = time.monotonic() - wait_started
+                    self._metrics['wait_time_total'] += waited
+                    self._metrics['wait_time_max'] = max(self._metrics['wait_time_max'], waited)
+            return connection
+
+    def release(self, connection: Any, discard: bool = False):
+        """
+        Check a connection back in
+
+        Args:
+            connection: Connection previously returned by acquire()
+            discard: Close the connection instead of returning it to the pool
+        """
+        with self._condition:
+            created_at = self._in_use.pop(id(connection), None)
+
+        if created_at is None:
+            self.logger.warning("Released a connection that was not checked out from this pool")
+            return
+
+        if not discard and self._reset is not None:
+            try:
+                self._reset(connection)
+            except Exception as e:
+                self.logger.debug(f"Pooled connection reset failed, discarding: {str(e)}")
+                discard = True
+
+        if discard or self._closed or self._expired(created_at):
+            self._discard(connection)
+            if not discard and not self._closed:
+                with self._condition:
+                    self._metrics['recycled'] += 1
+        else:
+            with self._condition:
+                self._idle.append((connection, created_at))
+
+        with self._condition:
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Context manager that checks a connection out and back in"""
+        connection = self.acquire(timeout)
+        discard = False
+        try:
+            yield connection
+        except Exception:
+            discard = self._validate is not None and not self._validate(connection)
+            raise
+        finally:
+            self.release(connection, discard=discard)
+
+    def close(self):
+        """Close all idle connections; in-use ones are closed when released"""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for connection, _ in idle:
+            self._discard(connection)
+        self.logger.info(f"Connection pool '{self.name}' closed: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool size and wait metrics"""
+        with self._condition:
+            stats = dict(self._metrics)
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = len(self._in_use)
+            stats['max_size'] = self.max_size
+            stats['wait_time_avg'] = (
+                stats['wait_time_total'] / stats['waits'] if stats['waits'] else 0.0
+            )
+            return stats
@@ -4,24 +4,57 @@ Database abstraction layer
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
+import os
+import re
 import threading
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from enum import Enum
+from .catalog_cache import CatalogSnapshotCache, MetadataCache
+from .connection_pool import ConnectionPool
 from utils.logger import get_logger
 
 class DatabaseError(Exception):
     """Custom database exception"""
     pass
 
+class LockTimeoutError(DatabaseError):
+    """A statement gave up waiting for a lock held by another session"""
+    pass
+
+class BatchExecutionError(DatabaseError):
+    """A statement submitted through execute_script failed"""
+    
+    def __init__(self, message: str, tag: Any = None, statement: Optional[str] = None,
+                 index: Optional[int] = None):
+        self.tag = tag
+        self.statement = statement
+        self.index = index
+        super().__init__(message)
+
 class BaseDatabase(ABC):
     """Abstract base class for database operations"""
     
+    # Whether DDL can be rolled back (and therefore grouped under savepoints)
+    TRANSACTIONAL_DDL = True
+    
+    # Whether several statements can be sent to the server in one round trip
+    MULTI_STATEMENT = True
+    
     def __init__(self, config: Dict[str, Any], ui):
         self.config = config
         self.ui = ui
         self.connection = None
+        self.pool: Optional[ConnectionPool] = None
         self.lock = threading.RLock()
-        self._transaction_stack = []
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats = {'statements': 0, 'commits': 0, 'rollbacks': 0}
+        self._snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._current_user: Optional[str] = None
+        self.metadata_cache = MetadataCache(
+            maxsize=config.get('metadata_cache_size', 4096),
+            ttl=config.get('metadata_cache_ttl', 300)
+        )
         self.logger = get_logger(f"database.{self.__class__.__name__}")
         self.logger.info(f"Initializing {self.__class__.__name__} with config: {self._safe_config()}")
     
@@ -34,6 +67,14 @@ class BaseDatabase(ABC):
             safe_config['username'] = safe_config['username'][:3] + '***' if len(safe_config['username']) > 3 else '***'
         return safe_config
     
+    @property
+    def _transaction_stack(self) -> List[bool]:
+        """Open transactions of the current thread's connection"""
+        stack = getattr(self._local, 'transaction_stack', None)
+        if stack is None:
+            stack = self._local.transaction_stack = []
+        return stack
+    
     @abstractmethod
     def connect(self) -> bool:
         """Establish database connection"""
@@ -54,16 +95,190 @@ class BaseDatabase(ABC):
         """Get list of schemas in database"""
         pass
     
-    @abstractmethod
     def get_tables(self, schema: str) -> List[Dict[str, Any]]:
         """Get list of tables in schema"""
-        pass
+        key = ('tables', schema)
+        tables = self.metadata_cache.get(key)
+        if tables is MetadataCache.MISSING:
+            snapshot = self._catalog_snapshot(schema)
+            tables = snapshot['tables'] if snapshot is not None else self._fetch_tables(schema)
+            self.metadata_cache.put(key, tables)
+        return tables
     
-    @abstractmethod
     def get_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
         """Get columns for a specific table"""
+        key = ('columns', schema, table_name)
+        columns = self.metadata_cache.get(key)
+        if columns is MetadataCache.MISSING:
+            snapshot = self._catalog_snapshot(schema)
+            if snapshot is not None and table_name in snapshot['columns']:
+                columns = snapshot['columns'][table_name]
+            else:
+                columns = self._fetch_table_columns(schema, table_name)
+            self.metadata_cache.put(key, columns)
+        return columns
+    
+    def get_schema_columns(self, schema: str,
+                           table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get columns for many tables of a schema at once
+        
+        Tables already in the metadata cache are served from it; the rest
+        are read together with a single bulk catalog query.
+        
+        Args:
+            schema: Schema name
+            table_names: Tables to include (None for every table in the schema)
+            
+        Returns:
+            Dict mapping table name to its ordered column list
+        """
+        if table_names is None:
+            table_names = [table['name'] for table in self.get_tables(schema)]
+        
+        columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+        missing = []
+        for table_name in table_names:
+            columns = self.metadata_cache.get(('columns', schema, table_name))
+            if columns is MetadataCache.MISSING:
+                missing.append(table_name)
+            else:
+                columns_by_table[table_name] = columns
+        
+        if missing:
+            snapshot = self._catalog_snapshot(schema)
+            if snapshot is not None:
+                cached = snapshot['columns']
+                fetched = {name: cached[name] for name in missing if name in cached}
+                not_in_snapshot = [name for name in missing if name not in cached]
+                if not_in_snapshot:
+                    fetched.update(self._fetch_schema_columns(schema, not_in_snapshot))
+            else:
+                fetched = self._fetch_schema_columns(schema, missing)
+            
+            for table_name, columns in fetched.items():
+                self.metadata_cache.put(('columns', schema, table_name), columns)
+            columns_by_table.update(fetched)
+        
+        return columns_by_table
+    
+    def get_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Get constraints for a specific table"""
+        key = ('constraints', schema, table_name)
+        constraints = self.metadata_cache.get(key)
+        if constraints is MetadataCache.MISSING:
+            constraints = self._fetch_table_constraints(schema, table_name)
+            self.metadata_cache.put(key, constraints)
+        return constraints
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get metadata cache hit/miss counters"""
+        return self.metadata_cache.stats()
+    
+    @abstractmethod
+    def _fetch_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read list of tables in schema from the server"""
+        pass
+    
+    @abstractmethod
+    def _fetch_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read columns for a specific table from the server"""
         pass
     
+    def _fetch_schema_columns(self, schema: str,
+                              table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read columns for many tables from the server
+        
+        Backends that can read the catalog in a single query override this;
+        the default falls back to one query per table.
+        """
+        if table_names is None:
+            table_names = [table['name'] for table in self._fetch_tables(schema)]
+        return {
+            table_name: self._fetch_table_columns(schema, table_name)
+            for table_name in table_names
+        }
+    
+    def _fetch_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read constraints for a specific table (backends without support return none)"""
+        return []
+    
+    def get_partitioned_tables(self, schema: str) -> List[str]:
+        """Names of partitioned (parent) tables in a schema (backends without support return none)"""
+        return []
+    
+    def get_invalid_indexes(self, schema: str) -> List[str]:
+        """Names of indexes left invalid by an interrupted build (backends without concurrent builds return none)"""
+        return []
+    
+    def get_catalog_version(self, schema: str) -> Optional[str]:
+        """
+        Cheap probe identifying the current catalog state of a schema
+        
+        Returns None when the backend cannot detect catalog changes, which
+        disables the on-disk snapshot cache for it.
+        """
+        return None
+    
+    def _get_snapshot_cache(self) -> Optional[CatalogSnapshotCache]:
+        """Snapshot cache for this connection, or None when disabled"""
+        if not self.config.get('catalog_cache', True):
+            return None
+        return CatalogSnapshotCache(
+            self.config.get('catalog_cache_dir', 'cache/catalog'),
+            self.config.get('host'),
+            self.config.get('port'),
+            self.config.get('database')
+        )
+    
+    def _catalog_snapshot(self, schema: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the catalog snapshot for a schema, rebuilding it when stale
+        
+        The version probe runs once per schema per session; call
+        invalidate_metadata() after executing DDL to force a new probe.
+        """
+        if schema in self._snapshots:
+            return self._snapshots[schema]
+        
+        snapshot = None
+        cache = self._get_snapshot_cache()
+        if cache is not None and schema:
+            try:
+                version = self.get_catalog_version(schema)
+            except Exception as e:
+                self.logger.warning(f"Catalog version probe failed for schema '{schema}': {str(e)}")
+                version = None
+            
+            if version is not None:
+                snapshot = cache.load(schema, version)
+                if snapshot is None:
+                    self.logger.info(f"Refreshing catalog snapshot for schema '{schema}'")
+                    snapshot = cache.save(
+                        schema, version,
+                        self._fetch_tables(schema),
+                        self._fetch_schema_columns(schema)
+                    )
+        
+        self._snapshots[schema] = snapshot
+        return snapshot
+    
+    def invalidate_metadata(self, schema: str, table_name: Optional[str] = None):
+        """
+        Drop cached catalog metadata after DDL changed the schema
+        
+        Args:
+            schema: Schema whose metadata changed
+            table_name: Table that changed (None for the whole schema)
+        """
+        self._snapshots.pop(schema, None)
+        self.metadata_cache.invalidate(schema, table_name)
+        self.logger.debug(
+            f"Invalidated metadata for {schema}.{table_name}" if table_name
+            else f"Invalidated metadata for schema '{schema}'"
+        )
+    
     @abstractmethod
     def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
         """Execute a SQL query"""
@@ -74,6 +289,97 @@ class BaseDatabase(ABC):
         """Execute multiple SQL queries"""
         pass
     
+    @property
+    def transaction_mode(self) -> str:
+        """
+        'batch': transaction() owns the connection and commits once;
+        'statement': legacy behavior, every write statement commits
+        """
+        return self.config.get('transaction_mode', 'batch')
+    
+    def _count(self, stat: str, amount: int = 1):
+        """Increment an execution counter"""
+        with self._stats_lock:
+            self.stats[stat] = self.stats.get(stat, 0) + amount
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get statement/commit/rollback counters"""
+        with self._stats_lock:
+            return dict(self.stats)
+    
+    def in_transaction(self) -> bool:
+        """Whether the current thread's connection is inside transaction()"""
+        return bool(self._transaction_stack) and self.transaction_mode == 'batch'
+    
+    def _is_lock_timeout(self, error: Exception) -> bool:
+        """Whether a driver error means a lock could not be acquired in time"""
+        return False
+    
+    def lock_timeout_statement(self, milliseconds: int) -> Optional[str]:
+        """Statement limiting how long DDL waits for locks (None if unsupported)"""
+        return None
+    
+    def _lock_timeout_restore_statement(self) -> Optional[str]:
+        """Statement putting the session's current lock wait limit back (None if nothing to restore)"""
+        return None
+    
+    @contextmanager
+    def lock_timeout(self, milliseconds: int):
+        """
+        Limit lock waits of the statements run inside the block
+        
+        The session's previous limit is restored on exit, so later work on
+        the connection is unaffected. Enter it before transaction() so the
+        limit also covers taking the transaction's locks.
+        """
+        statement = self.lock_timeout_statement(milliseconds)
+        if not statement:
+            yield
+            return
+        
+        restore = self._lock_timeout_restore_statement()
+        self.execute_query(statement)
+        try:
+            yield
+        finally:
+            if restore:
+                try:
+                    self.execute_query(restore)
+                except Exception as e:
+                    self.logger.warning(f"Failed to restore the session lock timeout: {str(e)}")
+    
+    def supports_savepoints(self) -> bool:
+        """Whether work can currently be rolled back to a savepoint"""
+        return self.in_transaction() and self.TRANSACTIONAL_DDL
+    
+    def _finish_statement(self, connection):
+        """Commit a write statement unless a transaction owns the connection"""
+        if not self.in_transaction():
+            connection.commit()
+            self._count('commits')
+    
+    def _abort_statement(self, connection):
+        """
+        Roll back after a failed statement outside a transaction
+        
+        Inside a transaction the owner decides: the enclosing savepoint or
+        transaction() rolls back.
+        """
+        if not self.in_transaction():
+            connection.rollback()
+            self._count('rollbacks')
+    
+    def _execute_control(self, statement: str):
+        """Run a transaction-control statement on the active connection"""
+        connection = self._active_connection()
+        with self._connection_lock(connection):
+            cursor = connection.cursor()
+            try:
+                self.logger.debug(f"Executing control statement: {statement}")
+                cursor.execute(statement)
+            finally:
+                cursor.close()
+    
     @contextmanager
     def transaction(self):
         """Context manager for transactions"""
@@ -89,36 +395,284 @@ class BaseDatabase(ABC):
     
     def begin_transaction(self):
         """Begin a new transaction"""
-        self.execute_query("BEGIN TRANSACTION")
+        if self.transaction_mode == 'statement':
+            self.execute_query("BEGIN TRANSACTION")
+            self._transaction_stack.append(True)
+            self.logger.debug("Transaction begun")
+            return
+        
+        if self._transaction_stack:
+            # Nested transaction(): use a savepoint
+            name = f"sp_nested_{len(self._transaction_stack)}"
+            if self.TRANSACTIONAL_DDL:
+                self._execute_control(f"SAVEPOINT {name}")
+            self._transaction_stack.append(name)
+            self.logger.debug(f"Savepoint {name} created")
+            return
+        
+        # The driver opens the transaction implicitly with the first
+        # statement; just end any read-only transaction left by earlier SELECTs
+        self._active_connection().rollback()
         self._transaction_stack.append(True)
         self.logger.debug("Transaction begun")
     
     def commit_transaction(self):
         """Commit current transaction"""
-        if self._transaction_stack:
+        if not self._transaction_stack:
+            return
+        
+        if self.transaction_mode == 'statement':
             self.execute_query("COMMIT")
             self._transaction_stack.pop()
             self.logger.debug("Transaction committed")
+            return
+        
+        if len(self._transaction_stack) > 1:
+            name = self._transaction_stack.pop()
+            if self.TRANSACTIONAL_DDL:
+                self._execute_control(f"RELEASE SAVEPOINT {name}")
+            return
+        
+        self._active_connection().commit()
+        self._count('commits')
+        self._transaction_stack.pop()
+        self.logger.debug("Transaction committed")
     
     def rollback_transaction(self):
         """Rollback current transaction"""
-        if self._transaction_stack:
+        if not self._transaction_stack:
+            return
+        
+        if self.transaction_mode == 'statement':
             self.execute_query("ROLLBACK")
             self._transaction_stack.pop()
             self.logger.warning("Transaction rolled back")
+            return
+        
+        if len(self._transaction_stack) > 1:
+            name = self._transaction_stack.pop()
+            if self.TRANSACTIONAL_DDL:
+                self._execute_control(f"ROLLBACK TO SAVEPOINT {name}")
+            self.logger.warning(f"Rolled back to savepoint {name}")
+            return
+        
+        self._active_connection().rollback()
+        self._count('rollbacks')
+        self._transaction_stack.pop()
+        self.logger.warning("Transaction rolled back")
+    
+    @contextmanager
+    def savepoint(self, name: str):
+        """
+        Run a block under a savepoint of the current transaction
+        
+        If the block fails, only its work is rolled back and the exception
+        propagates; the enclosing transaction stays usable. Outside a
+        transaction (or on backends without transactional DDL) this is a
+        plain block.
+        """
+        if not self.supports_savepoints():
+            yield
+            return
+        
+        self._execute_control(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            self._execute_control(f"ROLLBACK TO SAVEPOINT {name}")
+            self.logger.warning(f"Rolled back to savepoint {name}")
+            raise
+        self._execute_control(f"RELEASE SAVEPOINT {name}")
+    
+    def execute_script(self, statements: List[Tuple[Any, str]]):
+        """
+        Submit many statements in as few server round trips as possible
+        
+        Statements are joined and sent in one request. If that request
+        fails, its effects are rolled back and the statements are replayed
+        one at a time so the error can be attributed to the statement (and
+        tag) that caused it.
+        
+        Args:
+            statements: (tag, sql) pairs; the tag identifies the origin of
+                each statement, e.g. a (table, action) tuple
+            
+        Raises:
+            BatchExecutionError: naming the tag and statement that failed
+        """
+        if not statements:
+            return
+        
+        if self.MULTI_STATEMENT and len(statements) > 1:
+            script = ";\n".join(sql.strip().rstrip(';') for _, sql in statements) + ";"
+            guarded = self.supports_savepoints()
+            if guarded:
+                self._execute_control("SAVEPOINT hst_script")
+            try:
+                self.execute_query(script)
+                if guarded:
+                    self._execute_control("RELEASE SAVEPOINT hst_script")
+                self.logger.debug(f"Executed {len(statements)} statements in one round trip")
+                return
+            except LockTimeoutError:
+                # Not a fault of any statement; let the caller retry
+                if guarded:
+                    self._execute_control("ROLLBACK TO SAVEPOINT hst_script")
+                raise
+            except DatabaseError as e:
+                if guarded:
+                    self._execute_control("ROLLBACK TO SAVEPOINT hst_script")
+                elif self.in_transaction():
+                    # Nothing to rewind to; the error cannot be narrowed down
+                    raise BatchExecutionError(str(e), statements[0][0], script)
+                self.logger.warning(
+                    f"Combined submission of {len(statements)} statements failed, "
+                    f"replaying one by one to locate the error"
+                )
+        
+        for index, (tag, sql) in enumerate(statements):
+            try:
+                self.execute_query(sql)
+            except LockTimeoutError:
+                raise
+            except DatabaseError as e:
+                raise BatchExecutionError(
+                    f"Statement {index + 1}/{len(statements)} for {tag} failed: {str(e)}",
+                    tag, sql, index
+                )
+    
+    def execute_autocommit(self, query: str) -> Any:
+        """
+        Execute a statement that must not run inside a transaction block
+        
+        (e.g. CREATE INDEX CONCURRENTLY). Backends that start transactions
+        implicitly override this; by default it is a plain execute_query().
+        """
+        if self.in_transaction():
+            raise DatabaseError("Statement cannot run inside a transaction")
+        return self.execute_query(query)
+    
+    def get_server_version(self) -> Optional[int]:
+        """Server version as a number (e.g. 160002), or None when unknown"""
+        return None
     
     def get_current_user(self) -> str:
-        """Get current database user"""
+        """Get current database user (queried once per session)"""
+        if self._current_user:
+            return self._current_user
         try:
             result = self.execute_query("SELECT CURRENT_USER")
-            return result[0][0] if result else 'SYSTEM'
+            if not result:
+                self._current_user = 'SYSTEM'
+            else:
+                row = result[0]
+                self._current_user = list(row.values())[0] if isinstance(row, dict) else row[0]
+            return self._current_user
         except Exception as e:
             self.logger.warning(f"Failed to get current user: {str(e)}")
             return 'UNKNOWN'
     
     def is_connected(self) -> bool:
         """Check if database is connected"""
-        return self.connection is not None and self.connection.closed == 0
+        return self._is_connection_open(self._active_connection())
+    
+    @abstractmethod
+    def _create_connection(self) -> Any:
+        """Open a new driver connection (used for the session and the pool)"""
+        pass
+    
+    def _is_connection_open(self, connection) -> bool:
+        """Check whether a driver connection is open"""
+        return connection is not None and connection.closed == 0
+    
+    def _validate_connection(self, connection) -> bool:
+        """Health check run on a pooled connection before it is borrowed"""
+        if not self._is_connection_open(connection):
+            return False
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            connection.rollback()
+            return True
+        except Exception as e:
+            self.logger.warning(f"Pooled connection failed validation: {str(e)}")
+            return False
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+    
+    def _init_pool(self):
+        """Create the connection pool sized by the pool_size setting"""
+        self._close_pool()
+        self.pool = ConnectionPool(
+            create=self._create_connection,
+            close=lambda connection: connection.close(),
+            validate=self._validate_connection if self.config.get('pool_validate_on_borrow', True) else None,
+            reset=lambda connection: connection.rollback(),
+            max_size=self.config.get('pool_size', 5),
+            max_lifetime=self.config.get('pool_max_lifetime', 1800),
+            acquire_timeout=self.config.get('pool_timeout', self.config.get('timeout', 30)),
+            name=self.__class__.__name__
+        )
+    
+    def _close_pool(self):
+        """Close the connection pool if one exists"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+    
+    def _active_connection(self):
+        """Pooled connection bound to the current thread, or the session connection"""
+        return getattr(self._local, 'connection', None) or self.connection
+    
+    def _connection_lock(self, connection):
+        """
+        Lock guarding a connection
+        
+        The shared session connection is serialized; a pooled connection is
+        owned by a single thread and needs no lock.
+        """
+        return self.lock if connection is self.connection else nullcontext()
+    
+    @contextmanager
+    def pooled_connection(self):
+        """
+        Bind a pooled connection to the current thread for the block
+        
+        All queries and transactions issued by this thread inside the block
+        run on the borrowed connection, so several threads can work in
+        parallel instead of queueing on the session connection.
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            # Already bound (nested use); reuse it
+            yield self._local.connection
+            return
+        
+        if self.pool is None:
+            raise DatabaseError("Connection pool is not initialized; call connect() first")
+        
+        connection = self.pool.acquire()
+        self._local.connection = connection
+        self._local.transaction_stack = []
+        discard = False
+        try:
+            yield connection
+        except Exception:
+            discard = not self._is_connection_open(connection)
+            raise
+        finally:
+            self._local.connection = None
+            self._local.transaction_stack = []
+            self.pool.release(connection, discard=discard)
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool size and wait metrics"""
+        return self.pool.stats() if self.pool is not None else {}
     
     def ping(self) -> bool:
         """Check database connection"""
@@ -132,33 +686,107 @@ class BaseDatabase(ABC):
 class PostgreSQLDatabase(BaseDatabase):
     """PostgreSQL implementation"""
     
+    # Column metadata read straight from pg_catalog. Lengths, precision and
+    # scale are decoded from atttypmod the same way information_schema does.
+    CATALOG_COLUMNS_QUERY = """
+    SELECT 
+        c.relname AS table_name,
+        a.attname AS column_name,
+        format_type(a.atttypid, a.atttypmod) AS data_type,
+        CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable,
+        pg_get_expr(d.adbin, d.adrelid) AS column_default,
+        CASE WHEN a.atttypid IN (1042, 1043) AND a.atttypmod > 0
+             THEN a.atttypmod - 4 END AS character_maximum_length,
+        CASE a.atttypid
+            WHEN 21 THEN 16 WHEN 23 THEN 32 WHEN 20 THEN 64
+            WHEN 700 THEN 24 WHEN 701 THEN 53
+            WHEN 1700 THEN CASE WHEN a.atttypmod > 0
+                                THEN ((a.atttypmod - 4) >> 16) & 65535 END
+        END AS numeric_precision,
+        CASE a.atttypid
+            WHEN 21 THEN 0 WHEN 23 THEN 0 WHEN 20 THEN 0
+            WHEN 1700 THEN CASE WHEN a.atttypmod > 0
+                                THEN (a.atttypmod - 4) & 65535 END
+        END AS numeric_scale,
+        a.attnum AS ordinal_position,
+        COALESCE(i.indisprimary, false) AS is_primary_key,
+        (
+            SELECT k.position
+            FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, position)
+            WHERE k.attnum = a.attnum
+        ) AS primary_key_position
+    FROM pg_catalog.pg_class AS c
+    JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_attribute AS a
+        ON a.attrelid = c.oid
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    LEFT JOIN pg_catalog.pg_attrdef AS d
+        ON d.adrelid = a.attrelid
+        AND d.adnum = a.attnum
+    LEFT JOIN pg_catalog.pg_index AS i
+        ON i.indrelid = c.oid
+        AND i.indisprimary
+        AND a.attnum = ANY(i.indkey)
+    WHERE n.nspname = %s
+    AND c.relkind IN ('r', 'p', 'v', 'f')
+    """
+    
+    @property
+    def use_pg_catalog(self) -> bool:
+        """Whether introspection reads pg_catalog instead of information_schema"""
+        return self.config.get('introspection', 'pg_catalog') == 'pg_catalog'
+    
+    def _is_lock_timeout(self, error: Exception) -> bool:
+        """SQLSTATE 55P03 is raised when lock_timeout expires"""
+        return getattr(error, 'pgcode', None) == '55P03'
+    
+    def lock_timeout_statement(self, milliseconds: int) -> Optional[str]:
+        """SET LOCAL lock_timeout inside a transaction, session-wide otherwise"""
+        scope = "LOCAL " if self.in_transaction() else ""
+        return f"SET {scope}lock_timeout = '{int(milliseconds)}ms'"
+    
+    def _lock_timeout_restore_statement(self) -> Optional[str]:
+        """SET LOCAL ends with the transaction; a session-wide SET is undone explicitly"""
+        if self.in_transaction():
+            return None
+        current = self.execute_query("SHOW lock_timeout")[0]['lock_timeout']
+        return f"SET lock_timeout = '{current}'"
+    
+    def _create_connection(self):
+        """Open a new psycopg2 connection"""
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
+        # Build connection parameters
+        conn_params = {
+            'host': self.config.get('host'),
+            'port': self.config.get('port', 5432),
+            'user': self.config.get('username'),
+            'password': self.config.get('password'),
+            'cursor_factory': RealDictCursor
+        }
+        
+        # Add database if specified
+        if self.config.get('database'):
+            conn_params['database'] = self.config.get('database')
+        
+        # Add SSL if enabled
+        if self.config.get('ssl_enabled', False):
+            conn_params['sslmode'] = 'require'
+            if self.config.get('ssl_cert'):
+                conn_params['sslcert'] = self.config.get('ssl_cert')
+        
+        return psycopg2.connect(**conn_params)
+    
     def connect(self) -> bool:
         try:
             import psycopg2
-            from psycopg2.extras import RealDictCursor
             
             self.logger.info(f"Connecting to PostgreSQL at {self.config.get('host')}:{self.config.get('port', 5432)}")
             
-            # Build connection parameters
-            conn_params = {
-                'host': self.config.get('host'),
-                'port': self.config.get('port', 5432),
-                'user': self.config.get('username'),
-                'password': self.config.get('password'),
-                'cursor_factory': RealDictCursor
-            }
-            
-            # Add database if specified
-            if self.config.get('database'):
-                conn_params['database'] = self.config.get('database')
-            
-            # Add SSL if enabled
-            if self.config.get('ssl_enabled', False):
-                conn_params['sslmode'] = 'require'
-                if self.config.get('ssl_cert'):
-                    conn_params['sslcert'] = self.config.get('ssl_cert')
-            
-            self.connection = psycopg2.connect(**conn_params)
+            self.connection = self._create_connection()
+            self._init_pool()
             self.logger.info("PostgreSQL connection established successfully")
             return True
             
@@ -174,6 +802,7 @@ class PostgreSQLDatabase(BaseDatabase):
     
     def disconnect(self):
         """Close database connection"""
+        self._close_pool()
         if self.connection and not self.connection.closed:
             try:
                 self.connection.close()
@@ -184,14 +813,16 @@ class PostgreSQLDatabase(BaseDatabase):
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
         """Execute a SQL query"""
-        if not self.is_connected():
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
             self.logger.error("Cannot execute query: Not connected to database")
             raise DatabaseError("Not connected to database")
         
         cursor = None
         try:
-            with self.lock:
-                cursor = self.connection.cursor()
+            with self._connection_lock(connection):
+                cursor = connection.cursor()
+                self._count('statements')
                 self.logger.debug(f"Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
                 
                 if params:
@@ -206,7 +837,7 @@ class PostgreSQLDatabase(BaseDatabase):
                     self.logger.debug(f"Query returned {len(result)} rows")
                     return result
                 else:
-                    self.connection.commit()
+                    self._finish_statement(connection)
                     affected = cursor.rowcount
                     self.logger.debug(f"Query affected {affected} rows")
                     return affected
@@ -216,12 +847,49 @@ class PostgreSQLDatabase(BaseDatabase):
             self.logger.debug(f"Failed query: {query}")
             if params:
                 self.logger.debug(f"Parameters: {params}")
-            self.connection.rollback()
-            raise DatabaseError(f"Query execution failed: {str(e)}")
+            self._abort_statement(connection)
+            error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+            raise error_class(f"Query execution failed: {str(e)}")
         finally:
             if cursor:
                 cursor.close()
     
+    def get_server_version(self) -> Optional[int]:
+        """server_version_num reported by psycopg2 at connect time"""
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
+            return None
+        return connection.server_version
+    
+    def execute_autocommit(self, query: str) -> Any:
+        """Execute a statement outside psycopg2's implicit transaction block"""
+        if self.in_transaction():
+            raise DatabaseError("Statement cannot run inside a transaction")
+        
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
+            self.logger.error("Cannot execute query: Not connected to database")
+            raise DatabaseError("Not connected to database")
+        
+        with self._connection_lock(connection):
+            # End any read-only transaction left by earlier SELECTs
+            connection.rollback()
+            connection.autocommit = True
+            cursor = connection.cursor()
+            try:
+                self._count('statements')
+                self.logger.debug(f"Executing in autocommit: {query[:100]}{'...' if len(query) > 100 else ''}")
+                cursor.execute(query)
+                return cursor.rowcount
+            except Exception as e:
+                self.logger.error(f"Query execution failed: {str(e)}")
+                self.logger.debug(f"Failed query: {query}")
+                error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+                raise error_class(f"Query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+                connection.autocommit = False
+    
     def execute_many(self, queries: List[str]):
         """Execute multiple SQL queries"""
         if not queries:
@@ -230,23 +898,25 @@ class PostgreSQLDatabase(BaseDatabase):
         
         self.logger.info(f"Executing {len(queries)} queries in batch")
         
-        with self.lock:
+        connection = self._active_connection()
+        with self._connection_lock(connection):
             cursor = None
             try:
-                cursor = self.connection.cursor()
+                cursor = connection.cursor()
                 for i, query in enumerate(queries, 1):
                     try:
                         self.logger.debug(f"Executing query {i}/{len(queries)}: {query[:50]}...")
                         cursor.execute(query)
+                        self._count('statements')
                     except Exception as e:
                         self.logger.error(f"Failed to execute query {i}: {str(e)}")
                         raise DatabaseError(f"Query {i} failed: {str(e)}")
                 
-                self.connection.commit()
+                self._finish_statement(connection)
                 self.logger.info(f"Successfully executed {len(queries)} queries")
                 
             except Exception as e:
-                self.connection.rollback()
+                self._abort_statement(connection)
                 self.logger.error(f"Batch execution failed: {str(e)}")
                 raise
             finally:
@@ -281,6 +951,8 @@ class PostgreSQLDatabase(BaseDatabase):
                 self.disconnect()
                 # Update config with new database
                 self.config['database'] = database
+                self._snapshots.clear()
+                self.metadata_cache.invalidate()
                 self.connect()
             except Exception as e:
                 self.logger.error(f"Failed to switch to database '{database}': {str(e)}")
@@ -301,16 +973,42 @@ class PostgreSQLDatabase(BaseDatabase):
             self.logger.error(f"Failed to get schemas: {str(e)}")
             raise DatabaseError(f"Failed to get schemas: {str(e)}")
     
-    def get_tables(self, schema: str) -> List[Dict[str, Any]]:
-        """Get list of tables in schema"""
-        query = """
-        SELECT 
-            table_name,
-            table_type
-        FROM information_schema.tables 
-        WHERE table_schema = %s
-        ORDER BY table_name
-        """
+    def _fetch_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read list of tables in schema"""
+        if self.use_pg_catalog:
+            query = """
+            SELECT 
+                c.relname AS table_name,
+                CASE c.relkind
+                    WHEN 'v' THEN 'VIEW'
+                    WHEN 'f' THEN 'FOREIGN'
+                    ELSE 'BASE TABLE'
+                END AS table_type
+            FROM pg_catalog.pg_class AS c
+            JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+            AND c.relkind IN ('r', 'p', 'v', 'f')
+            AND NOT c.relispartition
+            ORDER BY c.relname
+            """
+        else:
+            # information_schema lists partitions like any other table
+            query = """
+            SELECT 
+                t.table_name,
+                t.table_type
+            FROM information_schema.tables AS t
+            WHERE t.table_schema = %s
+            AND NOT EXISTS (
+                SELECT 1
+                FROM pg_catalog.pg_class AS c
+                JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+                WHERE n.nspname = t.table_schema
+                AND c.relname = t.table_name
+                AND c.relispartition
+            )
+            ORDER BY t.table_name
+            """
         try:
             result = self.execute_query(query, (schema,))
             tables = [
@@ -327,8 +1025,11 @@ class PostgreSQLDatabase(BaseDatabase):
             self.logger.error(f"Failed to get tables for schema '{schema}': {str(e)}")
             raise DatabaseError(f"Failed to get tables: {str(e)}")
     
-    def get_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
-        """Get columns for a specific table"""
+    def _fetch_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read columns for a specific table"""
+        if self.use_pg_catalog:
+            return self._fetch_schema_columns(schema, [table_name]).get(table_name, [])
+        
         query = """
         SELECT 
             column_name,
@@ -365,8 +1066,114 @@ class PostgreSQLDatabase(BaseDatabase):
             self.logger.error(f"Failed to get columns for table '{schema}.{table_name}': {str(e)}")
             raise DatabaseError(f"Failed to get table columns: {str(e)}")
     
-    def get_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
-        """Get constraints for a specific table"""
+    def _fetch_schema_columns(self, schema: str,
+                              table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read columns and primary key flags for many tables in one query"""
+        if self.use_pg_catalog:
+            query = self.CATALOG_COLUMNS_QUERY
+            params = [schema]
+            name_column = "c.relname"
+            order_by = " ORDER BY c.relname, a.attnum"
+        else:
+            query = """
+            SELECT 
+                c.table_name,
+                c.column_name,
+                c.data_type,
+                c.is_nullable,
+                c.column_default,
+                c.character_maximum_length,
+                c.numeric_precision,
+                c.numeric_scale,
+                c.ordinal_position,
+                (pk.column_name IS NOT NULL) AS is_primary_key,
+                pk.ordinal_position AS primary_key_position
+            FROM information_schema.columns AS c
+            LEFT JOIN (
+                SELECT kcu.table_name, kcu.column_name, kcu.ordinal_position
+                FROM information_schema.table_constraints AS tc
+                JOIN information_schema.key_column_usage AS kcu
+                    ON tc.constraint_name = kcu.constraint_name
+                    AND tc.table_schema = kcu.table_schema
+                    AND tc.table_name = kcu.table_name
+                WHERE tc.table_schema = %s
+                AND tc.constraint_type = 'PRIMARY KEY'
+            ) AS pk
+                ON pk.table_name = c.table_name
+                AND pk.column_name = c.column_name
+            WHERE c.table_schema = %s
+            """
+            params = [schema, schema]
+            name_column = "c.table_name"
+            order_by = " ORDER BY c.table_name, c.ordinal_position"
+        
+        if table_names is not None:
+            if not table_names:
+                return {}
+            query += f" AND {name_column} = ANY(%s)"
+            params.append(list(table_names))
+        query += order_by
+        
+        try:
+            result = self.execute_query(query, tuple(params))
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for row in result:
+                columns_by_table.setdefault(row['table_name'], []).append({
+                    'column_name': row['column_name'],
+                    'data_type': row['data_type'],
+                    'is_nullable': row['is_nullable'],
+                    'column_default': row['column_default'],
+                    'character_maximum_length': row['character_maximum_length'],
+                    'numeric_precision': row['numeric_precision'],
+                    'numeric_scale': row['numeric_scale'],
+                    'ordinal_position': row['ordinal_position'],
+                    'is_primary_key': row['is_primary_key'],
+                    'primary_key_position': row['primary_key_position']
+                })
+            self.logger.info(
+                f"Loaded columns for {len(columns_by_table)} tables in schema '{schema}' with one query"
+            )
+            return columns_by_table
+        except Exception as e:
+            self.logger.error(f"Failed to get columns for schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get schema columns: {str(e)}")
+    
+    def _fetch_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read constraints for a specific table"""
+        if self.use_pg_catalog:
+            query = """
+            SELECT 
+                con.conname AS constraint_name,
+                CASE con.contype
+                    WHEN 'p' THEN 'PRIMARY KEY'
+                    WHEN 'f' THEN 'FOREIGN KEY'
+                    WHEN 'u' THEN 'UNIQUE'
+                    WHEN 'c' THEN 'CHECK'
+                    WHEN 'x' THEN 'EXCLUDE'
+                END AS constraint_type,
+                a.attname AS column_name,
+                fn.nspname AS foreign_table_schema,
+                fc.relname AS foreign_table_name,
+                fa.attname AS foreign_column_name
+            FROM pg_catalog.pg_constraint AS con
+            JOIN pg_catalog.pg_class AS c ON c.oid = con.conrelid
+            JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+            LEFT JOIN LATERAL unnest(con.conkey, con.confkey)
+                WITH ORDINALITY AS k(attnum, fattnum, ord) ON true
+            LEFT JOIN pg_catalog.pg_attribute AS a
+                ON a.attrelid = con.conrelid
+                AND a.attnum = k.attnum
+            LEFT JOIN pg_catalog.pg_class AS fc ON fc.oid = con.confrelid
+            LEFT JOIN pg_catalog.pg_namespace AS fn ON fn.oid = fc.relnamespace
+            LEFT JOIN pg_catalog.pg_attribute AS fa
+                ON fa.attrelid = con.confrelid
+                AND fa.attnum = k.fattnum
+            WHERE n.nspname = %s
+            AND c.relname = %s
+            ORDER BY constraint_type, con.conname, k.ord
+            """
+            return self._read_constraints(query, schema, table_name)
+        
         query = """
         SELECT 
             tc.constraint_name,
@@ -386,6 +1193,10 @@ class PostgreSQLDatabase(BaseDatabase):
         AND tc.table_name = %s
         ORDER BY tc.constraint_type, tc.constraint_name
         """
+        return self._read_constraints(query, schema, table_name)
+    
+    def _read_constraints(self, query: str, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Run a constraint query and normalize its rows"""
         try:
             result = self.execute_query(query, (schema, table_name))
             constraints = [
@@ -405,9 +1216,67 @@ class PostgreSQLDatabase(BaseDatabase):
             self.logger.warning(f"Failed to get constraints for table '{schema}.{table_name}': {str(e)}")
             return []
 
+    def get_partitioned_tables(self, schema: str) -> List[str]:
+        """Names of partitioned (parent) tables in a schema"""
+        query = """
+        SELECT c.relname AS table_name
+        FROM pg_catalog.pg_partitioned_table AS p
+        JOIN pg_catalog.pg_class AS c ON c.oid = p.partrelid
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        WHERE n.nspname = %s
+        ORDER BY c.relname
+        """
+        try:
+            return [row['table_name'] for row in self.execute_query(query, (schema,))]
+        except Exception as e:
+            self.logger.error(f"Failed to get partitioned tables for schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get partitioned tables: {str(e)}")
+
+    def get_invalid_indexes(self, schema: str) -> List[str]:
+        """Indexes an interrupted CREATE INDEX CONCURRENTLY left invalid"""
+        query = """
+        SELECT c.relname AS index_name
+        FROM pg_catalog.pg_index AS i
+        JOIN pg_catalog.pg_class AS c ON c.oid = i.indexrelid
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        WHERE n.nspname = %s
+        AND NOT i.indisvalid
+        """
+        try:
+            return [row['index_name'] for row in self.execute_query(query, (schema,))]
+        except Exception as e:
+            self.logger.error(f"Failed to get invalid indexes for schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get invalid indexes: {str(e)}")
+
+    def get_catalog_version(self, schema: str) -> Optional[str]:
+        """Probe pg_class/pg_attribute row versions; any DDL in the schema changes them"""
+        query = """
+        SELECT 
+            count(DISTINCT c.oid) AS relations,
+            count(a.attnum) AS attributes,
+            max(c.xmin::text::bigint) AS class_xmin,
+            max(a.xmin::text::bigint) AS attribute_xmin
+        FROM pg_catalog.pg_class AS c
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        LEFT JOIN pg_catalog.pg_attribute AS a
+            ON a.attrelid = c.oid
+            AND a.attnum > 0
+        WHERE n.nspname = %s
+        """
+        row = self.execute_query(query, (schema,))[0]
+        return (
+            f"{self.config.get('introspection', 'pg_catalog')}:"
+            f"{row['relations']}:{row['attributes']}:{row['class_xmin']}:{row['attribute_xmin']}"
+        )
+
 class MySQLDatabase(BaseDatabase):
     """MySQL implementation"""
     
+    # MySQL commits implicitly around every DDL statement, and trigger
+    # bodies contain semicolons, so statements are sent one at a time
+    TRANSACTIONAL_DDL = False
+    MULTI_STATEMENT = False
+    
     def connect(self) -> bool:
         try:
             import mysql.connector
@@ -415,14 +1284,8 @@ class MySQLDatabase(BaseDatabase):
             
             self.logger.info(f"Connecting to MySQL at {self.config.get('host')}:{self.config.get('port', 3306)}")
             
-            self.connection = mysql.connector.connect(
-                host=self.config.get('host'),
-                port=self.config.get('port', 3306),
-                user=self.config.get('username'),
-                password=self.config.get('password'),
-                database=self.config.get('database'),
-                autocommit=False
-            )
+            self.connection = self._create_connection()
+            self._init_pool()
             self.logger.info("MySQL connection established successfully")
             return True
         except ImportError:
@@ -432,8 +1295,39 @@ class MySQLDatabase(BaseDatabase):
             self.logger.error(f"MySQL connection failed: {str(e)}")
             raise DatabaseError(f"MySQL connection failed: {str(e)}")
     
+    def _create_connection(self):
+        """Open a new mysql-connector connection"""
+        import mysql.connector
+        
+        return mysql.connector.connect(
+            host=self.config.get('host'),
+            port=self.config.get('port', 3306),
+            user=self.config.get('username'),
+            password=self.config.get('password'),
+            database=self.config.get('database'),
+            autocommit=False
+        )
+    
+    def _is_connection_open(self, connection) -> bool:
+        """Check whether a MySQL connection is open"""
+        return connection is not None and connection.is_connected()
+    
+    def _is_lock_timeout(self, error: Exception) -> bool:
+        """ER_LOCK_WAIT_TIMEOUT covers both row and metadata lock waits"""
+        return getattr(error, 'errno', None) == 1205
+    
+    def lock_timeout_statement(self, milliseconds: int) -> Optional[str]:
+        """MySQL metadata lock waits are limited in whole seconds"""
+        return f"SET SESSION lock_wait_timeout = {max(1, -(-int(milliseconds) // 1000))}"
+    
+    def _lock_timeout_restore_statement(self) -> Optional[str]:
+        """Reset lock_wait_timeout to the session's current value"""
+        current = self.execute_query("SELECT @@SESSION.lock_wait_timeout AS lock_wait_timeout")[0]
+        return f"SET SESSION lock_wait_timeout = {int(current['lock_wait_timeout'])}"
+    
     def disconnect(self):
         """Close database connection"""
+        self._close_pool()
         if self.connection and self.connection.is_connected():
             try:
                 self.connection.close()
@@ -444,14 +1338,16 @@ class MySQLDatabase(BaseDatabase):
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
         """Execute a SQL query"""
-        if not self.connection or not self.connection.is_connected():
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
             self.logger.error("Cannot execute query: Not connected to database")
             raise DatabaseError("Not connected to database")
         
         cursor = None
         try:
-            with self.lock:
-                cursor = self.connection.cursor(dictionary=True)
+            with self._connection_lock(connection):
+                cursor = connection.cursor(dictionary=True)
+                self._count('statements')
                 self.logger.debug(f"Executing MySQL query: {query[:100]}...")
                 
                 if params:
@@ -466,15 +1362,16 @@ class MySQLDatabase(BaseDatabase):
                     self.logger.debug(f"Query returned {len(result)} rows")
                     return result
                 else:
-                    self.connection.commit()
+                    self._finish_statement(connection)
                     affected = cursor.rowcount
                     self.logger.debug(f"Query affected {affected} rows")
                     return affected
                     
         except Exception as e:
             self.logger.error(f"MySQL query execution failed: {str(e)}")
-            self.connection.rollback()
-            raise DatabaseError(f"Query execution failed: {str(e)}")
+            self._abort_statement(connection)
+            error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+            raise error_class(f"Query execution failed: {str(e)}")
         finally:
             if cursor:
                 cursor.close()
@@ -487,23 +1384,25 @@ class MySQLDatabase(BaseDatabase):
         
         self.logger.info(f"Executing {len(queries)} MySQL queries in batch")
         
-        with self.lock:
+        connection = self._active_connection()
+        with self._connection_lock(connection):
             cursor = None
             try:
-                cursor = self.connection.cursor()
+                cursor = connection.cursor()
                 for i, query in enumerate(queries, 1):
                     try:
                         self.logger.debug(f"Executing MySQL query {i}/{len(queries)}: {query[:50]}...")
                         cursor.execute(query)
+                        self._count('statements')
                     except Exception as e:
                         self.logger.error(f"Failed to execute MySQL query {i}: {str(e)}")
                         raise DatabaseError(f"Query {i} failed: {str(e)}")
                 
-                self.connection.commit()
+                self._finish_statement(connection)
                 self.logger.info(f"Successfully executed {len(queries)} MySQL queries")
                 
             except Exception as e:
-                self.connection.rollback()
+                self._abort_statement(connection)
                 self.logger.error(f"MySQL batch execution failed: {str(e)}")
                 raise
             finally:
@@ -524,70 +1423,882 @@ class MySQLDatabase(BaseDatabase):
     
     def get_schemas(self, database: str) -> List[str]:
         """Get list of schemas in database"""
-        # In MySQL, schemas are equivalent to databases
-        # We need to switch to the specified database
+        # In MySQL, schemas are equivalent to databases. All metadata queries
+        # and generated DDL use fully qualified names, so there is no need
+        # to switch the connection's default database.
+        query = """
+        SELECT SCHEMA_NAME AS schema_name
+        FROM information_schema.SCHEMATA
+        WHERE SCHEMA_NAME = %s
+        """
         try:
-            self.connection.database = database
-            self.logger.info(f"Switched to MySQL database '{database}'")
-            
-            # Get tables to infer schemas (in MySQL, each database is like a schema)
-            query = "SHOW TABLES"
-            result = self.execute_query(query)
+            result = self.execute_query(query, (database,))
+            if not result:
+                raise DatabaseError(f"Database '{database}' does not exist")
             
-            # Return the database name as the primary schema
-            schemas = [database]
             self.logger.info(f"Using database '{database}' as schema in MySQL")
-            return schemas
+            return [database]
             
         except Exception as e:
-            self.logger.error(f"Failed to switch to MySQL database '{database}': {str(e)}")
-            raise DatabaseError(f"Failed to switch to database '{database}': {str(e)}")
+            self.logger.error(f"Failed to get MySQL schema '{database}': {str(e)}")
+            raise DatabaseError(f"Failed to get schemas for database '{database}': {str(e)}")
     
-    def get_tables(self, schema: str) -> List[Dict[str, Any]]:
-        """Get list of tables in schema"""
+    def _fetch_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read list of tables in schema"""
         # In MySQL, schema is the database name
+        query = """
+        SELECT 
+            TABLE_NAME AS table_name,
+            TABLE_TYPE AS table_type
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME
+        """
         try:
-            self.connection.database = schema
-            query = "SHOW TABLES"
-            result = self.execute_query(query)
-            
-            tables = []
-            for row in result:
-                table_name = list(row.values())[0]  # Get the first column value
-                tables.append({
-                    'name': table_name,
-                    'type': 'BASE TABLE',  # MySQL doesn't distinguish much in SHOW TABLES
-                    'schema': schema
-                })
-            
+            result = self.execute_query(query, (schema,))
+            tables = [
+                {
+                    'name': row['table_name'],
+                    'type': row['table_type'],
+                    'schema': schema
+                }
+                for row in result
+            ]
+            
             self.logger.info(f"Found {len(tables)} tables in MySQL schema '{schema}'")
             return tables
         except Exception as e:
             self.logger.error(f"Failed to get MySQL tables for schema '{schema}': {str(e)}")
             raise DatabaseError(f"Failed to get tables: {str(e)}")
     
-    def get_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
-        """Get columns for a specific table"""
+    def _fetch_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read columns for a specific table"""
+        return self._fetch_schema_columns(schema, [table_name]).get(table_name, [])
+    
+    def _fetch_schema_columns(self, schema: str,
+                              table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read columns and primary key flags for many tables in one query"""
+        query = """
+        SELECT 
+            c.TABLE_NAME AS table_name,
+            c.COLUMN_NAME AS column_name,
+            c.COLUMN_TYPE AS data_type,
+            c.IS_NULLABLE AS is_nullable,
+            c.COLUMN_DEFAULT AS column_default,
+            c.CHARACTER_MAXIMUM_LENGTH AS character_maximum_length,
+            c.NUMERIC_PRECISION AS numeric_precision,
+            c.NUMERIC_SCALE AS numeric_scale,
+            c.ORDINAL_POSITION AS ordinal_position,
+            (s.COLUMN_NAME IS NOT NULL) AS is_primary_key,
+            s.SEQ_IN_INDEX AS primary_key_position,
+            c.EXTRA AS extra
+        FROM information_schema.COLUMNS AS c
+        LEFT JOIN information_schema.STATISTICS AS s
+            ON s.TABLE_SCHEMA = c.TABLE_SCHEMA
+            AND s.TABLE_NAME = c.TABLE_NAME
+            AND s.COLUMN_NAME = c.COLUMN_NAME
+            AND s.INDEX_NAME = 'PRIMARY'
+        WHERE c.TABLE_SCHEMA = %s
+        """
+        params: List[Any] = [schema]
+        if table_names is not None:
+            if not table_names:
+                return {}
+            query += f" AND c.TABLE_NAME IN ({', '.join(['%s'] * len(table_names))})"
+            params.extend(table_names)
+        query += " ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION"
+        
+        try:
+            result = self.execute_query(query, tuple(params))
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for row in result:
+                columns_by_table.setdefault(row['table_name'], []).append({
+                    'column_name': row['column_name'],
+                    'data_type': row['data_type'],
+                    'is_nullable': row['is_nullable'],
+                    'column_default': row['column_default'],
+                    'character_maximum_length': row['character_maximum_length'],
+                    'numeric_precision': row['numeric_precision'],
+                    'numeric_scale': row['numeric_scale'],
+                    'ordinal_position': row['ordinal_position'],
+                    'is_primary_key': bool(row['is_primary_key']),
+                    'primary_key_position': row['primary_key_position'],
+                    'extra': row['extra']
+                })
+            self.logger.info(
+                f"Loaded columns for {len(columns_by_table)} tables in MySQL schema '{schema}' with one query"
+            )
+            return columns_by_table
+        except Exception as e:
+            self.logger.error(f"Failed to get columns for MySQL schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get schema columns: {str(e)}")
+    
+    def _fetch_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read constraints for a specific table"""
+        query = """
+        SELECT 
+            tc.CONSTRAINT_NAME AS constraint_name,
+            tc.CONSTRAINT_TYPE AS constraint_type,
+            k.COLUMN_NAME AS column_name,
+            k.REFERENCED_TABLE_SCHEMA AS foreign_table_schema,
+            k.REFERENCED_TABLE_NAME AS foreign_table_name,
+            k.REFERENCED_COLUMN_NAME AS foreign_column_name
+        FROM information_schema.TABLE_CONSTRAINTS AS tc
+        LEFT JOIN information_schema.KEY_COLUMN_USAGE AS k
+            ON k.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+            AND k.TABLE_NAME = tc.TABLE_NAME
+            AND k.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+        WHERE tc.TABLE_SCHEMA = %s
+        AND tc.TABLE_NAME = %s
+        ORDER BY tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME, k.ORDINAL_POSITION
+        """
+        try:
+            result = self.execute_query(query, (schema, table_name))
+            constraints = [
+                {
+                    'constraint_name': row['constraint_name'],
+                    'constraint_type': row['constraint_type'],
+                    'column_name': row['column_name'],
+                    'foreign_table_schema': row['foreign_table_schema'],
+                    'foreign_table_name': row['foreign_table_name'],
+                    'foreign_column_name': row['foreign_column_name']
+                }
+                for row in result
+            ]
+            self.logger.debug(f"Found {len(constraints)} constraints for MySQL table '{schema}.{table_name}'")
+            return constraints
+        except Exception as e:
+            self.logger.warning(f"Failed to get constraints for MySQL table '{schema}.{table_name}': {str(e)}")
+            return []
+
+    def get_catalog_version(self, schema: str) -> Optional[str]:
+        """
+        Checksum the schema's table, column and primary key definitions
+        
+        Counts and TABLES.CREATE_TIME cannot be used: INSTANT DDL (renamed
+        columns, changed defaults) keeps both, and MySQL 8 caches CREATE_TIME
+        for information_schema_stats_expiry seconds.
+        """
+        query = """
+        SELECT
+            (SELECT COUNT(*) FROM information_schema.TABLES
+             WHERE TABLE_SCHEMA = %s) AS table_count,
+            (SELECT BIT_XOR(CRC32(CONCAT_WS('|', TABLE_NAME, TABLE_TYPE)))
+             FROM information_schema.TABLES
+             WHERE TABLE_SCHEMA = %s) AS table_checksum,
+            (SELECT COUNT(*) FROM information_schema.COLUMNS
+             WHERE TABLE_SCHEMA = %s) AS column_count,
+            (SELECT BIT_XOR(CRC32(CONCAT_WS(
+                '|', TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, ORDINAL_POSITION,
+                IFNULL(COLUMN_DEFAULT, '<null>'), EXTRA
+             )))
+             FROM information_schema.COLUMNS
+             WHERE TABLE_SCHEMA = %s) AS column_checksum,
+            (SELECT BIT_XOR(CRC32(CONCAT_WS('|', TABLE_NAME, COLUMN_NAME, SEQ_IN_INDEX)))
+             FROM information_schema.STATISTICS
+             WHERE TABLE_SCHEMA = %s AND INDEX_NAME = 'PRIMARY') AS key_checksum
+        """
+        row = self.execute_query(query, (schema,) * 5)[0]
+        return (
+            f"{row['table_count']}:{row['table_checksum']}:"
+            f"{row['column_count']}:{row['column_checksum']}:{row['key_checksum']}"
+        )
+
+    def get_server_version(self) -> Optional[int]:
+        """VERSION() as a number (e.g. 100906 for MariaDB 10.9.6), or None when unknown"""
+        if not self._is_connection_open(self._active_connection()):
+            return None
+        version = self.execute_query("SELECT VERSION() AS version")[0]['version']
+        match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
+        if not match:
+            return None
+        major, minor, patch = (int(part) for part in match.groups())
+        return major * 10000 + minor * 100 + patch
+    
+    def get_partitioned_tables(self, schema: str) -> List[str]:
+        """Names of partitioned tables in a schema"""
+        query = """
+        SELECT DISTINCT TABLE_NAME AS table_name
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = %s
+        AND PARTITION_NAME IS NOT NULL
+        ORDER BY TABLE_NAME
+        """
+        try:
+            return [row['table_name'] for row in self.execute_query(query, (schema,))]
+        except Exception as e:
+            self.logger.error(f"Failed to get partitioned tables for MySQL schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get partitioned tables: {str(e)}")
+
+class SQLiteDatabase(BaseDatabase):
+    """SQLite implementation (files or :memory:, no server)"""
+    
+    # SQLite DDL is transactional, but the driver runs one statement per
+    # call and trigger bodies contain semicolons
+    MULTI_STATEMENT = False
+    
+    def connect(self) -> bool:
+        try:
+            path = self.config.get('database') or ':memory:'
+            self.logger.info(f"Opening SQLite database {path}")
+            
+            self.connection = self._create_connection()
+            self._init_pool()
+            self.logger.info("SQLite connection established successfully")
+            return True
+        except Exception as e:
+            self.logger.error(f"SQLite connection failed: {str(e)}")
+            raise DatabaseError(f"SQLite connection failed: {str(e)}")
+    
+    def _create_connection(self):
+        """
+        Open a new sqlite3 connection in autocommit mode
+        
+        Transactions are opened explicitly by begin_transaction(), since
+        the driver's implicit transactions don't cover DDL. A :memory:
+        database is opened as a named shared-cache database so pooled
+        connections see the same tables as the session connection.
+        """
+        import sqlite3
+        
+        path = self.config.get('database') or ':memory:'
+        uri = False
+        if path == ':memory:':
+            path = f"file:hst_memory_{id(self)}?mode=memory&cache=shared"
+            uri = True
+        
+        return sqlite3.connect(
+            path,
+            uri=uri,
+            timeout=self.config.get('timeout', 30),
+            isolation_level=None,
+            check_same_thread=False
+        )
+    
+    def _is_connection_open(self, connection) -> bool:
+        """Check whether a sqlite3 connection is open"""
+        import sqlite3
+        
+        if connection is None:
+            return False
+        try:
+            connection.total_changes
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+    
+    def _is_lock_timeout(self, error: Exception) -> bool:
+        """SQLITE_BUSY/SQLITE_LOCKED: another connection holds the write lock"""
+        return 'locked' in str(error)
+    
+    def lock_timeout_statement(self, milliseconds: int) -> Optional[str]:
+        """SQLite waits for locks up to the busy timeout"""
+        return f"PRAGMA busy_timeout = {int(milliseconds)}"
+    
+    def _lock_timeout_restore_statement(self) -> Optional[str]:
+        """Reset busy_timeout to the connection's current value"""
+        current = self.execute_query("PRAGMA busy_timeout")[0]
+        return f"PRAGMA busy_timeout = {int(next(iter(current.values())))}"
+    
+    def _init_pool(self):
+        """
+        Create the connection pool
+        
+        Connections to a shared-cache :memory: database fail on table locks
+        instead of waiting for them, so that pool holds a single connection.
+        """
+        super()._init_pool()
+        if (self.config.get('database') or ':memory:') == ':memory:':
+            self.pool.max_size = 1
+    
+    def begin_transaction(self):
+        """
+        Begin a new transaction (explicitly, the connection autocommits)
+        
+        Transactions take the write lock up front (waiting up to the busy
+        timeout), rather than failing when a reader later upgrades.
+        """
+        outermost = not self._transaction_stack and self.transaction_mode == 'batch'
+        super().begin_transaction()
+        if outermost:
+            try:
+                self._execute_control("BEGIN IMMEDIATE")
+            except Exception as e:
+                self._transaction_stack.pop()
+                self.logger.error(f"Failed to begin SQLite transaction: {str(e)}")
+                error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+                raise error_class(f"Failed to begin transaction: {str(e)}")
+    
+    def disconnect(self):
+        """Close database connection"""
+        self._close_pool()
+        if self.connection:
+            try:
+                self.connection.close()
+                self.logger.info("SQLite connection closed")
+            except Exception as e:
+                self.logger.warning(f"Error closing SQLite connection: {str(e)}")
+        self.connection = None
+    
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
+        """Execute a SQL query (parameters use the ? placeholder)"""
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
+            self.logger.error("Cannot execute query: Not connected to database")
+            raise DatabaseError("Not connected to database")
+        
+        cursor = None
+        try:
+            with self._connection_lock(connection):
+                cursor = connection.cursor()
+                self._count('statements')
+                self.logger.debug(f"Executing SQLite query: {query[:100]}...")
+                
+                if params:
+                    self.logger.debug(f"Query parameters: {params}")
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                # Statements returning rows (SELECT, PRAGMA, RETURNING) have a description
+                if cursor.description is not None:
+                    names = [column[0] for column in cursor.description]
+                    result = [dict(zip(names, row)) for row in cursor.fetchall()]
+                    self.logger.debug(f"Query returned {len(result)} rows")
+                    return result
+                else:
+                    self._finish_statement(connection)
+                    affected = cursor.rowcount
+                    self.logger.debug(f"Query affected {affected} rows")
+                    return affected
+                    
+        except Exception as e:
+            self.logger.error(f"SQLite query execution failed: {str(e)}")
+            self._abort_statement(connection)
+            error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+            raise error_class(f"Query execution failed: {str(e)}")
+        finally:
+            if cursor:
+                cursor.close()
+    
+    def execute_many(self, queries: List[str]):
+        """Execute multiple SQL queries"""
+        if not queries:
+            self.logger.warning("No queries to execute")
+            return
+        
+        self.logger.info(f"Executing {len(queries)} SQLite queries in batch")
+        
+        with self.transaction():
+            for i, query in enumerate(queries, 1):
+                try:
+                    self.execute_query(query)
+                except Exception as e:
+                    self.logger.error(f"Failed to execute SQLite query {i}: {str(e)}")
+                    raise DatabaseError(f"Query {i} failed: {str(e)}")
+        
+        self.logger.info(f"Successfully executed {len(queries)} SQLite queries")
+    
+    def get_current_user(self) -> str:
+        """SQLite has no users; report the operating system user"""
+        if not self._current_user:
+            import getpass
+            self._current_user = getpass.getuser()
+        return self._current_user
+    
+    def get_databases(self) -> List[str]:
+        """Get list of databases (the opened file)"""
+        return [self.config.get('database') or ':memory:']
+    
+    def get_schemas(self, database: str) -> List[str]:
+        """Get list of schemas: main plus any attached databases"""
+        try:
+            result = self.execute_query("PRAGMA database_list")
+            schemas = [row['name'] for row in result if row['name'] != 'temp']
+            self.logger.info(f"Found {len(schemas)} SQLite schemas")
+            return schemas
+        except Exception as e:
+            self.logger.error(f"Failed to get SQLite schemas: {str(e)}")
+            raise DatabaseError(f"Failed to get schemas for database '{database}': {str(e)}")
+    
+    def _fetch_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read list of tables in schema"""
+        query = f"""
+        SELECT
+            name AS table_name,
+            CASE type WHEN 'view' THEN 'VIEW' ELSE 'BASE TABLE' END AS table_type
+        FROM {schema}.sqlite_master
+        WHERE type IN ('table', 'view')
+        AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+        """
         try:
-            self.connection.database = schema
-            query = f"DESCRIBE `{table_name}`"
             result = self.execute_query(query)
+            tables = [
+                {
+                    'name': row['table_name'],
+                    'type': row['table_type'],
+                    'schema': schema
+                }
+                for row in result
+            ]
             
-            columns = []
+            self.logger.info(f"Found {len(tables)} tables in SQLite schema '{schema}'")
+            return tables
+        except Exception as e:
+            self.logger.error(f"Failed to get SQLite tables for schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get tables: {str(e)}")
+    
+    def _fetch_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read columns for a specific table"""
+        return self._fetch_schema_columns(schema, [table_name]).get(table_name, [])
+    
+    def _fetch_schema_columns(self, schema: str,
+                              table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read columns and primary key flags for many tables in one pragma_table_info join"""
+        query = f"""
+        SELECT
+            m.name AS table_name,
+            p.cid AS cid,
+            p.name AS column_name,
+            p.type AS data_type,
+            p."notnull" AS not_null,
+            p.dflt_value AS column_default,
+            p.pk AS pk
+        FROM {schema}.sqlite_master AS m
+        JOIN pragma_table_info(m.name, ?) AS p
+        WHERE m.type = 'table'
+        AND m.name NOT LIKE 'sqlite_%'
+        """
+        params: List[Any] = [schema]
+        if table_names is not None:
+            if not table_names:
+                return {}
+            query += f" AND m.name IN ({', '.join(['?'] * len(table_names))})"
+            params.extend(table_names)
+        query += " ORDER BY m.name, p.cid"
+        
+        try:
+            result = self.execute_query(query, tuple(params))
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
             for row in result:
-                columns.append({
-                    'column_name': row['Field'],
-                    'data_type': row['Type'],
-                    'is_nullable': 'YES' if row['Null'] == 'YES' else 'NO',
-                    'column_default': row['Default'],
-                    'extra': row['Extra']
+                columns_by_table.setdefault(row['table_name'], []).append({
+                    'column_name': row['column_name'],
+                    'data_type': row['data_type'],
+                    'is_nullable': 'NO' if row['not_null'] else 'YES',
+                    'column_default': row['column_default'],
+                    'character_maximum_length': None,
+                    'numeric_precision': None,
+                    'numeric_scale': None,
+                    'ordinal_position': row['cid'] + 1,
+                    'is_primary_key': row['pk'] > 0,
+                    'primary_key_position': row['pk'] or None
                 })
+            self.logger.info(
+                f"Loaded columns for {len(columns_by_table)} tables in SQLite schema '{schema}' with one query"
+            )
+            return columns_by_table
+        except Exception as e:
+            self.logger.error(f"Failed to get columns for SQLite schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get schema columns: {str(e)}")
+    
+    def _fetch_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read primary and foreign keys (SQLite constraints are unnamed)"""
+        try:
+            primary_key = self.execute_query(
+                "SELECT name, pk FROM pragma_table_info(?, ?) WHERE pk > 0 ORDER BY pk",
+                (table_name, schema)
+            )
+            foreign_keys = self.execute_query(
+                'SELECT id, "table", "from", "to" FROM pragma_foreign_key_list(?, ?) ORDER BY id, seq',
+                (table_name, schema)
+            )
+            constraints = [
+                {
+                    'constraint_name': f"{table_name}_pkey",
+                    'constraint_type': 'PRIMARY KEY',
+                    'column_name': row['name'],
+                    'foreign_table_schema': None,
+                    'foreign_table_name': None,
+                    'foreign_column_name': None
+                }
+                for row in primary_key
+            ]
+            constraints.extend(
+                {
+                    'constraint_name': f"{table_name}_fkey_{row['id']}",
+                    'constraint_type': 'FOREIGN KEY',
+                    'column_name': row['from'],
+                    'foreign_table_schema': schema,
+                    'foreign_table_name': row['table'],
+                    'foreign_column_name': row['to']
+                }
+                for row in foreign_keys
+            )
+            self.logger.debug(f"Found {len(constraints)} constraints for SQLite table '{schema}.{table_name}'")
+            return constraints
+        except Exception as e:
+            self.logger.warning(f"Failed to get constraints for SQLite table '{schema}.{table_name}': {str(e)}")
+            return []
+    
+    def get_catalog_version(self, schema: str) -> Optional[str]:
+        """
+        schema_version (incremented by every schema change) of a database file
+        
+        schema_version alone is not unique: every :memory: database starts
+        from the same value and a recreated file restarts it. In-memory and
+        temporary databases return None; files add their inode and ctime,
+        which writes to the file also move.
+        """
+        files = {row['name']: row['file'] for row in self.execute_query("PRAGMA database_list")}
+        path = files.get(schema)
+        if not path:
+            return None
+        info = os.stat(path)
+        row = self.execute_query(f"PRAGMA {schema}.schema_version")[0]
+        return f"{info.st_dev}:{info.st_ino}:{info.st_ctime_ns}:{row['schema_version']}"
+
+class SQLServerDatabase(BaseDatabase):
+    """SQL Server implementation (pyodbc)"""
+    
+    # CREATE TRIGGER has to be the first statement of its batch, so
+    # statements are sent one at a time
+    MULTI_STATEMENT = False
+    
+    # Base types whose declared length/precision is part of the type name
+    _LENGTH_TYPES = ('char', 'varchar', 'binary', 'varbinary', 'nchar', 'nvarchar')
+    _PRECISION_TYPES = ('decimal', 'numeric')
+    _SCALE_TYPES = ('datetime2', 'datetimeoffset', 'time')
+    
+    def connect(self) -> bool:
+        try:
+            import pyodbc
             
-            self.logger.debug(f"Found {len(columns)} columns for MySQL table '{schema}.{table_name}'")
-            return columns
+            self.logger.info(f"Connecting to SQL Server at {self.config.get('host')}:{self.config.get('port', 1433)}")
+            
+            self.connection = self._create_connection()
+            self._init_pool()
+            self.logger.info("SQL Server connection established successfully")
+            return True
+        except ImportError:
+            self.logger.error("pyodbc module not found. Install with: pip install pyodbc")
+            raise DatabaseError("SQL Server driver not installed")
         except Exception as e:
-            self.logger.error(f"Failed to get columns for MySQL table '{schema}.{table_name}': {str(e)}")
-            raise DatabaseError(f"Failed to get table columns: {str(e)}")
+            self.logger.error(f"SQL Server connection failed: {str(e)}")
+            raise DatabaseError(f"SQL Server connection failed: {str(e)}")
+    
+    def _create_connection(self):
+        """Open a new pyodbc connection (statements run in implicit transactions)"""
+        import pyodbc
+        
+        connection_string = ";".join([
+            f"DRIVER={{{self.config.get('odbc_driver', 'ODBC Driver 18 for SQL Server')}}}",
+            f"SERVER={self.config.get('host')},{self.config.get('port', 1433)}",
+            f"DATABASE={self.config.get('database', 'master')}",
+            f"UID={self.config.get('username')}",
+            f"PWD={self.config.get('password')}",
+            f"Encrypt={'yes' if self.config.get('ssl_enabled') else 'no'}",
+            f"TrustServerCertificate={'yes' if self.config.get('trust_server_certificate', False) else 'no'}"
+        ])
+        return pyodbc.connect(
+            connection_string,
+            autocommit=False,
+            timeout=self.config.get('timeout', 30)
+        )
+    
+    def _is_lock_timeout(self, error: Exception) -> bool:
+        """Error 1222: lock request time out period exceeded"""
+        return '(1222)' in str(error)
+    
+    def lock_timeout_statement(self, milliseconds: int) -> Optional[str]:
+        """Limit lock waits of the session"""
+        return f"SET LOCK_TIMEOUT {int(milliseconds)}"
+    
+    def _lock_timeout_restore_statement(self) -> Optional[str]:
+        """Reset LOCK_TIMEOUT to the session's current value (-1 waits forever)"""
+        current = self.execute_query("SELECT @@LOCK_TIMEOUT AS lock_timeout")[0]
+        return f"SET LOCK_TIMEOUT {int(current['lock_timeout'])}"
+    
+    def _execute_control(self, statement: str):
+        """Run a transaction-control statement, translating savepoint syntax"""
+        if statement.startswith("RELEASE SAVEPOINT"):
+            # Savepoints are released with the transaction
+            return
+        if statement.startswith("ROLLBACK TO SAVEPOINT "):
+            statement = f"ROLLBACK TRANSACTION {statement[len('ROLLBACK TO SAVEPOINT '):]}"
+        elif statement.startswith("SAVEPOINT "):
+            statement = f"SAVE TRANSACTION {statement[len('SAVEPOINT '):]}"
+        super()._execute_control(statement)
+    
+    def disconnect(self):
+        """Close database connection"""
+        self._close_pool()
+        if self.connection and not self.connection.closed:
+            try:
+                self.connection.close()
+                self.logger.info("SQL Server connection closed")
+            except Exception as e:
+                self.logger.warning(f"Error closing SQL Server connection: {str(e)}")
+        self.connection = None
+    
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
+        """Execute a SQL query (parameters use the ? placeholder)"""
+        connection = self._active_connection()
+        if not self._is_connection_open(connection):
+            self.logger.error("Cannot execute query: Not connected to database")
+            raise DatabaseError("Not connected to database")
+        
+        cursor = None
+        try:
+            with self._connection_lock(connection):
+                cursor = connection.cursor()
+                self._count('statements')
+                self.logger.debug(f"Executing SQL Server query: {query[:100]}...")
+                
+                if params:
+                    self.logger.debug(f"Query parameters: {params}")
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                # Statements returning rows have a description
+                if cursor.description is not None:
+                    names = [column[0] for column in cursor.description]
+                    result = [dict(zip(names, row)) for row in cursor.fetchall()]
+                    self.logger.debug(f"Query returned {len(result)} rows")
+                    return result
+                else:
+                    self._finish_statement(connection)
+                    affected = cursor.rowcount
+                    self.logger.debug(f"Query affected {affected} rows")
+                    return affected
+                    
+        except Exception as e:
+            self.logger.error(f"SQL Server query execution failed: {str(e)}")
+            self._abort_statement(connection)
+            error_class = LockTimeoutError if self._is_lock_timeout(e) else DatabaseError
+            raise error_class(f"Query execution failed: {str(e)}")
+        finally:
+            if cursor:
+                cursor.close()
+    
+    def execute_many(self, queries: List[str]):
+        """Execute multiple SQL queries"""
+        if not queries:
+            self.logger.warning("No queries to execute")
+            return
+        
+        self.logger.info(f"Executing {len(queries)} SQL Server queries in batch")
+        
+        with self.transaction():
+            for i, query in enumerate(queries, 1):
+                try:
+                    self.execute_query(query)
+                except Exception as e:
+                    self.logger.error(f"Failed to execute SQL Server query {i}: {str(e)}")
+                    raise DatabaseError(f"Query {i} failed: {str(e)}")
+        
+        self.logger.info(f"Successfully executed {len(queries)} SQL Server queries")
+    
+    def get_databases(self) -> List[str]:
+        """Get list of databases (the one the connection was opened on)"""
+        try:
+            result = self.execute_query("SELECT DB_NAME() AS name")
+            return [row['name'] for row in result]
+        except Exception as e:
+            self.logger.error(f"Failed to get SQL Server database: {str(e)}")
+            raise DatabaseError(f"Failed to get databases: {str(e)}")
+    
+    def get_schemas(self, database: str) -> List[str]:
+        """Get list of user schemas in database"""
+        query = """
+        SELECT s.name AS schema_name
+        FROM sys.schemas AS s
+        WHERE s.principal_id <> 0
+        AND s.schema_id < 16384
+        AND s.name NOT IN ('sys', 'INFORMATION_SCHEMA', 'guest')
+        ORDER BY s.name
+        """
+        try:
+            result = self.execute_query(query)
+            schemas = [row['schema_name'] for row in result]
+            self.logger.info(f"Found {len(schemas)} schemas in SQL Server database '{database}'")
+            return schemas
+        except Exception as e:
+            self.logger.error(f"Failed to get SQL Server schemas: {str(e)}")
+            raise DatabaseError(f"Failed to get schemas for database '{database}': {str(e)}")
+    
+    def _fetch_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read list of tables in schema"""
+        query = """
+        SELECT
+            o.name AS table_name,
+            CASE o.type WHEN 'V' THEN 'VIEW' ELSE 'BASE TABLE' END AS table_type
+        FROM sys.objects AS o
+        JOIN sys.schemas AS s ON s.schema_id = o.schema_id
+        WHERE s.name = ?
+        AND o.type IN ('U', 'V')
+        AND o.is_ms_shipped = 0
+        ORDER BY o.name
+        """
+        try:
+            result = self.execute_query(query, (schema,))
+            tables = [
+                {
+                    'name': row['table_name'],
+                    'type': row['table_type'],
+                    'schema': schema
+                }
+                for row in result
+            ]
+            
+            self.logger.info(f"Found {len(tables)} tables in SQL Server schema '{schema}'")
+            return tables
+        except Exception as e:
+            self.logger.error(f"Failed to get SQL Server tables for schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get tables: {str(e)}")
+    
+    def _fetch_table_columns(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read columns for a specific table"""
+        return self._fetch_schema_columns(schema, [table_name]).get(table_name, [])
+    
+    def _format_type(self, type_name: str, max_length: int, precision: int, scale: int) -> str:
+        """Full column type from sys.columns (e.g. nvarchar(50), decimal(12,2))"""
+        if type_name in ('timestamp', 'rowversion'):
+            # A table holds one rowversion and its values can't be inserted
+            return 'binary(8)'
+        if type_name in self._LENGTH_TYPES:
+            if max_length == -1:
+                return f"{type_name}(max)"
+            length = max_length // 2 if type_name.startswith('n') else max_length
+            return f"{type_name}({length})"
+        if type_name in self._PRECISION_TYPES:
+            return f"{type_name}({precision},{scale})"
+        if type_name in self._SCALE_TYPES:
+            return f"{type_name}({scale})"
+        return type_name
+    
+    def _fetch_schema_columns(self, schema: str,
+                              table_names: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read columns and primary key flags for many tables in one query"""
+        query = """
+        SELECT
+            t.name AS table_name,
+            c.name AS column_name,
+            ty.name AS type_name,
+            c.max_length AS max_length,
+            c.precision AS numeric_precision,
+            c.scale AS numeric_scale,
+            c.is_nullable AS is_nullable,
+            c.column_id AS ordinal_position,
+            OBJECT_DEFINITION(c.default_object_id) AS column_default,
+            CAST(CASE WHEN ic.column_id IS NULL THEN 0 ELSE 1 END AS BIT) AS is_primary_key,
+            ic.key_ordinal AS primary_key_position
+        FROM sys.tables AS t
+        JOIN sys.schemas AS s ON s.schema_id = t.schema_id
+        JOIN sys.columns AS c ON c.object_id = t.object_id
+        JOIN sys.types AS ty ON ty.user_type_id = c.system_type_id AND ty.system_type_id = c.system_type_id
+        LEFT JOIN sys.indexes AS i
+            ON i.object_id = t.object_id
+            AND i.is_primary_key = 1
+        LEFT JOIN sys.index_columns AS ic
+            ON ic.object_id = i.object_id
+            AND ic.index_id = i.index_id
+            AND ic.column_id = c.column_id
+        WHERE s.name = ?
+        """
+        params: List[Any] = [schema]
+        if table_names is not None:
+            if not table_names:
+                return {}
+            query += f" AND t.name IN ({', '.join(['?'] * len(table_names))})"
+            params.extend(table_names)
+        query += " ORDER BY t.name, c.column_id"
+        
+        try:
+            result = self.execute_query(query, tuple(params))
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for row in result:
+                columns_by_table.setdefault(row['table_name'], []).append({
+                    'column_name': row['column_name'],
+                    'data_type': self._format_type(
+                        row['type_name'], row['max_length'], row['numeric_precision'], row['numeric_scale']
+                    ),
+                    'is_nullable': 'YES' if row['is_nullable'] else 'NO',
+                    'column_default': row['column_default'],
+                    'character_maximum_length': row['max_length'] if row['type_name'] in self._LENGTH_TYPES else None,
+                    'numeric_precision': row['numeric_precision'],
+                    'numeric_scale': row['numeric_scale'],
+                    'ordinal_position': row['ordinal_position'],
+                    'is_primary_key': bool(row['is_primary_key']),
+                    'primary_key_position': row['primary_key_position']
+                })
+            self.logger.info(
+                f"Loaded columns for {len(columns_by_table)} tables in SQL Server schema '{schema}' with one query"
+            )
+            return columns_by_table
+        except Exception as e:
+            self.logger.error(f"Failed to get columns for SQL Server schema '{schema}': {str(e)}")
+            raise DatabaseError(f"Failed to get schema columns: {str(e)}")
+    
+    def _fetch_table_constraints(self, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Read constraints for a specific table"""
+        query = """
+        SELECT
+            tc.CONSTRAINT_NAME AS constraint_name,
+            tc.CONSTRAINT_TYPE AS constraint_type,
+            k.COLUMN_NAME AS column_name,
+            fk.TABLE_SCHEMA AS foreign_table_schema,
+            fk.TABLE_NAME AS foreign_table_name,
+            fk.COLUMN_NAME AS foreign_column_name
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc
+        LEFT JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS k
+            ON k.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+            AND k.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+        LEFT JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS AS rc
+            ON rc.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+            AND rc.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+        LEFT JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS fk
+            ON fk.CONSTRAINT_SCHEMA = rc.UNIQUE_CONSTRAINT_SCHEMA
+            AND fk.CONSTRAINT_NAME = rc.UNIQUE_CONSTRAINT_NAME
+            AND fk.ORDINAL_POSITION = k.ORDINAL_POSITION
+        WHERE tc.TABLE_SCHEMA = ?
+        AND tc.TABLE_NAME = ?
+        ORDER BY tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME, k.ORDINAL_POSITION
+        """
+        try:
+            result = self.execute_query(query, (schema, table_name))
+            constraints = [
+                {
+                    'constraint_name': row['constraint_name'],
+                    'constraint_type': row['constraint_type'],
+                    'column_name': row['column_name'],
+                    'foreign_table_schema': row['foreign_table_schema'],
+                    'foreign_table_name': row['foreign_table_name'],
+                    'foreign_column_name': row['foreign_column_name']
+                }
+                for row in result
+            ]
+            self.logger.debug(f"Found {len(constraints)} constraints for SQL Server table '{schema}.{table_name}'")
+            return constraints
+        except Exception as e:
+            self.logger.warning(f"Failed to get constraints for SQL Server table '{schema}.{table_name}': {str(e)}")
+            return []
+    
+    def get_catalog_version(self, schema: str) -> Optional[str]:
+        """Probe object/column counts and the latest modification; DDL in the schema changes them"""
+        query = """
+        SELECT
+            COUNT(*) AS object_count,
+            MAX(o.modify_date) AS last_modified,
+            (SELECT COUNT(*) FROM sys.columns AS c
+             JOIN sys.objects AS co ON co.object_id = c.object_id
+             WHERE co.schema_id = SCHEMA_ID(?)) AS column_count
+        FROM sys.objects AS o
+        WHERE o.schema_id = SCHEMA_ID(?)
+        """
+        row = self.execute_query(query, (schema, schema))[0]
+        return f"{row['object_count']}:{row['column_count']}:{row['last_modified']}"
 
 class DatabaseFactory:
     """Factory for creating database instances"""
@@ -605,6 +2316,12 @@ class DatabaseFactory:
         elif db_type in ['mysql', 'mariadb']:
             logger.debug("Creating MySQLDatabase instance")
             return MySQLDatabase(config, ui)
+        elif db_type == 'sqlite':
+            logger.debug("Creating SQLiteDatabase instance")
+            return SQLiteDatabase(config, ui)
+        elif db_type in ['sqlserver', 'mssql']:
+            logger.debug("Creating SQLServerDatabase instance")
+            return SQLServerDatabase(config, ui)
         # Add other database types here
         else:
             error_msg = f"Unsupported database type: {db_type}"
@@ -3,12 +3,19 @@ Main history table management logic
 """
 
 import json
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Callable, ContextManager, Tuple
 from datetime import datetime
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress
+from .database import BatchExecutionError, LockTimeoutError
 from .trigger_generator import TriggerGenerator
+from config.settings import AppConfig, resolve_app_config, table_config
+from utils.decorators import retry
 from utils.logger import get_logger
 
 class HistoryManager:
@@ -21,6 +28,13 @@ class HistoryManager:
         self.logger = get_logger()
         self.trigger_gen = TriggerGenerator(database)
         self._changes_applied = []
+        # Tables whose history table predates the current apply run; their
+        # indexes are built concurrently afterwards instead of in the DDL
+        self._existing_history = set()
+        # Tables the engine already versions (MariaDB system_versioned mode)
+        self._versioned_tables = set()
+        # Settings resolved per run, keyed by table name (None: no overrides)
+        self._settings = {}
         
     def preview_changes(self):
         """Preview changes without applying"""
@@ -71,22 +85,462 @@ class HistoryManager:
             if self.config.get('app', {}).get('backup_before_changes', True):
                 self._create_backup(selected_tables, schema)
             
-            # Apply changes
-            with self.database.transaction():
-                for table_name in selected_tables:
-                    self._create_history_table(table_name, schema)
-                    self._create_triggers(table_name, schema)
-            
-            self.ui.display_message(
-                f"Successfully created history for {len(selected_tables)} tables",
-                "success"
-            )
+            self.apply_tables(selected_tables, schema)
             
         except Exception as e:
             self.logger.error(f"Apply changes failed: {str(e)}")
             self.ui.display_error(f"Apply changes failed: {str(e)}")
             raise
     
+    def apply_tables(self, tables: List[str], schema: str) -> List[Dict[str, Any]]:
+        """
+        Create history tables and triggers for the given tables without prompting
+        
+        Returns:
+            Per-table results with 'table', 'status', 'duration' and 'error'.
+            Tables applied together in a batch have no duration of their
+            own: 'duration' is None and 'batch_duration'/'batch_size' give
+            the time and size of the whole batch.
+        """
+        # Read column metadata for the whole selection in one catalog round trip
+        columns_by_table = self.database.get_schema_columns(schema, tables)
+        
+        app_config = self.config.get('app', {})
+        workers = int(app_config.get('parallel_workers', 1) or 1)
+        lock_timeout = int(app_config.get('lock_timeout_ms', 0) or 0)
+        started = time.perf_counter()
+        self._settings = {}
+        
+        schema_tables = self.database.get_tables(schema)
+        existing = {table['name'] for table in schema_tables}
+        self._existing_history = {
+            table_name for table_name in tables
+            if self._history_table_name(table_name) in existing
+        }
+        self._versioned_tables = {
+            table['name'] for table in schema_tables if table.get('type') == 'SYSTEM VERSIONED'
+        }
+        
+        shared_statements = self._build_shared_statements(tables, schema)
+        if shared_statements:
+            with self.database.transaction():
+                self.database.execute_script(
+                    [((schema, action), sql) for action, sql in shared_statements]
+                )
+            self._log_statements(schema, '*', shared_statements)
+        
+        with Progress(console=self.ui.console) as progress:
+            task = progress.add_task("[cyan]Applying history...", total=len(tables))
+            advance = lambda: progress.update(task, advance=1)
+            
+            if lock_timeout > 0:
+                if workers > 1:
+                    message = (
+                        f"lock_timeout_ms is set, so parallel_workers={workers} is ignored "
+                        f"and tables are applied one at a time"
+                    )
+                    self.logger.warning(message)
+                    self.ui.display_message(message, "warning")
+                results = self._apply_lock_aware(tables, schema, columns_by_table, lock_timeout, advance)
+            elif workers > 1 and len(tables) > 1:
+                results = self._apply_parallel(tables, schema, columns_by_table, workers, advance)
+            else:
+                results = self._apply_sequential(tables, schema, columns_by_table, advance)
+        
+        self._create_indexes_concurrently(
+            [r['table'] for r in results if r['status'] == 'SUCCESS' and r['table'] in self._existing_history],
+            schema, columns_by_table
+        )
+        self._existing_history = set()
+        self._versioned_tables = set()
+        
+        elapsed = time.perf_counter() - started
+        self.logger.debug(f"Metadata cache stats: {self.database.get_cache_stats()}")
+        self.logger.debug(f"Execution stats: {self.database.get_stats()}")
+        self._display_apply_report(results, elapsed)
+        return results
+    
+    def _apply_sequential(self, tables: List[str], schema: str,
+                          columns_by_table: Dict[str, List[Dict[str, Any]]],
+                          advance: Callable[[], None]) -> List[Dict[str, Any]]:
+        """
+        Apply history to tables in one transaction
+        
+        The DDL of up to pipeline_batch_size tables is submitted together
+        under one savepoint. A failing table is rolled back and reported;
+        the remaining tables still go through and everything commits once.
+        """
+        batch_size = int(self.config.get('app', {}).get('pipeline_batch_size', 50) or 1)
+        results = []
+        with self.database.transaction():
+            if not self.database.supports_savepoints():
+                # A failed batch could not be undone, so go table by table
+                batch_size = 1
+            for start in range(0, len(tables), max(1, batch_size)):
+                batch = tables[start:start + max(1, batch_size)]
+                if len(batch) == 1:
+                    results.append(self._apply_table(
+                        batch[0], schema, columns_by_table.get(batch[0], []),
+                        lambda: self.database.savepoint(f"hst_table_{start + 1}")
+                    ))
+                else:
+                    results.extend(self._apply_batch(batch, schema, columns_by_table, start))
+                for _ in batch:
+                    advance()
+        return results
+    
+    def _apply_batch(self, tables: List[str], schema: str,
+                     columns_by_table: Dict[str, List[Dict[str, Any]]],
+                     offset: int) -> List[Dict[str, Any]]:
+        """
+        Apply history to several tables with their DDL sent in one round trip
+        
+        When a statement fails, the batch is rolled back to its savepoint,
+        the table that statement belongs to is reported as failed and the
+        rest of the batch is resubmitted. Results carry the batch's time
+        and size instead of a per-table duration.
+        """
+        started = time.perf_counter()
+        results = []
+        statements_by_table = {}
+        
+        def batch_result(result: Dict[str, Any], finished: Optional[float] = None) -> Dict[str, Any]:
+            result['duration'] = None
+            result['batch_duration'] = (finished or time.perf_counter()) - started
+            result['batch_size'] = len(tables)
+            return result
+        
+        for table_name in tables:
+            try:
+                statements_by_table[table_name] = self._build_table_statements(
+                    table_name, schema, columns_by_table.get(table_name, [])
+                )
+            except Exception as e:
+                results.append(batch_result(self._table_result(table_name, started, e)))
+        
+        pending = list(statements_by_table)
+        attempt = 0
+        while pending:
+            attempt += 1
+            script = [
+                ((table_name, action), sql)
+                for table_name in pending
+                for action, sql in statements_by_table[table_name]
+            ]
+            try:
+                with self.database.savepoint(f"hst_batch_{offset + 1}_{attempt}"):
+                    self.database.execute_script(script)
+            except BatchExecutionError as e:
+                failed_table, action = e.tag
+                self.logger.error(
+                    f"Failed to apply history to {schema}.{failed_table} ({action}): {str(e)}"
+                )
+                results.append(batch_result(self._table_result(failed_table, started, e)))
+                pending.remove(failed_table)
+                continue
+            except Exception as e:
+                self.logger.error(f"Failed to apply history batch in {schema}: {str(e)}")
+                results.extend(batch_result(self._table_result(t, started, e)) for t in pending)
+                break
+            
+            finished = time.perf_counter()
+            for table_name in pending:
+                self._log_statements(schema, table_name, statements_by_table[table_name])
+                self.database.invalidate_metadata(schema, table_name)
+                results.append(batch_result({
+                    'table': table_name,
+                    'status': 'SUCCESS',
+                    'error': None
+                }, finished))
+            break
+        
+        return results
+    
+    def _apply_parallel(self, tables: List[str], schema: str,
+                        columns_by_table: Dict[str, List[Dict[str, Any]]], workers: int,
+                        advance: Callable[[], None]) -> List[Dict[str, Any]]:
+        """Apply history to tables concurrently, one connection and transaction per table"""
+        pool_size = self.database.get_pool_stats().get('max_size', workers)
+        if workers > pool_size:
+            self.logger.warning(
+                f"parallel_workers={workers} exceeds pool_size={pool_size}; using {pool_size} workers"
+            )
+            workers = pool_size
+        
+        self.logger.info(f"Applying history to {len(tables)} tables with {workers} workers")
+        results = []
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apply") as executor:
+            futures = [
+                executor.submit(
+                    self._apply_table, table_name, schema,
+                    columns_by_table.get(table_name, []),
+                    self._pooled_transaction
+                )
+                for table_name in tables
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+                advance()
+        
+        return results
+    
+    def _apply_lock_aware(self, tables: List[str], schema: str,
+                          columns_by_table: Dict[str, List[Dict[str, Any]]], lock_timeout: int,
+                          advance: Callable[[], None]) -> List[Dict[str, Any]]:
+        """
+        Apply history table by table without queueing behind long transactions
+        
+        Each table runs in its own short transaction with lock_timeout set,
+        so locks on hot tables are released as soon as its DDL is done.
+        A table whose lock cannot be acquired is retried with jittered
+        backoff; if it is still contended it moves to the end of the queue.
+        The session's lock timeout is restored after every attempt.
+        
+        Results also carry 'attempts', 'attempt_durations' (every attempt,
+        including the one that got the lock) and 'lock_wait' (time spent in
+        attempts that timed out).
+        """
+        app_config = self.config.get('app', {})
+        attempt_lock = retry(
+            max_attempts=int(app_config.get('lock_retries', 3)),
+            delay=float(app_config.get('lock_retry_delay', 0.5)),
+            backoff=2.0,
+            exceptions=(LockTimeoutError,),
+            jitter=0.5
+        )
+        max_deferrals = int(app_config.get('lock_max_deferrals', 2))
+        
+        queue = deque((table_name, 0) for table_name in tables)
+        started = {}
+        lock_waits = {table_name: 0.0 for table_name in tables}
+        attempts = {table_name: [] for table_name in tables}
+        results = []
+        
+        while queue:
+            table_name, deferrals = queue.popleft()
+            started.setdefault(table_name, time.perf_counter())
+            
+            @attempt_lock
+            def apply_with_lock_timeout(statements):
+                attempt_started = time.perf_counter()
+                script = [((table_name, action), sql) for action, sql in statements]
+                try:
+                    with self.database.lock_timeout(lock_timeout):
+                        with self.database.transaction():
+                            self.database.execute_script(script)
+                except LockTimeoutError:
+                    lock_waits[table_name] += time.perf_counter() - attempt_started
+                    raise
+                finally:
+                    attempts[table_name].append(time.perf_counter() - attempt_started)
+            
+            try:
+                statements = self._build_table_statements(
+                    table_name, schema, columns_by_table.get(table_name, [])
+                )
+                apply_with_lock_timeout(statements)
+            except LockTimeoutError as e:
+                if deferrals < max_deferrals:
+                    self.logger.warning(
+                        f"{schema}.{table_name} is still locked, moving it to the end of the queue"
+                    )
+                    queue.append((table_name, deferrals + 1))
+                    continue
+                self.logger.error(f"Gave up waiting for locks on {schema}.{table_name}: {str(e)}")
+                result = self._table_result(table_name, started[table_name], e)
+            except Exception as e:
+                self.logger.error(f"Failed to apply history to {schema}.{table_name}: {str(e)}")
+                result = self._table_result(table_name, started[table_name], e)
+            else:
+                self._log_statements(schema, table_name, statements)
+                self.database.invalidate_metadata(schema, table_name)
+                result = {
+                    'table': table_name,
+                    'status': 'SUCCESS',
+                    'duration': time.perf_counter() - started[table_name],
+                    'error': None
+                }
+            
+            result['attempts'] = len(attempts[table_name])
+            result['attempt_durations'] = attempts[table_name]
+            result['lock_wait'] = lock_waits[table_name]
+            results.append(result)
+            advance()
+        
+        return results
+    
+    @contextmanager
+    def _pooled_transaction(self):
+        """Own transaction on a pooled connection bound to the current thread"""
+        with self.database.pooled_connection():
+            with self.database.transaction():
+                yield
+    
+    def _apply_table(self, table_name: str, schema: str, columns: List[Dict[str, Any]],
+                     scope: Callable[[], ContextManager]) -> Dict[str, Any]:
+        """
+        Apply history to one table inside the given transactional scope
+        
+        Args:
+            table_name: Table to apply history to
+            schema: Schema of the table
+            columns: Column metadata of the table
+            scope: Factory for the context manager the DDL runs in
+        """
+        started = time.perf_counter()
+        try:
+            statements = self._build_table_statements(table_name, schema, columns)
+            with scope():
+                self.database.execute_script(
+                    [((table_name, action), sql) for action, sql in statements]
+                )
+            self._log_statements(schema, table_name, statements)
+            self.database.invalidate_metadata(schema, table_name)
+            return {
+                'table': table_name,
+                'status': 'SUCCESS',
+                'duration': time.perf_counter() - started,
+                'error': None
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to apply history to {schema}.{table_name}: {str(e)}")
+            return self._table_result(table_name, started, e)
+    
+    def _create_indexes_concurrently(self, tables: List[str], schema: str,
+                                     columns_by_table: Dict[str, List[Dict[str, Any]]]):
+        """
+        Add missing indexes to history tables that already held data
+        
+        Each index is built with CREATE INDEX CONCURRENTLY in its own
+        autocommit statement so captured writes are never blocked. An
+        interrupted concurrent build leaves an invalid index behind; it is
+        dropped before building, since IF NOT EXISTS would skip it, and
+        right after a failed build. Partitioned tables do not support
+        concurrent builds and get a regular CREATE INDEX.
+        """
+        if not tables:
+            return
+        
+        partitioned = set(self.database.get_partitioned_tables(schema))
+        invalid = set(self.database.get_invalid_indexes(schema))
+        
+        for table_name in tables:
+            config = self._table_settings(table_name)
+            concurrently = self._history_table_name(table_name) not in partitioned
+            key_columns = self._key_columns(schema, table_name, columns_by_table.get(table_name, []))
+            indexes = self.trigger_gen.generate_index_ddl(
+                schema, table_name, key_columns, config, concurrently=concurrently
+            )
+            built = 0
+            for index_name, query in indexes.items():
+                if index_name in invalid:
+                    self.logger.warning(f"Rebuilding invalid index {schema}.{index_name}")
+                    if not self._drop_invalid_index(schema, index_name):
+                        continue
+                try:
+                    if concurrently:
+                        self.database.execute_autocommit(query)
+                    else:
+                        self.database.execute_query(query)
+                    built += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to build {schema}.{index_name}: {str(e)}")
+                    if concurrently:
+                        self._drop_invalid_index(schema, index_name)
+            if built:
+                self._log_change(schema, table_name, "CREATE_INDEXES")
+    
+    def _drop_invalid_index(self, schema: str, index_name: str) -> bool:
+        """Drop an index left invalid by a concurrent build; False if it could not be dropped"""
+        query = self.trigger_gen.generate_drop_index_ddl(schema, index_name)
+        if not query:
+            return True
+        try:
+            self.database.execute_autocommit(query)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not drop invalid index {schema}.{index_name}: {str(e)}")
+            return False
+    
+    def _history_table_name(self, table_name: str) -> str:
+        """Name of a table's history table under its (possibly overridden) suffix"""
+        return f"{table_name}{self._table_settings(table_name).history_suffix}"
+    
+    def _table_settings(self, table_name: str) -> AppConfig:
+        """
+        Resolved settings of a table, built once per run
+        
+        Tables without app.tables overrides share one AppConfig.
+        """
+        app_config = self.config.get('app', {})
+        key = table_name if table_name in (app_config.get('tables') or {}) else None
+        settings = self._settings.get(key)
+        if settings is None:
+            settings = self._settings[key] = resolve_app_config(table_config(app_config, table_name))
+        return settings
+    
+    def _key_columns(self, schema: str, table_name: str, columns: List[Dict[str, Any]]) -> List[str]:
+        """Primary key of a table in key order, from the positions read with its columns"""
+        key_columns = [col for col in columns if col.get('is_primary_key')]
+        key_columns.sort(key=lambda col: col.get('primary_key_position') or col['ordinal_position'])
+        return [col['column_name'] for col in key_columns]
+    
+    def _table_result(self, table_name: str, started: float, error: Exception) -> Dict[str, Any]:
+        """Result entry for a table that failed"""
+        return {
+            'table': table_name,
+            'status': 'FAILED',
+            'duration': time.perf_counter() - started,
+            'error': str(error)
+        }
+    
+    def _display_apply_report(self, results: List[Dict[str, Any]], elapsed: float):
+        """Display per-table outcome and aggregate throughput of an apply run"""
+        failed = [r for r in results if r['status'] != 'SUCCESS']
+        succeeded = len(results) - len(failed)
+        throughput = len(results) / elapsed if elapsed > 0 else 0.0
+        
+        table = Table(title="Apply Results", show_lines=True)
+        table.add_column("Table", style="cyan")
+        table.add_column("Status")
+        table.add_column("Duration", style="yellow")
+        table.add_column("Error", style="white")
+        for result in sorted(results, key=lambda r: (r['status'] == 'SUCCESS', r['table'])):
+            status = "[green]SUCCESS[/green]" if result['status'] == 'SUCCESS' else f"[red]{result['status']}[/red]"
+            table.add_row(result['table'], status, self._format_duration(result), result.get('error') or "")
+        self.ui.console.print(table)
+        
+        lock_aware = [r for r in results if 'attempt_durations' in r]
+        if lock_aware:
+            table = Table(title="Lock Waits", show_lines=True)
+            table.add_column("Table", style="cyan")
+            table.add_column("Attempts", style="yellow")
+            table.add_column("Attempt Durations", style="white")
+            table.add_column("Lock Wait", style="white")
+            for result in sorted(lock_aware, key=lambda r: (-r['lock_wait'], r['table'])):
+                table.add_row(
+                    result['table'],
+                    str(result['attempts']),
+                    ", ".join(f"{duration:.2f}s" for duration in result['attempt_durations']) or "-",
+                    f"{result['lock_wait']:.2f}s"
+                )
+            self.ui.console.print(table)
+        
+        summary = (
+            f"Created history for {succeeded}/{len(results)} tables in {elapsed:.1f}s "
+            f"({throughput:.1f} tables/s)"
+        )
+        self.logger.info(f"{summary}; pool stats: {self.database.get_pool_stats()}")
+        self.ui.display_message(summary, "warning" if failed else "success")
+    
+    @staticmethod
+    def _format_duration(result: Dict[str, Any]) -> str:
+        """Duration of a table result, or of its batch when it was applied in one"""
+        if result.get('duration') is None:
+            return f"{result['batch_duration']:.2f}s (batch of {result['batch_size']})"
+        return f"{result['duration']:.2f}s"
+    
     def rollback_changes(self):
         """Rollback applied changes"""
         try:
@@ -115,7 +569,11 @@ class HistoryManager:
             
             self.ui.console.print(table)
             
-            if self.ui.confirm_action("Rollback all changes?", default=False):
+            if self.ui.confirm_action(
+                "Rollback all changes? History tables are kept; system versioning "
+                "added in this session is dropped with its history",
+                default=False
+            ):
                 # Execute rollback queries
                 self._execute_rollback()
                 
@@ -123,43 +581,135 @@ class HistoryManager:
             self.logger.error(f"Rollback failed: {str(e)}")
             self.ui.display_error(f"Rollback failed: {str(e)}")
     
-    def _create_history_table(self, table_name: str, schema: str):
-        """Create history table for given table"""
-        app_config = self.config.get('app', {})
+    def maintain_partitions(self):
+        """Pre-create upcoming partitions for the history tables of the current schema"""
+        try:
+            schema = self.ui.current_schema
+            created = self.precreate_partitions(schema)
 
-        columns = self.database.get_table_columns(schema, table_name)
+            if not created:
+                self.ui.display_message("No partitioned history tables found in selected schema")
+                return
 
-        # 1. Create sequence FIRST
-        sequence_query = self.trigger_gen.generate_sequence_ddl(
-            schema, table_name, app_config
-        )
-        self.database.execute_query(sequence_query)
+            self.ui.display_message(
+                f"Pre-created partitions for {len(created)} history tables", "success"
+            )
 
-        self._log_change(schema, table_name, "CREATE_SEQUENCE")
+        except Exception as e:
+            self.logger.error(f"Partition maintenance failed: {str(e)}")
+            self.ui.display_error(f"Partition maintenance failed: {str(e)}")
 
-        # 2. Create table
-        table_query = self.trigger_gen.generate_history_table_ddl(
-            schema, table_name, columns, app_config
-        )
-        self.database.execute_query(table_query)
+    def precreate_partitions(self, schema: str, periods: Optional[int] = None) -> List[str]:
+        """
+        Create partitions for the upcoming periods of every partitioned history table
+
+        All partitions are created in one transaction and one round trip.
+        Meant to be run on a schedule (e.g. daily from cron) so inserts
+        never fall through to the default partition.
+
+        Args:
+            schema: Schema holding the history tables
+            periods: Periods to cover from today (default: partition_premake + 1)
+
+        Returns:
+            Names of the history tables that were maintained
+        """
+        self._settings = {}
+        app_config = resolve_app_config(self.config.get('app', {}))
+        suffix = app_config.history_suffix
+
+        statements = []
+        for table_name in self.database.get_partitioned_tables(schema):
+            if table_name.endswith(suffix):
+                config = self._table_settings(table_name[:-len(suffix)])
+            elif table_name == app_config.audit_table:
+                config = app_config
+            else:
+                continue
+
+            if (config.partition_by or 'none') == 'none':
+                self.logger.warning(f"Skipping {schema}.{table_name}: partition_by is 'none'")
+                continue
+
+            statements.append((
+                (schema, table_name),
+                self.trigger_gen.generate_partition_ddl(schema, table_name, config, count=periods)
+            ))
+
+        if statements:
+            with self.database.transaction():
+                self.database.execute_script(statements)
+            self.logger.info(f"Pre-created partitions for {len(statements)} tables in {schema}")
 
-        self._log_change(schema, table_name, "CREATE_HISTORY_TABLE")
+        return [table_name for (_, table_name), _ in statements]
+
+    def _build_shared_statements(self, tables: List[str], schema: str) -> List[Tuple[str, str]]:
+        """DDL shared by the selected tables (e.g. a consolidated audit table), once each"""
+        statements = []
+        # Tables sharing settings share their DDL, so generate it per distinct settings
+        distinct = {id(settings): settings for settings in map(self._table_settings, tables)}
+        for settings in distinct.values():
+            for query in self.trigger_gen.generate_shared_ddl(schema, settings):
+                if ("CREATE_SHARED_OBJECTS", query) not in statements:
+                    statements.append(("CREATE_SHARED_OBJECTS", query))
+        return statements
     
-    def _create_triggers(self, table_name: str, schema: str):
-        """Create triggers for history table"""
-        app_config = self.config.get('app', {})
+    def _build_table_statements(self, table_name: str, schema: str,
+                                columns: Optional[List[Dict[str, Any]]] = None) -> List[Tuple[str, str]]:
+        """
+        Generate all DDL for one table, in execution order
+        
+        Returns:
+            (action, sql) pairs; the action is what gets logged as applied
+        """
+        app_config = self._table_settings(table_name)
+        
+        if columns is None:
+            columns = self.database.get_table_columns(schema, table_name)
         
-        # Generate trigger queries
-        queries = self.trigger_gen.generate_trigger_ddl(
+        statements = []
+        
+        # 1. Create sequence FIRST
+        sequence_query = self.trigger_gen.generate_sequence_ddl(
             schema, table_name, app_config
         )
+        if sequence_query:
+            statements.append(("CREATE_SEQUENCE", sequence_query))
+        
+        # 2. Create table (none when history goes to a shared table or the
+        #    engine already versions the table). Added system versioning is
+        #    logged under its own action: rollback drops only what it added.
+        table_query = None
+        table_action = "CREATE_HISTORY_TABLE"
+        if app_config.capture_mode == 'system_versioned':
+            partitioned = (app_config.partition_by or 'none') != 'none'
+            table_action = "ADD_PARTITIONED_SYSTEM_VERSIONING" if partitioned else "ADD_SYSTEM_VERSIONING"
+        if not (app_config.capture_mode == 'system_versioned' and table_name in self._versioned_tables):
+            table_query = self.trigger_gen.generate_history_table_ddl(
+                schema, table_name, columns, app_config
+            )
+        if table_query:
+            statements.append((table_action, table_query))
         
-        # Execute queries
-        for query in queries:
-            self.database.execute_query(query)
+        # 3. Index new history tables with the rest of their DDL (existing
+        #    ones are indexed concurrently after the run)
+        if table_name not in self._existing_history:
+            indexes = self.trigger_gen.generate_index_ddl(
+                schema, table_name, self._key_columns(schema, table_name, columns), app_config
+            )
+            for query in indexes.values():
+                statements.append(("CREATE_INDEXES", query))
         
-        # Log change
-        self._log_change(schema, table_name, "CREATE_TRIGGERS")
+        # 4. Create trigger function and triggers
+        for query in self.trigger_gen.generate_trigger_ddl(schema, table_name, app_config, columns):
+            statements.append(("CREATE_TRIGGERS", query))
+        
+        return statements
+    
+    def _log_statements(self, schema: str, table_name: str, statements: List[Tuple[str, str]]):
+        """Log each applied action of a table once"""
+        for action in dict.fromkeys(action for action, _ in statements):
+            self._log_change(schema, table_name, action)
     
     def _display_preview(self, tables: List[str], schema: str):
         """Display preview of changes"""
@@ -169,9 +719,20 @@ class HistoryManager:
             f"[bold cyan]Previewing history tables for {len(tables)} table(s) in schema '{schema}'[/bold cyan]\n"
         )
         
+        columns_by_table = self.database.get_schema_columns(schema, tables)
+        self._settings = {}
+        
+        # Objects shared by all tables, shown once
+        for action, query in self._build_shared_statements(tables, schema):
+            self.ui.console.print(Panel(
+                query,
+                title="[bold]Shared Objects[/bold]",
+                border_style="green"
+            ))
+        
         for idx, table_name in enumerate(tables, 1):
             # Generate preview SQL
-            columns = self.database.get_table_columns(schema, table_name)
+            columns = columns_by_table.get(table_name, [])
             
             self.ui.console.print(
                 f"[bold yellow]Table {idx}/{len(tables)}: {schema}.{table_name}[/bold yellow]"
@@ -180,7 +741,7 @@ class HistoryManager:
             # Show original table info
             self.ui.console.print(f"[dim]Original table has {len(columns)} columns[/dim]")
             
-            app_config = self.config.get('app', {})
+            app_config = self._table_settings(table_name)
 
             # Get sequence DDL (safe access via generator)
             try:
@@ -196,9 +757,14 @@ class HistoryManager:
                 schema, table_name, columns, app_config
             )
             
+            # Get index DDL
+            index_ddl = self.trigger_gen.generate_index_ddl(
+                schema, table_name, self._key_columns(schema, table_name, columns), app_config
+            )
+            
             # Get trigger DDL
             trigger_ddl = self.trigger_gen.generate_trigger_ddl(
-                schema, table_name, app_config
+                schema, table_name, app_config, columns
             )
 
             # Display sequence FIRST (only if available)
@@ -210,11 +776,20 @@ class HistoryManager:
                 ))
             
             # Display history table DDL
-            self.ui.console.print(Panel(
-                history_table_ddl,
-                title=f"[bold]History Table: {table_name}[/bold]",
-                border_style="cyan"
-            ))
+            if history_table_ddl:
+                self.ui.console.print(Panel(
+                    history_table_ddl,
+                    title=f"[bold]History Table: {table_name}[/bold]",
+                    border_style="cyan"
+                ))
+            
+            # Display indexes
+            if index_ddl:
+                self.ui.console.print(Panel(
+                    "\n\n".join(index_ddl.values()),
+                    title=f"[bold]History Indexes: {table_name}[/bold]",
+                    border_style="blue"
+                ))
             
             # Display triggers
             for i, trigger in enumerate(trigger_ddl, 1):
@@ -259,11 +834,47 @@ class HistoryManager:
             self.ui.display_error(f"Failed to save backup: {str(e)}")
     
     def _execute_rollback(self):
-        """Execute rollback of applied changes"""
+        """
+        Remove history capture from the tables changed in this session
+        
+        Tables are rolled back newest first, each in its own transaction.
+        Triggers and trigger functions are dropped while history tables are
+        kept; system versioning added in this session is dropped along with
+        its history.
+        """
         try:
-            # This should contain the logic to rollback changes
-            # For now, we'll just show a message
-            self.ui.display_message("Rollback functionality will be implemented in the next version", "warning")
+            self._settings = {}
+            tables = {}
+            for change in reversed(self._changes_applied):
+                if change['table'] != '*':
+                    tables.setdefault((change['schema'], change['table']), []).append(change['action'])
+            rolled_back = set()
+            for (schema, table_name), actions in tables.items():
+                statements = self.trigger_gen.generate_rollback_ddl(
+                    schema, table_name, self._table_settings(table_name), actions
+                )
+                try:
+                    with self.database.transaction():
+                        self.database.execute_script(
+                            [((schema, table_name), sql) for sql in statements]
+                        )
+                except Exception as e:
+                    self.logger.error(f"Rollback of {schema}.{table_name} failed: {str(e)}")
+                    continue
+                self.database.invalidate_metadata(schema, table_name)
+                rolled_back.add((schema, table_name))
+                self.logger.info(f"Rolled back history capture on {schema}.{table_name}")
+            
+            # Failed tables stay listed so the rollback can be retried
+            self._changes_applied = [
+                change for change in self._changes_applied
+                if change['table'] != '*' and (change['schema'], change['table']) not in rolled_back
+            ]
+            failed = len(tables) - len(rolled_back)
+            self.ui.display_message(
+                f"Rolled back {len(rolled_back)}/{len(tables)} table(s)",
+                "warning" if failed else "success"
+            )
         except Exception as e:
             self.logger.error(f"Rollback execution failed: {str(e)}")
             raise
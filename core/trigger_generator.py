@@ -2,107 +2,484 @@
 Database-specific trigger generation
 """
 
-from typing import List, Dict, Any
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional, Tuple, Union
 from abc import ABC, abstractmethod
+from config.settings import AppConfig, resolve_app_config
+from utils.logger import get_logger
+
+PARTITION_GRANULARITIES = ('day', 'week', 'month')
+
+# Generators accept app settings as a dict or as an AppConfig resolved once
+# per table with resolve_app_config()
+ConfigLike = Union[AppConfig, Dict[str, Any]]
+
+def sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal, doubling embedded quotes"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def partition_ranges(granularity: str, start: date, count: int) -> List[Tuple[date, date]]:
+    """
+    Consecutive [from, to) ranges covering count periods from the one containing start
+    
+    Weeks start on Monday and months on the 1st.
+    """
+    if granularity not in PARTITION_GRANULARITIES:
+        raise ValueError(f"Unsupported partition granularity '{granularity}'")
+
+    if granularity == 'week':
+        start = start - timedelta(days=start.weekday())
+    elif granularity == 'month':
+        start = start.replace(day=1)
+
+    ranges = []
+    for _ in range(count):
+        if granularity == 'day':
+            end = start + timedelta(days=1)
+        elif granularity == 'week':
+            end = start + timedelta(days=7)
+        else:
+            end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        ranges.append((start, end))
+        start = end
+    return ranges
 
 class BaseTriggerGenerator(ABC):
     """Abstract base class for trigger generation"""
     
     def __init__(self, database):
         self.database = database
+        self.logger = get_logger(f"trigger_generator.{self.__class__.__name__}")
     
     @abstractmethod
     def generate_history_table_ddl(self, schema: str, table_name: str, 
                                    columns: List[Dict[str, Any]], 
-                                   config: Dict[str, Any]) -> str:
+                                   config: ConfigLike) -> str:
         """Generate history table DDL"""
         pass
     
     @abstractmethod
     def generate_trigger_ddl(self, schema: str, table_name: str, 
-                             config: Dict[str, Any]) -> List[str]:
-        """Generate trigger DDL"""
+                             config: ConfigLike,
+                             columns: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """Generate trigger DDL (columns are looked up when not supplied)"""
         pass
     
     @abstractmethod
     def generate_backup_ddl(self, schema: str, table_name: str) -> str:
         """Generate backup DDL"""
         pass
+    
+    @abstractmethod
+    def generate_rollback_ddl(self, schema: str, table_name: str, config: ConfigLike,
+                              actions: Optional[List[str]] = None) -> List[str]:
+        """Generate DDL removing history capture (actions: what this session applied to the table)"""
+        pass
+    
+    def generate_shared_ddl(self, schema: str, config: ConfigLike) -> List[str]:
+        """Generate DDL shared by all tables of a run (nothing by default)"""
+        return []
+    
+    def generate_index_ddl(self, schema: str, table_name: str, key_columns: List[str],
+                           config: ConfigLike, concurrently: bool = False) -> Dict[str, str]:
+        """Generate history table indexes keyed by index name (none by default)"""
+        return {}
+    
+    def generate_drop_index_ddl(self, schema: str, index_name: str) -> Optional[str]:
+        """Generate DDL dropping an invalid index (None without concurrent builds)"""
+        return None
+    
+    def tracked_columns(self, schema: str, table_name: str, columns: List[Dict[str, Any]],
+                        config: ConfigLike) -> List[Dict[str, Any]]:
+        """
+        Columns recorded in history after include_columns/exclude_columns
+        
+        Primary key columns are always kept so history rows can be matched
+        to their source rows. Names missing from the table fail it when
+        they come from its app.tables override; global lists apply to every
+        table, so their missing names are skipped.
+        """
+        config = resolve_app_config(config)
+        include = config.include_columns or []
+        exclude = config.exclude_columns or []
+        if not include and not exclude:
+            return columns
+        
+        known = {col['column_name'] for col in columns}
+        overrides = (config.tables or {}).get(table_name) or {}
+        unknown = [
+            name for name in [*(overrides.get('include_columns') or []), *(overrides.get('exclude_columns') or [])]
+            if name not in known
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown columns in include/exclude lists for {schema}.{table_name}: {', '.join(unknown)}"
+            )
+        skipped = [name for name in [*include, *exclude] if name not in known]
+        if skipped:
+            self.logger.debug(
+                f"Skipping include/exclude columns absent from {schema}.{table_name}: {', '.join(skipped)}"
+            )
+            include = [name for name in include if name in known]
+            exclude = [name for name in exclude if name in known]
+        
+        return [
+            col for col in columns
+            if col.get('is_primary_key')
+            or ((not include or col['column_name'] in include) and col['column_name'] not in exclude)
+        ]
 
 class PostgreSQLTriggerGenerator(BaseTriggerGenerator):
     """PostgreSQL-specific trigger generator"""
+    
+    # Capture modes: 'row' fires once per changed row, 'statement' once per
+    # UPDATE/DELETE statement and copies the OLD transition table in bulk
+    CAPTURE_MODES = ('row', 'statement')
+
+    # Row trigger timing: BEFORE triggers run inline as each row is
+    # changed; AFTER row triggers are queued in memory and fired at the
+    # end of the statement (statement capture is always AFTER)
+    TRIGGER_TIMINGS = ('before', 'after')
+    
+    # Storage modes: 'full' stores the whole OLD row, 'delta' the primary
+    # key plus a jsonb object of the pre-update values of changed columns
+    STORAGE_MODES = ('full', 'delta')
+    
+    # History layouts: 'per_table' creates a _hst table per base table,
+    # 'consolidated' routes every table into one partitioned audit table
+    LAYOUTS = ('per_table', 'consolidated')
+
+    # Index on the history timestamp: BRIN stays tiny on append-only
+    # history, B-tree suits tables whose rows arrive out of time order
+    TIMESTAMP_INDEXES = ('brin', 'btree', 'none')
+
+    # hist_id sources: a per-table sequence, an identity column, or no
+    # surrogate key (rows are found by source key and timestamp)
+    HIST_ID_STRATEGIES = ('sequence', 'identity', 'none')
+
+    # Storage parameters for history tables. History is insert-only, so
+    # pages are packed full, vacuum is driven by inserts (keeping the
+    # visibility map current for index-only scans) and rows are frozen on
+    # the first pass instead of by a later anti-wraparound vacuum.
+    STORAGE_PROFILES = {
+        'default': {},
+        'append_only': {
+            'fillfactor': 100,
+            'autovacuum_vacuum_insert_scale_factor': 0.0,
+            'autovacuum_vacuum_insert_threshold': 100000,
+            'autovacuum_freeze_min_age': 0,
+        },
+    }
 
-    def generate_sequence_ddl(self, schema: str, table_name: str, config: Dict[str, Any]) -> str:
-        suffix = config.get('history_suffix', '_hst')
+    # Minimum server_version_num of storage parameters newer than PostgreSQL 12
+    STORAGE_OPTION_VERSIONS = {
+        'autovacuum_vacuum_insert_scale_factor': 130000,
+        'autovacuum_vacuum_insert_threshold': 130000,
+    }
+
+    # attcompression codes of the supported TOAST compression methods
+    TOAST_COMPRESSION = {'pglz': 'p', 'lz4': 'l'}
+
+    # IS DISTINCT FROM needs an equality operator; values of types without
+    # one are compared as jsonb (json) or in their text form
+    COMPARE_CASTS = {'json': 'jsonb', 'xml': 'text', 'point': 'text', 'path': 'text', 'polygon': 'text'}
+
+    def generate_sequence_ddl(self, schema: str, table_name: str, config: ConfigLike) -> Optional[str]:
+        config = resolve_app_config(config)
+        if self._layout(schema, table_name, config) == 'consolidated':
+            return None
+        if self._hist_id_strategy(schema, table_name, config) != 'sequence':
+            return None
+
+        suffix = config.history_suffix
         history_table = f"{table_name}{suffix}"
         sequence_name = f"{history_table}_hist_id_seq"
         
-        return f"CREATE SEQUENCE IF NOT EXISTS {schema}.{sequence_name};"
+        return f"CREATE SEQUENCE IF NOT EXISTS {schema}.{sequence_name}{self._cache_clause(config)};"
 
     def generate_history_table_ddl(self, schema: str, table_name: str, 
                                 columns: List[Dict[str, Any]], 
-                                config: Dict[str, Any]) -> str:
-
+                                config: ConfigLike) -> Optional[str]:
+        config = resolve_app_config(config)
         if not columns:
             raise ValueError(f"No columns found for table {schema}.{table_name}")
 
-        suffix = config.get('history_suffix', '_hst')
+        if self._layout(schema, table_name, config) == 'consolidated':
+            return None
+
+        suffix = config.history_suffix
         history_table = f"{table_name}{suffix}"
         sequence_name = f"{history_table}_hist_id_seq"
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        delta = self._storage_mode(schema, table_name, config) == 'delta'
 
         column_defs = []
 
-        # hist_id
-        column_defs.append(
-            f"hist_id BIGINT PRIMARY KEY DEFAULT nextval('{schema}.{sequence_name}')"
-        )
+        partition_by = self._partition_by(schema, table_name, config)
+        timestamp_column = config.timestamp_column
+        hist_id_strategy = self._hist_id_strategy(schema, table_name, config)
 
-        # original columns
-        for col in columns:
-            col_def = f"{col['column_name']} {col['data_type']}"
-            if col.get('is_nullable') == 'NO':
-                col_def += " NOT NULL"
-            column_defs.append(col_def)
+        if delta and (hist_id_strategy == 'none' or self._cache_clause(config)):
+            # Versions of a key are ordered by hist_id, which per-session
+            # caches (or a missing hist_id) would break
+            raise ValueError(
+                f"storage_mode 'delta' requires an uncached hist_id ({schema}.{table_name})"
+            )
+
+        # hist_id (the partition key has to be part of the primary key)
+        hist_id_key = "NOT NULL" if partition_by else "PRIMARY KEY"
+        if hist_id_strategy == 'sequence':
+            column_defs.append(
+                f"hist_id BIGINT {hist_id_key} DEFAULT nextval('{schema}.{sequence_name}')"
+            )
+        elif hist_id_strategy == 'identity':
+            cache = self._cache_clause(config).strip()
+            column_defs.append(
+                f"hist_id BIGINT {hist_id_key} GENERATED ALWAYS AS IDENTITY{f' ({cache})' if cache else ''}"
+            )
+
+        # original columns (only the key in delta mode, changes go to jsonb)
+        if delta:
+            key_columns = self._delta_key_columns(schema, table_name, tracked)
+            tracked = [col for col in tracked if col['column_name'] in key_columns]
+        column_defs.extend(
+            f"{col['column_name']} {col['data_type']} NOT NULL" if col.get('is_nullable') == 'NO'
+            else f"{col['column_name']} {col['data_type']}"
+            for col in tracked
+        )
+        if delta:
+            column_defs.append(f"{config.changes_column} JSONB NOT NULL")
 
         # metadata columns
         column_defs.append(
-            f"{config.get('timestamp_column', 'history_timestamp')} TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+            f"{timestamp_column} TIMESTAMP {'NOT NULL ' if partition_by else ''}DEFAULT CURRENT_TIMESTAMP"
         )
         column_defs.append(
-            f"{config.get('operation_column', 'history_operation')} VARCHAR(10)"
+            f"{config.operation_column} VARCHAR(10)"
         )
         column_defs.append(
-            f"{config.get('user_column', 'history_user')} VARCHAR(100)"
+            f"{config.user_column} VARCHAR(100)"
         )
+        if partition_by and hist_id_strategy != 'none':
+            column_defs.append(f"PRIMARY KEY (hist_id, {timestamp_column})")
 
         column_list = ",\n    ".join(column_defs)
+        partition_clause = f" PARTITION BY RANGE ({timestamp_column})" if partition_by else ""
+        storage_clause = self._storage_clause(schema, table_name, config, partitioned=bool(partition_by))
 
-        return f"""
+        ddl = f"""
 CREATE TABLE IF NOT EXISTS {schema}.{history_table} (
     {column_list}
-);
+){partition_clause}{storage_clause};
 
 COMMENT ON TABLE {schema}.{history_table} 
 IS 'History table for {schema}.{table_name}';
         """.strip()
+
+        if partition_by:
+            ddl += f"""
+
+CREATE TABLE IF NOT EXISTS {schema}.{history_table}_default
+PARTITION OF {schema}.{history_table} DEFAULT{self._storage_clause(schema, table_name, config)};
+
+{self.generate_partition_ddl(schema, history_table, config)}"""
+
+        compression_ddl = self._compression_ddl(schema, history_table, config)
+        if compression_ddl:
+            ddl += f"\n\n{compression_ddl}"
+
+        if delta:
+            # Versions are rebuilt by walking one key's entries newest first
+            ddl += f"""
+
+CREATE INDEX IF NOT EXISTS {history_table}_key_idx
+ON {schema}.{history_table} ({", ".join(key_columns)}, hist_id);"""
+
+        return ddl
     
-    def generate_trigger_ddl(self, schema: str, table_name: str, 
-                            config: Dict[str, Any]) -> List[str]:
+    def generate_index_ddl(self, schema: str, table_name: str, key_columns: List[str],
+                           config: ConfigLike, concurrently: bool = False) -> Dict[str, str]:
+        """
+        Indexes for history lookups by time and by source row
+        
+        timestamp_index picks the method for the timestamp index; key_index
+        adds a B-tree on (primary key, timestamp) serving "history of row X"
+        queries. Delta tables already carry a key index of their own.
         
-        suffix = config.get('history_suffix', '_hst')
+        Args:
+            key_columns: Primary key of the source table (no key index without one)
+            concurrently: Build without blocking writes (existing, non-partitioned tables)
+        """
+        config = resolve_app_config(config)
+        if self._layout(schema, table_name, config) == 'consolidated':
+            return {}
+
+        history_table = f"{table_name}{config.history_suffix}"
+        timestamp_column = config.timestamp_column
+        timestamp_index = config.timestamp_index
+        if timestamp_index not in self.TIMESTAMP_INDEXES:
+            raise ValueError(f"Unsupported timestamp_index '{timestamp_index}' for {schema}.{table_name}")
+
+        create = "CREATE INDEX CONCURRENTLY IF NOT EXISTS" if concurrently else "CREATE INDEX IF NOT EXISTS"
+        tablespace = config.history_tablespace
+        tablespace_clause = f" TABLESPACE {tablespace}" if tablespace else ""
+        indexes = {}
+
+        if timestamp_index != 'none':
+            name = f"idx_{history_table}_timestamp"
+            indexes[name] = (
+                f"{create} {name}\n"
+                f"ON {schema}.{history_table} USING {timestamp_index} ({timestamp_column}){tablespace_clause};"
+            )
+
+        delta = self._storage_mode(schema, table_name, config) == 'delta'
+        if config.key_index and key_columns and not delta:
+            name = f"idx_{history_table}_key"
+            indexes[name] = (
+                f"{create} {name}\n"
+                f"ON {schema}.{history_table} ({', '.join(key_columns)}, {timestamp_column}){tablespace_clause};"
+            )
+
+        return indexes
+    
+    def generate_drop_index_ddl(self, schema: str, index_name: str) -> Optional[str]:
+        """Drop an index without blocking writes to its table"""
+        return f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{index_name};"
+    
+    def generate_trigger_ddl(self, schema: str, table_name: str, 
+                            config: ConfigLike,
+                            columns: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        config = resolve_app_config(config)
+        suffix = config.history_suffix
         history_table = f"{table_name}{suffix}"
+        capture_mode = config.capture_mode
 
-        columns = self.database.get_table_columns(schema, table_name)
+        if capture_mode not in self.CAPTURE_MODES:
+            raise ValueError(f"Unsupported capture_mode '{capture_mode}' for {schema}.{table_name}")
 
-        column_names = [col['column_name'] for col in columns]
+        if columns is None:
+            columns = self.database.get_table_columns(schema, table_name)
+
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        column_names = [col['column_name'] for col in tracked]
+        # Only narrow the UPDATE event when some columns are not tracked
+        update_of = column_names if len(tracked) < len(columns) else []
+
+        storage_mode = self._storage_mode(schema, table_name, config)
+        consolidated = self._layout(schema, table_name, config) == 'consolidated'
+
+        if consolidated and (capture_mode != 'row' or storage_mode != 'full'):
+            raise ValueError(
+                f"history_layout 'consolidated' requires capture_mode 'row' and "
+                f"storage_mode 'full' ({schema}.{table_name})"
+            )
+
+        if capture_mode == 'statement':
+            if storage_mode == 'delta':
+                raise ValueError(
+                    f"storage_mode 'delta' requires capture_mode 'row' ({schema}.{table_name})"
+                )
+            return self._generate_statement_trigger_ddl(
+                schema, table_name, history_table, tracked, update_of, config
+            )
 
+        extra_ddl = []
+        function_call = f"{schema}.{table_name}_history_trigger()"
+        if consolidated:
+            # Untracked columns are passed to the shared function to strip
+            untracked = [col['column_name'] for col in columns if col['column_name'] not in column_names]
+            audit_schema, audit_table = self._audit_table(schema, config)
+            function_call = (
+                f"{audit_schema}.{audit_table}_trigger"
+                f"({', '.join(sql_literal(col) for col in untracked)})"
+            )
+            trigger_function = None
+        elif storage_mode == 'delta':
+            key_columns = self._delta_key_columns(schema, table_name, tracked)
+            trigger_function = self._delta_trigger_function(
+                schema, table_name, history_table, column_names, key_columns, columns, config
+            )
+            extra_ddl.append(self._delta_version_function(
+                schema, table_name, history_table, key_columns, config
+            ))
+        else:
+            trigger_function = self._full_row_trigger_function(
+                schema, table_name, history_table, column_names, config
+            )
+
+        update_event = f"UPDATE OF {', '.join(update_of)}" if update_of else "UPDATE"
+        timing = self._trigger_timing(schema, table_name, config).upper()
+
+        if config.skip_unchanged_updates:
+            if update_of or self._needs_compare_cast(tracked):
+                changed = (
+                    f"{self._comparison_row('OLD', tracked)} IS DISTINCT FROM "
+                    f"{self._comparison_row('NEW', tracked)}"
+                )
+            else:
+                changed = "OLD.* IS DISTINCT FROM NEW.*"
+            # WHEN can't reference NEW on a DELETE trigger, so split by event
+            create_triggers = [
+                f"""
+CREATE TRIGGER {table_name}_history_update
+{timing} {update_event} ON {schema}.{table_name}
+FOR EACH ROW
+WHEN ({changed})
+EXECUTE FUNCTION {function_call};
+                """.strip(),
+                f"""
+CREATE TRIGGER {table_name}_history_delete
+{timing} DELETE ON {schema}.{table_name}
+FOR EACH ROW
+EXECUTE FUNCTION {function_call};
+                """.strip()
+            ]
+        else:
+            create_triggers = [f"""
+CREATE TRIGGER {table_name}_history_trigger
+{timing} {update_event} OR DELETE ON {schema}.{table_name}
+FOR EACH ROW
+EXECUTE FUNCTION {function_call};
+            """.strip()]
+        
+        return [
+            self._drop_triggers_ddl(schema, table_name),
+            *([trigger_function] if trigger_function else []),
+            *create_triggers,
+            *extra_ddl
+        ]
+    
+    def _compare_cast(self, col: Dict[str, Any]) -> Optional[str]:
+        """Type a column is cast to before IS DISTINCT FROM (None if it has equality)"""
+        data_type = col['data_type'].lower()
+        if data_type.endswith('[]'):
+            return 'text' if data_type[:-2] in self.COMPARE_CASTS else None
+        return self.COMPARE_CASTS.get(data_type)
+    
+    def _needs_compare_cast(self, columns: List[Dict[str, Any]]) -> bool:
+        """Whether a whole-row comparison would hit a type without equality"""
+        return any(self._compare_cast(col) for col in columns)
+    
+    def _comparable(self, alias: str, col: Dict[str, Any]) -> str:
+        """Column reference usable with IS DISTINCT FROM"""
+        cast = self._compare_cast(col)
+        reference = f"{alias}.{col['column_name']}"
+        return f"{reference}::{cast}" if cast else reference
+    
+    def _comparison_row(self, alias: str, columns: List[Dict[str, Any]]) -> str:
+        """ROW(...) of the columns for comparing old and new versions"""
+        return f"ROW({', '.join(self._comparable(alias, col) for col in columns)})"
+    
+    def _full_row_trigger_function(self, schema: str, table_name: str, history_table: str,
+                                   column_names: List[str], config: AppConfig) -> str:
+        """Row trigger function copying the whole OLD row"""
         base_columns = ", ".join(column_names)
 
         history_columns = (
-            f"hist_id, {base_columns}, "
-            f"{config.get('timestamp_column', 'history_timestamp')}, "
-            f"{config.get('operation_column', 'history_operation')}, "
-            f"{config.get('user_column', 'history_user')}"
+            f"{base_columns}, "
+            f"{config.timestamp_column}, "
+            f"{config.operation_column}, "
+            f"{config.user_column}"
         )
 
         select_columns_old = ", ".join([f"OLD.{col}" for col in column_names])
@@ -114,7 +491,6 @@ BEGIN
     IF (TG_OP = 'DELETE') THEN
         INSERT INTO {schema}.{history_table} ({history_columns})
         VALUES (
-            DEFAULT,
             {select_columns_old},
             CURRENT_TIMESTAMP,
             'DELETE',
@@ -125,7 +501,6 @@ BEGIN
     ELSIF (TG_OP = 'UPDATE') THEN
         INSERT INTO {schema}.{history_table} ({history_columns})
         VALUES (
-            DEFAULT,
             {select_columns_old},
             CURRENT_TIMESTAMP,
             'UPDATE',
@@ -139,20 +514,1132 @@ END;
 $$ LANGUAGE plpgsql;
         """
 
+        return trigger_function.strip()
+    
+    def _partition_by(self, schema: str, table_name: str, config: AppConfig) -> Optional[str]:
+        """Validated partition_by setting (None when history isn't partitioned)"""
+        partition_by = config.partition_by or 'none'
+        if partition_by == 'none':
+            return None
+        if partition_by not in PARTITION_GRANULARITIES:
+            raise ValueError(f"Unsupported partition_by '{partition_by}' for {schema}.{table_name}")
+        return partition_by
+    
+    def generate_partition_ddl(self, schema: str, history_table: str, config: ConfigLike,
+                               start: Optional[date] = None, count: Optional[int] = None) -> str:
+        """
+        Create the partitions of a history table for upcoming periods
+        
+        Generated as one DO block that does nothing unless the table is
+        actually partitioned, so it is safe to run against history tables
+        created before partitioning was enabled.
+        """
+        config = resolve_app_config(config)
+        partition_by = self._partition_by(schema, history_table, config) or 'month'
+        count = count if count is not None else int(config.partition_premake) + 1
+        ranges = partition_ranges(partition_by, start or date.today(), count)
 
-        create_trigger = f"""
-CREATE TRIGGER {table_name}_history_trigger
-BEFORE UPDATE OR DELETE ON {schema}.{table_name}
-FOR EACH ROW
+        storage_clause = self._storage_clause(schema, history_table, config)
+        partitions = "\n".join(
+            f"""        CREATE TABLE IF NOT EXISTS {schema}.{history_table}_p{lower:%Y%m%d}
+        PARTITION OF {schema}.{history_table}
+        FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}'){storage_clause};"""
+            for lower, upper in ranges
+        )
+
+        return f"""
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_catalog.pg_partitioned_table
+        WHERE partrelid = '{schema}.{history_table}'::regclass
+    ) THEN
+{partitions}
+    END IF;
+END $$;
+        """.strip()
+    
+    def _storage_clause(self, schema: str, table_name: str, config: AppConfig,
+                        partitioned: bool = False) -> str:
+        """
+        WITH (...) and TABLESPACE clauses of a history table or partition
+        
+        The storage_profile preset is merged with storage_options; options
+        the connected server is too old for are left out. Partitioned
+        parents take no storage parameters, only a default tablespace
+        for their partitions.
+        """
+        profile = config.storage_profile
+        if profile not in self.STORAGE_PROFILES:
+            raise ValueError(f"Unsupported storage_profile '{profile}' for {schema}.{table_name}")
+
+        clause = ""
+        if not partitioned:
+            options = {**self.STORAGE_PROFILES[profile], **(config.storage_options or {})}
+            server_version = self.database.get_server_version() if self.database else None
+            if server_version:
+                options = {
+                    name: value for name, value in options.items()
+                    if self.STORAGE_OPTION_VERSIONS.get(name, 0) <= server_version
+                }
+            if options:
+                clause += " WITH (" + ", ".join(f"{name} = {value}" for name, value in options.items()) + ")"
+
+        tablespace = config.history_tablespace
+        if tablespace:
+            clause += f" TABLESPACE {tablespace}"
+        return clause
+    
+    def _compression_ddl(self, schema: str, history_table: str, config: AppConfig) -> Optional[str]:
+        """
+        Switch the TOAST-able columns of a history table to toast_compression
+        
+        Skipped on servers before PostgreSQL 14 and on builds without the
+        method (lz4 is a compile-time option); columns already using it are
+        left alone so re-applying takes no locks.
+        """
+        method = config.toast_compression
+        if not method:
+            return None
+        if method not in self.TOAST_COMPRESSION:
+            raise ValueError(f"Unsupported toast_compression '{method}' for {schema}.{history_table}")
+
+        return f"""
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    IF current_setting('server_version_num')::INT >= 140000 THEN
+        FOR col IN
+            SELECT attname FROM pg_catalog.pg_attribute
+            WHERE attrelid = '{schema}.{history_table}'::regclass
+            AND attnum > 0 AND NOT attisdropped
+            AND attstorage <> 'p'
+            AND attcompression IS DISTINCT FROM '{self.TOAST_COMPRESSION[method]}'
+        LOOP
+            EXECUTE format(
+                'ALTER TABLE {schema}.{history_table} ALTER COLUMN %I SET COMPRESSION {method}',
+                col.attname
+            );
+        END LOOP;
+    END IF;
+EXCEPTION WHEN feature_not_supported THEN
+    RAISE NOTICE 'toast_compression {method} is not supported by this server';
+END $$;
+        """.strip()
+    
+    def _layout(self, schema: str, table_name: str, config: AppConfig) -> str:
+        """Validated history_layout setting"""
+        layout = config.history_layout
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unsupported history_layout '{layout}' for {schema}.{table_name}")
+        return layout
+    
+    def _audit_table(self, schema: str, config: AppConfig):
+        """(schema, table) of the consolidated audit table"""
+        return config.audit_schema or schema, config.audit_table
+    
+    def generate_shared_ddl(self, schema: str, config: ConfigLike) -> List[str]:
+        """
+        Consolidated layout: the audit table and its shared trigger function
+        
+        The audit table is range partitioned on the timestamp column with a
+        default partition catching every row until finer partitions exist.
+        The function stores to_jsonb(OLD) tagged with TG_TABLE_SCHEMA and
+        TG_TABLE_NAME, minus any columns passed as trigger arguments.
+        """
+        config = resolve_app_config(config)
+        if config.history_layout != 'consolidated':
+            return []
+
+        audit_schema, audit_table = self._audit_table(schema, config)
+        timestamp_column = config.timestamp_column
+        operation_column = config.operation_column
+        user_column = config.user_column
+
+        audit_table_ddl = f"""
+CREATE SEQUENCE IF NOT EXISTS {audit_schema}.{audit_table}_hist_id_seq{self._cache_clause(config)};
+
+CREATE TABLE IF NOT EXISTS {audit_schema}.{audit_table} (
+    hist_id BIGINT NOT NULL DEFAULT nextval('{audit_schema}.{audit_table}_hist_id_seq'),
+    table_schema TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    row_data JSONB NOT NULL,
+    {timestamp_column} TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    {operation_column} VARCHAR(10),
+    {user_column} VARCHAR(100),
+    PRIMARY KEY (hist_id, {timestamp_column})
+) PARTITION BY RANGE ({timestamp_column}){self._storage_clause(audit_schema, audit_table, config, partitioned=True)};
+
+CREATE TABLE IF NOT EXISTS {audit_schema}.{audit_table}_default
+PARTITION OF {audit_schema}.{audit_table} DEFAULT{self._storage_clause(audit_schema, audit_table, config)};
+
+COMMENT ON TABLE {audit_schema}.{audit_table}
+IS 'Consolidated history table';
+        """
+
+        shared_function = f"""
+CREATE OR REPLACE FUNCTION {audit_schema}.{audit_table}_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+    old_data JSONB := to_jsonb(OLD);
+BEGIN
+    IF (TG_NARGS > 0) THEN
+        old_data := old_data - TG_ARGV;
+    END IF;
+
+    INSERT INTO {audit_schema}.{audit_table}
+        (table_schema, table_name, row_data, {timestamp_column}, {operation_column}, {user_column})
+    VALUES (TG_TABLE_SCHEMA, TG_TABLE_NAME, old_data, CURRENT_TIMESTAMP, TG_OP, CURRENT_USER);
+
+    IF (TG_OP = 'DELETE') THEN
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+        """
+
+        statements = [audit_table_ddl.strip(), shared_function.strip()]
+        compression_ddl = self._compression_ddl(audit_schema, audit_table, config)
+        if compression_ddl:
+            statements.insert(1, compression_ddl)
+        if self._partition_by(audit_schema, audit_table, config):
+            statements.append(self.generate_partition_ddl(audit_schema, audit_table, config))
+        return statements
+    
+    def _trigger_timing(self, schema: str, table_name: str, config: AppConfig) -> str:
+        """Validated trigger_timing setting"""
+        timing = config.trigger_timing
+        if timing not in self.TRIGGER_TIMINGS:
+            raise ValueError(f"Unsupported trigger_timing '{timing}' for {schema}.{table_name}")
+        return timing
+    
+    def _hist_id_strategy(self, schema: str, table_name: str, config: AppConfig) -> str:
+        """Validated hist_id_strategy setting"""
+        strategy = config.hist_id_strategy
+        if strategy not in self.HIST_ID_STRATEGIES:
+            raise ValueError(f"Unsupported hist_id_strategy '{strategy}' for {schema}.{table_name}")
+        return strategy
+    
+    def _cache_clause(self, config: AppConfig) -> str:
+        """CACHE option for hist_id values preallocated per session (empty when 1)"""
+        cache = int(config.sequence_cache or 1)
+        return f" CACHE {cache}" if cache > 1 else ""
+    
+    def _storage_mode(self, schema: str, table_name: str, config: AppConfig) -> str:
+        """Validated storage_mode setting"""
+        storage_mode = config.storage_mode
+        if storage_mode not in self.STORAGE_MODES:
+            raise ValueError(f"Unsupported storage_mode '{storage_mode}' for {schema}.{table_name}")
+        return storage_mode
+    
+    def _delta_key_columns(self, schema: str, table_name: str,
+                           columns: List[Dict[str, Any]]) -> List[str]:
+        """Primary key columns identifying a row in delta mode"""
+        key_columns = [col['column_name'] for col in columns if col.get('is_primary_key')]
+        if not key_columns:
+            raise ValueError(
+                f"storage_mode 'delta' requires a primary key on {schema}.{table_name}"
+            )
+        return key_columns
+    
+    def _delta_trigger_function(self, schema: str, table_name: str, history_table: str,
+                                column_names: List[str], key_columns: List[str],
+                                columns: List[Dict[str, Any]], config: AppConfig) -> str:
+        """
+        Row trigger function storing only changed columns
+        
+        UPDATE records the pre-update values of the tracked columns that
+        changed (nothing at all if none did); DELETE records the whole
+        tracked OLD row so the last version can still be rebuilt.
+        """
+        changes_column = config.changes_column
+        history_columns = (
+            f"{', '.join(key_columns)}, {changes_column}, "
+            f"{config.timestamp_column}, "
+            f"{config.operation_column}, "
+            f"{config.user_column}"
+        )
+        old_keys = ", ".join(f"OLD.{col}" for col in key_columns)
+
+        untracked = [col['column_name'] for col in columns if col['column_name'] not in column_names]
+        old_row = "to_jsonb(OLD)"
+        if untracked:
+            old_row += f" - ARRAY[{', '.join(sql_literal(col) for col in untracked)}]::TEXT[]"
+
+        tracked = [col for col in columns if col['column_name'] in column_names]
+        changed_checks = "\n".join(
+            f"""        IF {self._comparable('OLD', col)} IS DISTINCT FROM {self._comparable('NEW', col)} THEN
+            changes := changes || jsonb_build_object({sql_literal(col['column_name'])}, OLD.{col['column_name']});
+        END IF;"""
+            for col in tracked
+        )
+
+        return f"""
+CREATE OR REPLACE FUNCTION {schema}.{table_name}_history_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+    changes JSONB := '{{}}'::JSONB;
+BEGIN
+    IF (TG_OP = 'DELETE') THEN
+        INSERT INTO {schema}.{history_table} ({history_columns})
+        VALUES ({old_keys}, {old_row}, CURRENT_TIMESTAMP, 'DELETE', CURRENT_USER);
+        RETURN OLD;
+
+    ELSIF (TG_OP = 'UPDATE') THEN
+{changed_checks}
+
+        IF changes <> '{{}}'::JSONB THEN
+            INSERT INTO {schema}.{history_table} ({history_columns})
+            VALUES ({old_keys}, changes, CURRENT_TIMESTAMP, 'UPDATE', CURRENT_USER);
+        END IF;
+        RETURN NEW;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+        """.strip()
+    
+    def _delta_version_function(self, schema: str, table_name: str, history_table: str,
+                                key_columns: List[str], config: AppConfig) -> str:
+        """
+        Function rebuilding the row version a delta history entry replaced
+        
+        Starting from the current row (or the row recorded by its DELETE),
+        the pre-update values of every later entry for the same key are
+        applied newest first. Use jsonb_populate_record(NULL::<table>, ...)
+        to get a typed row back.
+        """
+        changes_column = config.changes_column
+        key_match_base = " AND ".join(f"b.{col} = target.{col}" for col in key_columns)
+        key_match_hist = " AND ".join(f"h.{col} = target.{col}" for col in key_columns)
+
+        return f"""
+CREATE OR REPLACE FUNCTION {schema}.{history_table}_version(p_hist_id BIGINT)
+RETURNS JSONB AS $$
+DECLARE
+    target {schema}.{history_table}%ROWTYPE;
+    version JSONB;
+    entry JSONB;
+BEGIN
+    SELECT * INTO target FROM {schema}.{history_table} WHERE hist_id = p_hist_id;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT to_jsonb(b) INTO version
+    FROM {schema}.{table_name} AS b
+    WHERE {key_match_base};
+
+    FOR entry IN
+        SELECT h.{changes_column}
+        FROM {schema}.{history_table} AS h
+        WHERE {key_match_hist}
+        AND h.hist_id >= p_hist_id
+        ORDER BY h.hist_id DESC
+    LOOP
+        version := COALESCE(version, '{{}}'::JSONB) || entry;
+    END LOOP;
+
+    RETURN version;
+END;
+$$ LANGUAGE plpgsql STABLE;
+        """.strip()
+    
+    def _generate_statement_trigger_ddl(self, schema: str, table_name: str, history_table: str,
+                                        columns: List[Dict[str, Any]], update_of: List[str],
+                                        config: AppConfig) -> List[str]:
+        """
+        Statement-level triggers writing history with one INSERT ... SELECT
+        
+        Transition tables can't be declared on a trigger with more than one
+        event or with UPDATE OF, so UPDATE and DELETE get separate triggers
+        sharing a function, and a column-scoped UPDATE filters out rows
+        whose tracked columns didn't change instead.
+        """
+        column_names = [col['column_name'] for col in columns]
+        key_columns = [col['column_name'] for col in columns if col.get('is_primary_key')]
+        base_columns = ", ".join(column_names)
+
+        history_columns = (
+            f"{base_columns}, "
+            f"{config.timestamp_column}, "
+            f"{config.operation_column}, "
+            f"{config.user_column}"
+        )
+
+        # Statement triggers can't have WHEN; unchanged rows are filtered by
+        # matching old and new rows on the primary key instead
+        skip_unchanged = bool(config.skip_unchanged_updates or update_of)
+        if skip_unchanged and not key_columns:
+            setting = "skip_unchanged_updates" if config.skip_unchanged_updates else "include/exclude columns"
+            raise ValueError(
+                f"capture_mode 'statement' with {setting} requires a primary key on {schema}.{table_name}"
+            )
+        old_columns = ", ".join(f"o.{col}" for col in column_names)
+
+        def insert_old_rows(indent: str) -> str:
+            return (
+                f"{indent}INSERT INTO {schema}.{history_table} ({history_columns})\n"
+                f"{indent}SELECT {old_columns}, CURRENT_TIMESTAMP, TG_OP, CURRENT_USER\n"
+                f"{indent}FROM old_rows AS o"
+            )
+
+        if skip_unchanged:
+            key_match = " AND ".join(f"n.{col} = o.{col}" for col in key_columns)
+            if update_of or self._needs_compare_cast(columns):
+                unchanged = (
+                    f"{self._comparison_row('n', columns)} IS NOT DISTINCT FROM "
+                    f"{self._comparison_row('o', columns)}"
+                )
+            else:
+                unchanged = "n IS NOT DISTINCT FROM o"
+            # new_rows only exists for UPDATE, so the DELETE path is separate
+            capture = f"""
+    IF (TG_OP = 'UPDATE') THEN
+{insert_old_rows('        ')}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM new_rows AS n
+            WHERE {key_match}
+            AND {unchanged}
+        );
+    ELSE
+{insert_old_rows('        ')};
+    END IF;"""
+            update_referencing = "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+        else:
+            capture = f"\n{insert_old_rows('    ')};"
+            update_referencing = "REFERENCING OLD TABLE AS old_rows"
+
+        trigger_function = f"""
+CREATE OR REPLACE FUNCTION {schema}.{table_name}_history_trigger()
+RETURNS TRIGGER AS $$
+BEGIN{capture}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+        """
+
+        create_triggers = [
+            f"""
+CREATE TRIGGER {table_name}_history_{event.lower()}
+AFTER {event} ON {schema}.{table_name}
+{referencing}
+FOR EACH STATEMENT
 EXECUTE FUNCTION {schema}.{table_name}_history_trigger();
+            """.strip()
+            for event, referencing in (
+                ('UPDATE', update_referencing),
+                ('DELETE', "REFERENCING OLD TABLE AS old_rows")
+            )
+        ]
+
+        return [
+            self._drop_triggers_ddl(schema, table_name),
+            trigger_function.strip(),
+            *create_triggers
+        ]
+    
+    def _drop_triggers_ddl(self, schema: str, table_name: str) -> str:
         """
+        Drop history triggers already on the table (from any capture mode)
         
-        return [trigger_function.strip(), create_trigger.strip()]
+        Only triggers that exist are dropped, so tables without them don't
+        take the ACCESS EXCLUSIVE lock DROP TRIGGER needs.
+        """
+        names = ", ".join(
+            f"'{table_name}_history_{suffix}'" for suffix in ('trigger', 'update', 'delete')
+        )
+
+        return f"""
+DO $$
+DECLARE
+    old_trigger TEXT;
+BEGIN
+    FOR old_trigger IN
+        SELECT tgname FROM pg_catalog.pg_trigger
+        WHERE tgrelid = '{schema}.{table_name}'::regclass
+        AND tgname = ANY(ARRAY[{names}])
+    LOOP
+        EXECUTE format('DROP TRIGGER %I ON {schema}.{table_name}', old_trigger);
+    END LOOP;
+END $$;
+        """.strip()
+    
+    def generate_rollback_ddl(self, schema: str, table_name: str, config: ConfigLike,
+                              actions: Optional[List[str]] = None) -> List[str]:
+        """Drop the history triggers and trigger function (history tables and their data stay)"""
+        return [
+            self._drop_triggers_ddl(schema, table_name),
+            f"DROP FUNCTION IF EXISTS {schema}.{table_name}_history_trigger();"
+        ]
     
     def generate_backup_ddl(self, schema: str, table_name: str) -> str:
         """Generate backup DDL for PostgreSQL"""
         return f"\\copy {schema}.{table_name} TO 'backup_{schema}_{table_name}.csv' CSV HEADER;"
 
+class MySQLTriggerGenerator(BaseTriggerGenerator):
+    """MySQL/MariaDB-specific trigger generator"""
+    
+    # MySQL has no statement-level triggers, no transition tables and no
+    # UPDATE OF column lists, so triggers capture a full copy of each OLD
+    # row. On MariaDB, 'system_versioned' instead converts the table WITH
+    # SYSTEM VERSIONING and the engine keeps history without triggers.
+    CAPTURE_MODES = ('row', 'system_versioned')
+
+    # Intervals of PARTITION BY SYSTEM_TIME for each partition_by setting
+    SYSTEM_TIME_INTERVALS = {'day': 'DAY', 'week': 'WEEK', 'month': 'MONTH'}
+
+    # First MariaDB version creating SYSTEM_TIME partitions automatically
+    AUTO_PARTITION_VERSION = 100900
+    TRIGGER_TIMINGS = ('before', 'after')
+    
+    # Every hist_id strategy but 'none' maps to an AUTO_INCREMENT key
+    # (InnoDB hands out values without a separate sequence object)
+    HIST_ID_STRATEGIES = ('sequence', 'identity', 'none')
+    
+    # There is no BRIN in MySQL; both methods produce a B-tree
+    TIMESTAMP_INDEXES = ('brin', 'btree', 'none')
+
+    def generate_sequence_ddl(self, schema: str, table_name: str, config: ConfigLike) -> Optional[str]:
+        """History keys come from AUTO_INCREMENT, so there is no sequence"""
+        return None
+    
+    def generate_history_table_ddl(self, schema: str, table_name: str, 
+                                   columns: List[Dict[str, Any]], 
+                                   config: ConfigLike) -> str:
+        """
+        Generate history table DDL for MySQL
+        
+        Indexes are declared inline: MySQL has no CREATE INDEX IF NOT
+        EXISTS, and inline keys are only built when the table is new.
+        """
+        config = resolve_app_config(config)
+        if not columns:
+            raise ValueError(f"No columns found for table {schema}.{table_name}")
+        self._check_supported(schema, table_name, config)
+        if config.capture_mode == 'system_versioned':
+            return self._system_versioning_ddl(schema, table_name, config)
+
+        history_table = f"{table_name}{config.history_suffix}"
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        timestamp_column = config.timestamp_column
+        hist_id_strategy = config.hist_id_strategy
+        if hist_id_strategy not in self.HIST_ID_STRATEGIES:
+            raise ValueError(f"Unsupported hist_id_strategy '{hist_id_strategy}' for {schema}.{table_name}")
+        timestamp_index = config.timestamp_index
+        if timestamp_index not in self.TIMESTAMP_INDEXES:
+            raise ValueError(f"Unsupported timestamp_index '{timestamp_index}' for {schema}.{table_name}")
+
+        column_defs = []
+        if hist_id_strategy != 'none':
+            column_defs.append("hist_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT")
+
+        # original columns (data_type is the full COLUMN_TYPE, e.g. int unsigned)
+        column_defs.extend(
+            f"{col['column_name']} {col['data_type']} NOT NULL" if col.get('is_nullable') == 'NO'
+            else f"{col['column_name']} {col['data_type']}"
+            for col in tracked
+        )
+
+        # metadata columns
+        column_defs.append(
+            f"{timestamp_column} DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)"
+        )
+        column_defs.append(
+            f"{config.operation_column} VARCHAR(10)"
+        )
+        column_defs.append(
+            f"{config.user_column} VARCHAR(100)"
+        )
+
+        if hist_id_strategy != 'none':
+            column_defs.append("PRIMARY KEY (hist_id)")
+        if timestamp_index != 'none':
+            column_defs.append(f"KEY idx_{history_table}_timestamp ({timestamp_column})")
+        key_columns = [col['column_name'] for col in tracked if col.get('is_primary_key')]
+        if config.key_index and key_columns:
+            column_defs.append(
+                f"KEY idx_{history_table}_key ({', '.join(key_columns)}, {timestamp_column})"
+            )
+
+        column_list = ",\n    ".join(column_defs)
+
+        return f"""
+CREATE TABLE IF NOT EXISTS {schema}.{history_table} (
+    {column_list}
+) ENGINE=InnoDB
+COMMENT='History table for {schema}.{table_name}'
+        """.strip()
+    
+    def generate_trigger_ddl(self, schema: str, table_name: str, 
+                             config: ConfigLike,
+                             columns: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Generate separate UPDATE and DELETE row triggers for MySQL
+        
+        Without UPDATE OF, column scoping and skip_unchanged_updates are
+        both enforced by a null-safe comparison of the tracked columns, so
+        updates that change nothing tracked write no history.
+        """
+        config = resolve_app_config(config)
+        history_table = f"{table_name}{config.history_suffix}"
+        self._check_supported(schema, table_name, config)
+        drop_triggers = [
+            f"DROP TRIGGER IF EXISTS {schema}.{table_name}_history_{suffix}"
+            for suffix in ('update', 'delete')
+        ]
+        if config.capture_mode == 'system_versioned':
+            # Triggers left from row capture would keep writing _hst rows
+            return drop_triggers
+
+        timing = config.trigger_timing
+        if timing not in self.TRIGGER_TIMINGS:
+            raise ValueError(f"Unsupported trigger_timing '{timing}' for {schema}.{table_name}")
+        timing = timing.upper()
+
+        if columns is None:
+            columns = self.database.get_table_columns(schema, table_name)
+
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        column_names = [col['column_name'] for col in tracked]
+
+        history_columns = ", ".join([
+            *column_names, config.timestamp_column, config.operation_column, config.user_column
+        ])
+        select_columns_old = ", ".join(f"OLD.{col}" for col in column_names)
+        # USER() is the connected client; CURRENT_USER() would be the
+        # trigger's definer
+        user = "SUBSTRING_INDEX(USER(), '@', 1)"
+
+        def insert_old_row(operation: str, indent: str = "") -> str:
+            return (
+                f"INSERT INTO {schema}.{history_table} ({history_columns})\n"
+                f"{indent}VALUES ({select_columns_old}, NOW(6), '{operation}', {user})"
+            )
+
+        if config.skip_unchanged_updates or len(tracked) < len(columns):
+            changed = " OR ".join(f"NOT (OLD.{col} <=> NEW.{col})" for col in column_names)
+            update_body = f"""
+BEGIN
+    IF {changed} THEN
+        {insert_old_row('UPDATE', '        ')};
+    END IF;
+END
+            """.strip()
+        else:
+            update_body = insert_old_row('UPDATE')
+
+        return [
+            *drop_triggers,
+            f"""
+CREATE TRIGGER {schema}.{table_name}_history_update
+{timing} UPDATE ON {schema}.{table_name}
+FOR EACH ROW
+{update_body}
+            """.strip(),
+            f"""
+CREATE TRIGGER {schema}.{table_name}_history_delete
+{timing} DELETE ON {schema}.{table_name}
+FOR EACH ROW
+{insert_old_row('DELETE')}
+            """.strip()
+        ]
+    
+    def _check_supported(self, schema: str, table_name: str, config: AppConfig):
+        """Reject settings that rely on PostgreSQL-only features"""
+        capture_mode = config.capture_mode
+        if capture_mode not in self.CAPTURE_MODES:
+            raise ValueError(f"Unsupported capture_mode '{capture_mode}' for {schema}.{table_name}")
+        if config.storage_mode != 'full':
+            raise ValueError(f"Unsupported storage_mode '{config.storage_mode}' for {schema}.{table_name}")
+        if config.history_layout != 'per_table':
+            raise ValueError(f"Unsupported history_layout '{config.history_layout}' for {schema}.{table_name}")
+
+        partition_by = config.partition_by or 'none'
+        if capture_mode != 'system_versioned':
+            if partition_by != 'none':
+                raise ValueError(f"Unsupported partition_by '{partition_by}' for {schema}.{table_name}")
+            return
+
+        if self.database.config.get('db_type', '').lower() != 'mariadb':
+            raise ValueError(
+                f"capture_mode 'system_versioned' requires db_type 'mariadb' ({schema}.{table_name})"
+            )
+        if partition_by != 'none' and partition_by not in self.SYSTEM_TIME_INTERVALS:
+            raise ValueError(f"Unsupported partition_by '{partition_by}' for {schema}.{table_name}")
+        if config.include_columns or config.exclude_columns:
+            # Excluding a column means restating its full definition WITHOUT
+            # SYSTEM VERSIONING, which the catalog metadata cannot reproduce
+            raise ValueError(
+                f"capture_mode 'system_versioned' does not support include/exclude columns "
+                f"({schema}.{table_name})"
+            )
+    
+    def _system_versioning_ddl(self, schema: str, table_name: str, config: AppConfig) -> str:
+        """
+        Convert a table to a MariaDB system-versioned table
+        
+        With partition_by, history rows go to SYSTEM_TIME partitions of one
+        interval each, created automatically as time passes (MariaDB 10.9+),
+        so the current rows stay in a partition of their own. PARTITION BY
+        replaces a table's partitioning, so partitioned tables are rejected.
+        """
+        ddl = f"ALTER TABLE {schema}.{table_name} ADD SYSTEM VERSIONING"
+        partition_by = config.partition_by or 'none'
+        if partition_by != 'none':
+            server_version = self.database.get_server_version()
+            if server_version is not None and server_version < self.AUTO_PARTITION_VERSION:
+                raise ValueError(
+                    f"partition_by with capture_mode 'system_versioned' requires MariaDB 10.9+ "
+                    f"({schema}.{table_name})"
+                )
+            if table_name in self.database.get_partitioned_tables(schema):
+                raise ValueError(
+                    f"partition_by would replace the existing partitioning of {schema}.{table_name}"
+                )
+            ddl += (
+                f"\nPARTITION BY SYSTEM_TIME INTERVAL 1 {self.SYSTEM_TIME_INTERVALS[partition_by]} AUTO"
+            )
+        return ddl
+    
+    def generate_rollback_ddl(self, schema: str, table_name: str, config: ConfigLike,
+                              actions: Optional[List[str]] = None) -> List[str]:
+        """
+        Drop the history triggers, and system versioning this session added
+        
+        Row capture keeps the history table and its data. Dropping system
+        versioning discards the history the engine kept, so it is only done
+        when the actions show the versioning (and its SYSTEM_TIME
+        partitioning) was added by this session.
+        """
+        actions = actions or []
+        statements = [
+            f"DROP TRIGGER IF EXISTS {schema}.{table_name}_history_{suffix}"
+            for suffix in ('update', 'delete')
+        ]
+        if "ADD_PARTITIONED_SYSTEM_VERSIONING" in actions:
+            statements.append(f"ALTER TABLE {schema}.{table_name} REMOVE PARTITIONING")
+        if "ADD_SYSTEM_VERSIONING" in actions or "ADD_PARTITIONED_SYSTEM_VERSIONING" in actions:
+            statements.append(f"ALTER TABLE {schema}.{table_name} DROP SYSTEM VERSIONING")
+        return statements
+    
+    def generate_backup_ddl(self, schema: str, table_name: str) -> str:
+        """Generate backup DDL for MySQL"""
+        return (
+            f"SELECT * FROM {schema}.{table_name} INTO OUTFILE "
+            f"'backup_{schema}_{table_name}.csv' FIELDS TERMINATED BY ',' ENCLOSED BY '\"';"
+        )
+
+class SQLiteTriggerGenerator(BaseTriggerGenerator):
+    """SQLite-specific trigger generator"""
+    
+    # SQLite only has FOR EACH ROW triggers. They are always created AFTER:
+    # SQLite fires AFTER row triggers as each row is changed (nothing is
+    # queued), so trigger_timing makes no difference here.
+    CAPTURE_MODES = ('row',)
+    
+    # INTEGER PRIMARY KEY aliases the rowid, so every strategy but 'none'
+    # gets its hist_id for free
+    HIST_ID_STRATEGIES = ('sequence', 'identity', 'none')
+    
+    TIMESTAMP_INDEXES = ('brin', 'btree', 'none')
+    
+    # Millisecond UTC timestamps (CURRENT_TIMESTAMP has whole seconds)
+    NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+    def generate_sequence_ddl(self, schema: str, table_name: str, config: ConfigLike) -> Optional[str]:
+        """hist_id is the rowid, so there is no sequence"""
+        return None
+    
+    def generate_history_table_ddl(self, schema: str, table_name: str, 
+                                   columns: List[Dict[str, Any]], 
+                                   config: ConfigLike) -> str:
+        """Generate history table DDL for SQLite"""
+        config = resolve_app_config(config)
+        if not columns:
+            raise ValueError(f"No columns found for table {schema}.{table_name}")
+        self._check_supported(schema, table_name, config)
+
+        history_table = f"{table_name}{config.history_suffix}"
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        hist_id_strategy = config.hist_id_strategy
+        if hist_id_strategy not in self.HIST_ID_STRATEGIES:
+            raise ValueError(f"Unsupported hist_id_strategy '{hist_id_strategy}' for {schema}.{table_name}")
+
+        column_defs = []
+        if hist_id_strategy != 'none':
+            column_defs.append("hist_id INTEGER PRIMARY KEY")
+
+        # original columns (untyped columns stay untyped)
+        column_defs.extend(
+            " ".join(filter(None, [
+                col['column_name'],
+                col['data_type'],
+                "NOT NULL" if col.get('is_nullable') == 'NO' else None
+            ]))
+            for col in tracked
+        )
+
+        # metadata columns
+        column_defs.append(
+            f"{config.timestamp_column} TIMESTAMP NOT NULL DEFAULT ({self.NOW})"
+        )
+        column_defs.append(
+            f"{config.operation_column} VARCHAR(10)"
+        )
+        column_defs.append(
+            f"{config.user_column} VARCHAR(100)"
+        )
+
+        column_list = ",\n    ".join(column_defs)
+
+        return f"""
+CREATE TABLE IF NOT EXISTS {schema}.{history_table} (
+    {column_list}
+);
+        """.strip()
+    
+    def generate_index_ddl(self, schema: str, table_name: str, key_columns: List[str],
+                           config: ConfigLike, concurrently: bool = False) -> Dict[str, str]:
+        """
+        Indexes for history lookups by time and by source row
+        
+        Both timestamp_index methods produce a B-tree. SQLite cannot build
+        indexes concurrently; concurrently is ignored.
+        """
+        config = resolve_app_config(config)
+        history_table = f"{table_name}{config.history_suffix}"
+        timestamp_column = config.timestamp_column
+        timestamp_index = config.timestamp_index
+        if timestamp_index not in self.TIMESTAMP_INDEXES:
+            raise ValueError(f"Unsupported timestamp_index '{timestamp_index}' for {schema}.{table_name}")
+
+        indexes = {}
+        if timestamp_index != 'none':
+            name = f"idx_{history_table}_timestamp"
+            indexes[name] = (
+                f"CREATE INDEX IF NOT EXISTS {schema}.{name}\n"
+                f"ON {history_table} ({timestamp_column});"
+            )
+
+        if config.key_index and key_columns:
+            name = f"idx_{history_table}_key"
+            indexes[name] = (
+                f"CREATE INDEX IF NOT EXISTS {schema}.{name}\n"
+                f"ON {history_table} ({', '.join(key_columns)}, {timestamp_column});"
+            )
+
+        return indexes
+    
+    def generate_trigger_ddl(self, schema: str, table_name: str, 
+                             config: ConfigLike,
+                             columns: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Generate AFTER UPDATE and AFTER DELETE row triggers for SQLite
+        
+        Table names inside trigger bodies can't be schema-qualified; the
+        history table lives in the same schema as the table.
+        """
+        config = resolve_app_config(config)
+        history_table = f"{table_name}{config.history_suffix}"
+        self._check_supported(schema, table_name, config)
+
+        if columns is None:
+            columns = self.database.get_table_columns(schema, table_name)
+
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        column_names = [col['column_name'] for col in tracked]
+        # Only narrow the UPDATE event when some columns are not tracked
+        update_of = column_names if len(tracked) < len(columns) else []
+        update_event = f"UPDATE OF {', '.join(update_of)}" if update_of else "UPDATE"
+
+        history_columns = ", ".join([
+            *column_names, config.timestamp_column, config.operation_column
+        ])
+        select_columns_old = ", ".join(f"OLD.{col}" for col in column_names)
+
+        def insert_old_row(operation: str) -> str:
+            return (
+                f"    INSERT INTO {history_table} ({history_columns})\n"
+                f"    VALUES ({select_columns_old}, {self.NOW}, '{operation}');"
+            )
+
+        when = ""
+        if config.skip_unchanged_updates:
+            # IS NOT treats two NULLs as equal
+            when = "\nWHEN " + " OR ".join(f"OLD.{col} IS NOT NEW.{col}" for col in column_names)
+
+        return [
+            *self.generate_rollback_ddl(schema, table_name, config),
+            f"""
+CREATE TRIGGER {schema}.{table_name}_history_update
+AFTER {update_event} ON {table_name}
+FOR EACH ROW{when}
+BEGIN
+{insert_old_row('UPDATE')}
+END;
+            """.strip(),
+            f"""
+CREATE TRIGGER {schema}.{table_name}_history_delete
+AFTER DELETE ON {table_name}
+FOR EACH ROW
+BEGIN
+{insert_old_row('DELETE')}
+END;
+            """.strip()
+        ]
+    
+    def _check_supported(self, schema: str, table_name: str, config: AppConfig):
+        """Reject settings that rely on PostgreSQL-only features"""
+        if config.capture_mode not in self.CAPTURE_MODES:
+            raise ValueError(f"Unsupported capture_mode '{config.capture_mode}' for {schema}.{table_name}")
+        if config.storage_mode != 'full':
+            raise ValueError(f"Unsupported storage_mode '{config.storage_mode}' for {schema}.{table_name}")
+        if config.history_layout != 'per_table':
+            raise ValueError(f"Unsupported history_layout '{config.history_layout}' for {schema}.{table_name}")
+        if (config.partition_by or 'none') != 'none':
+            raise ValueError(f"Unsupported partition_by '{config.partition_by}' for {schema}.{table_name}")
+    
+    def generate_rollback_ddl(self, schema: str, table_name: str, config: ConfigLike,
+                              actions: Optional[List[str]] = None) -> List[str]:
+        """Drop the history triggers (history tables and their data stay)"""
+        return [
+            f"DROP TRIGGER IF EXISTS {schema}.{table_name}_history_{suffix};"
+            for suffix in ('update', 'delete')
+        ]
+    
+    def generate_backup_ddl(self, schema: str, table_name: str) -> str:
+        """Generate backup commands for the sqlite3 shell"""
+        return (
+            f".headers on\n.mode csv\n.once backup_{schema}_{table_name}.csv\n"
+            f"SELECT * FROM {schema}.{table_name};"
+        )
+
+class SQLServerTriggerGenerator(BaseTriggerGenerator):
+    """SQL Server-specific trigger generator"""
+    
+    # SQL Server triggers fire once per statement with the changed rows in
+    # the inserted/deleted pseudo-tables, so both capture modes produce
+    # one set-based INSERT ... SELECT per statement. There are no BEFORE
+    # triggers; AFTER is used whatever trigger_timing says.
+    CAPTURE_MODES = ('row', 'statement')
+    
+    # 'sequence' and 'identity' both map to an IDENTITY column
+    HIST_ID_STRATEGIES = ('sequence', 'identity', 'none')
+    
+    # There is no BRIN in SQL Server; both methods produce a B-tree
+    TIMESTAMP_INDEXES = ('brin', 'btree', 'none')
+    
+    # Types EXCEPT can't compare, and what they are compared as instead
+    EXCEPT_CASTS = {
+        'xml': 'NVARCHAR(MAX)',
+        'geography': 'VARBINARY(MAX)',
+        'geometry': 'VARBINARY(MAX)'
+    }
+    
+    # Types AFTER triggers can't read from inserted/deleted
+    UNREADABLE_TYPES = ('text', 'ntext', 'image')
+
+    def generate_sequence_ddl(self, schema: str, table_name: str, config: ConfigLike) -> Optional[str]:
+        """History keys come from IDENTITY, so there is no sequence"""
+        return None
+    
+    def generate_history_table_ddl(self, schema: str, table_name: str, 
+                                   columns: List[Dict[str, Any]], 
+                                   config: ConfigLike) -> str:
+        """Generate history table DDL for SQL Server (clustered on the ever-increasing hist_id)"""
+        config = resolve_app_config(config)
+        if not columns:
+            raise ValueError(f"No columns found for table {schema}.{table_name}")
+        self._check_supported(schema, table_name, config)
+
+        history_table = f"{table_name}{config.history_suffix}"
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        hist_id_strategy = config.hist_id_strategy
+        if hist_id_strategy not in self.HIST_ID_STRATEGIES:
+            raise ValueError(f"Unsupported hist_id_strategy '{hist_id_strategy}' for {schema}.{table_name}")
+
+        column_defs = []
+        if hist_id_strategy != 'none':
+            column_defs.append("hist_id BIGINT IDENTITY(1,1) NOT NULL")
+
+        # original columns
+        column_defs.extend(
+            f"{col['column_name']} {col['data_type']} NOT NULL" if col.get('is_nullable') == 'NO'
+            else f"{col['column_name']} {col['data_type']} NULL"
+            for col in tracked
+        )
+
+        # metadata columns
+        column_defs.append(
+            f"{config.timestamp_column} DATETIME2(3) NOT NULL "
+            f"CONSTRAINT DF_{history_table}_timestamp DEFAULT SYSDATETIME()"
+        )
+        column_defs.append(
+            f"{config.operation_column} VARCHAR(10) NULL"
+        )
+        column_defs.append(
+            f"{config.user_column} NVARCHAR(128) NULL"
+        )
+        if hist_id_strategy != 'none':
+            column_defs.append(f"CONSTRAINT PK_{history_table} PRIMARY KEY CLUSTERED (hist_id)")
+
+        column_list = ",\n    ".join(column_defs)
+
+        return f"""
+IF OBJECT_ID(N'{schema}.{history_table}', N'U') IS NULL
+CREATE TABLE {schema}.{history_table} (
+    {column_list}
+);
+        """.strip()
+    
+    def generate_index_ddl(self, schema: str, table_name: str, key_columns: List[str],
+                           config: ConfigLike, concurrently: bool = False) -> Dict[str, str]:
+        """
+        Indexes for history lookups by time and by source row
+        
+        Online index builds need Enterprise edition, so concurrently is
+        ignored and indexes are built offline.
+        """
+        config = resolve_app_config(config)
+        history_table = f"{table_name}{config.history_suffix}"
+        timestamp_column = config.timestamp_column
+        timestamp_index = config.timestamp_index
+        if timestamp_index not in self.TIMESTAMP_INDEXES:
+            raise ValueError(f"Unsupported timestamp_index '{timestamp_index}' for {schema}.{table_name}")
+
+        def create_index(name: str, index_columns: str) -> str:
+            return (
+                f"IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = N'{name}' "
+                f"AND object_id = OBJECT_ID(N'{schema}.{history_table}'))\n"
+                f"CREATE INDEX {name} ON {schema}.{history_table} ({index_columns});"
+            )
+
+        indexes = {}
+        if timestamp_index != 'none':
+            name = f"idx_{history_table}_timestamp"
+            indexes[name] = create_index(name, timestamp_column)
+
+        if config.key_index and key_columns:
+            name = f"idx_{history_table}_key"
+            indexes[name] = create_index(name, f"{', '.join(key_columns)}, {timestamp_column}")
+
+        return indexes
+    
+    def generate_trigger_ddl(self, schema: str, table_name: str, 
+                             config: ConfigLike,
+                             columns: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Generate one set-based AFTER UPDATE, DELETE trigger for SQL Server
+        
+        Each statement copies the whole deleted pseudo-table with a single
+        INSERT ... SELECT. SET NOCOUNT ON keeps the trigger's row count
+        from being reported to clients as an extra result.
+        """
+        config = resolve_app_config(config)
+        history_table = f"{table_name}{config.history_suffix}"
+        self._check_supported(schema, table_name, config)
+
+        if columns is None:
+            columns = self.database.get_table_columns(schema, table_name)
+
+        tracked = self.tracked_columns(schema, table_name, columns, config)
+        column_names = [col['column_name'] for col in tracked]
+        key_columns = [col['column_name'] for col in tracked if col.get('is_primary_key')]
+
+        history_columns = ", ".join([
+            *column_names, config.timestamp_column, config.operation_column, config.user_column
+        ])
+        select_columns_old = ", ".join(f"d.{col}" for col in column_names)
+
+        guards = []
+        if len(tracked) < len(columns):
+            # Like UPDATE OF: skip updates whose SET list has no tracked column
+            updated = " OR ".join(f"UPDATE({col})" for col in column_names)
+            guards.append(f"    IF @operation = 'UPDATE' AND NOT ({updated}) RETURN;")
+
+        unreadable = [
+            col['column_name'] for col in tracked
+            if col['data_type'].lower() in self.UNREADABLE_TYPES
+        ]
+        if unreadable:
+            raise ValueError(
+                f"text, ntext and image columns can't be read in AFTER triggers; add "
+                f"{', '.join(unreadable)} to exclude_columns for {schema}.{table_name}"
+            )
+
+        source = "FROM deleted AS d"
+        if config.skip_unchanged_updates:
+            # Rows whose tracked values are unchanged (EXCEPT compares NULLs
+            # as equal) are left out; deleted rows have no inserted match
+            if not key_columns:
+                raise ValueError(
+                    f"skip_unchanged_updates requires a primary key on {schema}.{table_name}"
+                )
+            join = " AND ".join(f"i.{col} = d.{col}" for col in key_columns)
+            source = (
+                f"FROM deleted AS d\n"
+                f"    LEFT JOIN inserted AS i ON {join}\n"
+                f"    WHERE i.{key_columns[0]} IS NULL\n"
+                f"    OR EXISTS (SELECT {self._comparable_columns('d', tracked)} "
+                f"EXCEPT SELECT {self._comparable_columns('i', tracked)})"
+            )
+        guard_lines = "".join(f"\n{guard}" for guard in guards)
+
+        trigger = f"""
+CREATE OR ALTER TRIGGER {schema}.{table_name}_history_trigger
+ON {schema}.{table_name}
+AFTER UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF NOT EXISTS (SELECT 1 FROM deleted) RETURN;
+
+    DECLARE @operation VARCHAR(10) =
+        CASE WHEN EXISTS (SELECT 1 FROM inserted) THEN 'UPDATE' ELSE 'DELETE' END;{guard_lines}
+
+    INSERT INTO {schema}.{history_table} ({history_columns})
+    SELECT {select_columns_old}, SYSDATETIME(), @operation, SUSER_SNAME()
+    {source};
+END;
+        """.strip()
+
+        return [trigger]
+    
+    def _comparable_columns(self, alias: str, columns: List[Dict[str, Any]]) -> str:
+        """Select list for EXCEPT, casting types EXCEPT can't compare"""
+        return ", ".join(
+            f"CAST({alias}.{col['column_name']} AS {self.EXCEPT_CASTS[col['data_type'].lower()]})"
+            if col['data_type'].lower() in self.EXCEPT_CASTS
+            else f"{alias}.{col['column_name']}"
+            for col in columns
+        )
+    
+    def _check_supported(self, schema: str, table_name: str, config: AppConfig):
+        """Reject settings that rely on PostgreSQL-only features"""
+        if config.capture_mode not in self.CAPTURE_MODES:
+            raise ValueError(f"Unsupported capture_mode '{config.capture_mode}' for {schema}.{table_name}")
+        if config.storage_mode != 'full':
+            raise ValueError(f"Unsupported storage_mode '{config.storage_mode}' for {schema}.{table_name}")
+        if config.history_layout != 'per_table':
+            raise ValueError(f"Unsupported history_layout '{config.history_layout}' for {schema}.{table_name}")
+        if (config.partition_by or 'none') != 'none':
+            raise ValueError(f"Unsupported partition_by '{config.partition_by}' for {schema}.{table_name}")
+    
+    def generate_rollback_ddl(self, schema: str, table_name: str, config: ConfigLike,
+                              actions: Optional[List[str]] = None) -> List[str]:
+        """Drop the history trigger (history tables and their data stay)"""
+        return [f"DROP TRIGGER IF EXISTS {schema}.{table_name}_history_trigger;"]
+    
+    def generate_backup_ddl(self, schema: str, table_name: str) -> str:
+        """Generate a bcp export command for SQL Server"""
+        database = self.database.config.get('database', 'master')
+        return f"bcp {database}.{schema}.{table_name} out backup_{schema}_{table_name}.csv -c -t, -T"
+
 class TriggerGenerator:
     """Factory for trigger generators"""
     
@@ -162,19 +1649,30 @@ class TriggerGenerator:
         # Map database types to generators
         self._generators = {
             'postgresql': PostgreSQLTriggerGenerator,
-            'mysql': None,  # Add MySQL generator
-            'sqlserver': None  # Add SQL Server generator
+            'mysql': MySQLTriggerGenerator,
+            'mariadb': MySQLTriggerGenerator,
+            'sqlite': SQLiteTriggerGenerator,
+            'sqlserver': SQLServerTriggerGenerator,
+            'mssql': SQLServerTriggerGenerator
         }
+        # Generators are stateless apart from the database, so one
+        # instance per database type serves every call
+        self._instances = {}
         
     def _get_generator(self):
         """Get appropriate trigger generator"""
         db_type = self.database.config.get('db_type', '').lower()
+        generator = self._instances.get(db_type)
+        if generator is not None:
+            return generator
+        
         generator_class = self._generators.get(db_type)
         
         if not generator_class:
             raise ValueError(f"No trigger generator for database type: {db_type}")
         
-        return generator_class(self.database)
+        generator = self._instances[db_type] = generator_class(self.database)
+        return generator
 
     def generate_sequence_ddl(self, *args, **kwargs):
         generator = self._get_generator()
@@ -191,3 +1689,23 @@ class TriggerGenerator:
     def generate_backup_ddl(self, *args, **kwargs):
         generator = self._get_generator()
         return generator.generate_backup_ddl(*args, **kwargs)
+    
+    def generate_rollback_ddl(self, *args, **kwargs):
+        generator = self._get_generator()
+        return generator.generate_rollback_ddl(*args, **kwargs)
+    
+    def generate_shared_ddl(self, *args, **kwargs):
+        generator = self._get_generator()
+        return generator.generate_shared_ddl(*args, **kwargs)
+    
+    def generate_index_ddl(self, *args, **kwargs):
+        generator = self._get_generator()
+        return generator.generate_index_ddl(*args, **kwargs)
+    
+    def generate_drop_index_ddl(self, *args, **kwargs):
+        generator = self._get_generator()
+        return generator.generate_drop_index_ddl(*args, **kwargs)
+    
+    def generate_partition_ddl(self, *args, **kwargs):
+        generator = self._get_generator()
+        return generator.generate_partition_ddl(*args, **kwargs)
@@ -29,8 +29,8 @@ def main():
         # Initialize UI
         ui = ConsoleUI()
         
-        # Get database connection details
-        db_config = ui.get_database_config(config)
+        # Get database connection details (interactive answers override config file)
+        db_config = {**config.get('database', {}), **ui.get_database_config(config)}
         
         # Connect to database
         db_factory = DatabaseFactory()
@@ -59,9 +59,11 @@ def main():
                 history_manager.apply_changes()
             elif choice == "3":  # Rollback changes
                 history_manager.rollback_changes()
-            elif choice == "4":  # Configure settings
+            elif choice == "4":  # Pre-create partitions
+                history_manager.maintain_partitions()
+            elif choice == "5":  # Configure settings
                 config_manager.update_interactive_config()
-            elif choice == "5":  # Exit
+            elif choice == "6":  # Exit
                 ui.display_message("Goodbye!")
                 break
         
@@ -0,0 +1,92 @@
+"""
+Shared helpers for benchmark scripts
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add the project root to Python path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from rich.console import Console
+
+from core.database import BaseDatabase, DatabaseFactory
+
+DEFAULT_PORTS = {'postgresql': 5432, 'mysql': 3306, 'mariadb': 3306, 'sqlserver': 1433}
+
+class HeadlessUI:
+    """Non-interactive stand-in for ConsoleUI used by scripted runs"""
+
+    def __init__(self, schema: Optional[str] = None):
+        self.console = Console()
+        self.current_database = None
+        self.current_schema = schema
+
+    def display_header(self, title: str):
+        self.console.rule(title)
+
+    def display_message(self, message: str, msg_type: str = "info"):
+        self.console.print(f"[{msg_type.upper()}] {message}")
+
+    def display_error(self, error: str):
+        self.display_message(error, "error")
+
+    def confirm_action(self, message: str, default: bool = False) -> bool:
+        return True
+
+def add_connection_args(parser: argparse.ArgumentParser, db_type: str = 'postgresql'):
+    """Add connection arguments (defaults come from DB_* environment variables)"""
+    parser.add_argument('--db-type', default=os.getenv('DB_TYPE', db_type))
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '0')) or None)
+    parser.add_argument('--username', default=os.getenv('DB_USER', 'postgres'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'postgres'))
+
+def connect(args: argparse.Namespace, **overrides) -> BaseDatabase:
+    """Create and connect a database from parsed arguments"""
+    config = {
+        'db_type': args.db_type,
+        'host': args.host,
+        'port': args.port or DEFAULT_PORTS.get(args.db_type, 5432),
+        'username': args.username,
+        'password': args.password,
+        'database': args.database,
+        'catalog_cache': False
+    }
+    config.update(overrides)
+    database = DatabaseFactory.create_database(config, ui=None)
+    database.connect()
+    return database
+
+def app_config(**overrides) -> Dict[str, Any]:
+    """Application config for HistoryManager with backups disabled"""
+    from dataclasses import asdict
+    from config.settings import AppConfig
+
+    app = asdict(AppConfig())
+    app['backup_before_changes'] = False
+    app.update(overrides)
+    return {'app': app}
+
+def timed(func: Callable[[], Any]) -> float:
+    """Return wall-clock seconds for a single call"""
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def print_table(headers: List[str], rows: List[List[Any]]):
+    """Print a plain aligned results table"""
+    widths = [
+        max(len(str(header)), *(len(str(row[i])) for row in rows)) if rows else len(str(header))
+        for i, header in enumerate(headers)
+    ]
+    print()
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
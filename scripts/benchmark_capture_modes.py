@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark history capture modes: row-level vs statement-level triggers
+
+Loads a synthetic table, applies history with capture_mode=row and then
+capture_mode=statement, and times bulk UPDATE and DELETE statements
+against the same data (plus a baseline without any trigger).
+
+Usage:
+    python scripts/benchmark_capture_modes.py --host localhost --username postgres --rows 1000000
+"""
+
+import argparse
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_capture"
+BENCH_TABLE = "events"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--rows', type=int, default=1000000, help="Rows in the synthetic table")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load the table"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        status VARCHAR(20) NOT NULL,
+        amount NUMERIC(12, 2),
+        payload TEXT
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT i, 'new', i % 1000, md5(i::text)
+    FROM generate_series(1, {rows}) AS i
+    """)
+    database.execute_query(f"ANALYZE {BENCH_SCHEMA}.{BENCH_TABLE}")
+
+def history_rows(database) -> int:
+    """Rows captured in the history table"""
+    row = database.execute_query(
+        f"SELECT count(*) AS n FROM {BENCH_SCHEMA}.{BENCH_TABLE}_hst"
+    )[0]
+    return row['n']
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args)
+    rows = []
+
+    for mode in ('none', 'row', 'statement'):
+        reset_table(database, args.rows)
+        if mode != 'none':
+            manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config(capture_mode=mode))
+            manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        update_time = timed(lambda: database.execute_query(
+            f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'processed'"
+        ))
+        delete_time = timed(lambda: database.execute_query(
+            f"DELETE FROM {BENCH_SCHEMA}.{BENCH_TABLE} WHERE id % 2 = 0"
+        ))
+        captured = history_rows(database) if mode != 'none' else 0
+        rows.append([mode, args.rows, f"{update_time:.2f}s", f"{delete_time:.2f}s", captured])
+
+    print_table(["Capture mode", "Rows", "Bulk UPDATE", "Bulk DELETE", "History rows"], rows)
+
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
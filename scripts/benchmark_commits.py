@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark commit counts of an apply run: per-statement vs batched transactions
+
+Applies history to a synthetic schema twice, once with
+transaction_mode=statement (every statement commits, the old behavior) and
+once with transaction_mode=batch (one commit, savepoint per table), and
+reports client-side commit counts, server-side xact_commit deltas and time.
+
+Usage:
+    python scripts/benchmark_commits.py --host localhost --username postgres --tables 200
+"""
+
+import argparse
+import time
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_commits"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--tables', type=int, default=200, help="Number of synthetic tables")
+    return parser.parse_args()
+
+def reset_schema(database, table_count: int):
+    """Recreate the synthetic schema"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    DO $$
+    BEGIN
+        FOR i IN 0..{table_count - 1} LOOP
+            EXECUTE format(
+                'CREATE TABLE {BENCH_SCHEMA}.t_%s (
+                    id BIGINT PRIMARY KEY,
+                    name VARCHAR(100),
+                    amount NUMERIC(12, 2)
+                )', i);
+        END LOOP;
+    END $$;
+    """)
+
+def server_commits(database) -> int:
+    """Committed transactions for the current database as seen by the server"""
+    time.sleep(1)  # let backends flush their statistics
+    database.execute_query("SELECT pg_stat_clear_snapshot()")
+    row = database.execute_query(
+        "SELECT xact_commit FROM pg_stat_database WHERE datname = current_database()"
+    )[0]
+    return row['xact_commit']
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    tables = [f"t_{i}" for i in range(args.tables)]
+    admin = connect(args)
+    rows = []
+
+    for mode in ('statement', 'batch'):
+        reset_schema(admin, args.tables)
+        database = connect(args, transaction_mode=mode)
+        manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config())
+
+        before = server_commits(admin)
+        started = time.perf_counter()
+        results = manager.apply_tables(tables, BENCH_SCHEMA)
+        elapsed = time.perf_counter() - started
+        after = server_commits(admin)
+
+        stats = database.get_stats()
+        failed = sum(1 for r in results if r['status'] != 'SUCCESS')
+        rows.append([mode, args.tables, failed, stats['statements'], stats['commits'],
+                     after - before, f"{elapsed:.2f}s"])
+        database.disconnect()
+
+    print_table(
+        ["Mode", "Tables", "Failed", "Statements", "Client commits", "Server commits", "Time"],
+        rows
+    )
+
+    admin.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    admin.disconnect()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark DDL generation for many wide tables
+
+Generates sequence, history table, index and trigger DDL for synthetic
+tables entirely in memory (no server connection needed), once with the
+app settings passed as a plain dict (resolved on every call) and once with
+an AppConfig resolved up front, as HistoryManager does per run. Reports
+total time, time per table and the amount of SQL produced.
+
+Usage:
+    python scripts/benchmark_ddl_generation.py --tables 50000 --columns 200
+"""
+
+import argparse
+
+from bench_common import app_config, print_table, timed
+from config.settings import resolve_app_config
+from core.database import DatabaseFactory
+from core.trigger_generator import TriggerGenerator
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tables', type=int, default=50000, help="Synthetic tables")
+    parser.add_argument('--columns', type=int, default=200, help="Columns per table")
+    return parser.parse_args()
+
+def synthetic_columns(count: int):
+    """Column metadata shaped like get_schema_columns() output"""
+    return [
+        {
+            'column_name': f"col_{i}",
+            'data_type': 'bigint' if i % 3 == 0 else 'character varying(100)',
+            'is_nullable': 'NO' if i == 0 else 'YES',
+            'is_primary_key': i == 0
+        }
+        for i in range(count)
+    ]
+
+def generate_all(generator: TriggerGenerator, tables: int, columns, config) -> int:
+    """Generate the DDL of every table; returns the characters of SQL produced"""
+    size = 0
+    for i in range(tables):
+        table_name = f"table_{i}"
+        size += len(generator.generate_sequence_ddl("bench", table_name, config) or "")
+        size += len(generator.generate_history_table_ddl("bench", table_name, columns, config) or "")
+        size += sum(map(len, generator.generate_index_ddl("bench", table_name, ['col_0'], config).values()))
+        size += sum(map(len, generator.generate_trigger_ddl("bench", table_name, config, columns)))
+    return size
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    # Generation needs the database type only; nothing connects
+    database = DatabaseFactory.create_database({'db_type': 'postgresql', 'catalog_cache': False}, ui=None)
+    generator = TriggerGenerator(database)
+    columns = synthetic_columns(args.columns)
+    settings = app_config()['app']
+    rows = []
+
+    for label, config in (("dict per call", settings), ("resolved AppConfig", resolve_app_config(settings))):
+        size = 0
+
+        def run():
+            nonlocal size
+            size = generate_all(generator, args.tables, columns, config)
+
+        elapsed = timed(run)
+        rows.append([
+            label, args.tables, args.columns, f"{elapsed:.2f}s",
+            f"{elapsed / args.tables * 1e6:.0f} us", f"{size / 1024 / 1024:.0f} MB"
+        ])
+
+    print_table(["Settings", "Tables", "Columns", "Total", "Per table", "SQL generated"], rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark history trigger throughput for each hist_id strategy
+
+Applies history to a synthetic table with each hist_id_strategy (sequence,
+cached sequence, identity, cached identity, none) and has many concurrent
+sessions run single-row UPDATEs on disjoint rows, so the only shared hot
+spot is how each history row gets its hist_id. Reports updates per second.
+
+Usage:
+    python scripts/benchmark_hist_id.py --host localhost --username postgres \
+        --clients 64 --updates 500
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_hist_id"
+BENCH_TABLE = "counters"
+
+STRATEGIES = [
+    ('sequence', 1),
+    ('sequence', 50),
+    ('identity', 1),
+    ('identity', 50),
+    ('none', 1),
+]
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--clients', type=int, default=64, help="Concurrent sessions")
+    parser.add_argument('--updates', type=int, default=500, help="UPDATEs per session")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load one row per update slot"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        hits BIGINT NOT NULL
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT i, 0 FROM generate_series(1, {rows}) AS i
+    """)
+
+def run_client(database, client: int, clients: int, updates: int):
+    """One session updating its own rows, one committed UPDATE at a time"""
+    with database.pooled_connection():
+        for i in range(updates):
+            database.execute_query(
+                f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET hits = hits + 1 WHERE id = %s",
+                (i * clients + client + 1,)
+            )
+
+def run_workload(database, clients: int, updates: int):
+    """All sessions at once"""
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        futures = [
+            executor.submit(run_client, database, client, clients, updates)
+            for client in range(clients)
+        ]
+        for future in futures:
+            future.result()
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args, pool_size=args.clients)
+    total = args.clients * args.updates
+    rows = []
+
+    for strategy, cache in STRATEGIES:
+        reset_table(database, total)
+        manager = HistoryManager(
+            database, HeadlessUI(BENCH_SCHEMA),
+            app_config(hist_id_strategy=strategy, sequence_cache=cache)
+        )
+        manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        elapsed = timed(lambda: run_workload(database, args.clients, args.updates))
+        rows.append([strategy, cache, args.clients, total, f"{elapsed:.2f}s", f"{total / elapsed:.0f}/s"])
+
+    print_table(["hist_id strategy", "Cache", "Sessions", "Updates", "Time", "Throughput"], rows)
+
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark PostgreSQL introspection: information_schema vs pg_catalog
+
+Builds a synthetic schema with many tables, then times the introspection
+calls used by the application against both catalog backends.
+
+Usage:
+    python scripts/benchmark_introspection.py --host localhost --username postgres \
+        --password secret --database bench --tables 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List
+
+# Add the project root to Python path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from core.database import PostgreSQLDatabase
+
+BENCH_SCHEMA = "bench_introspection"
+BATCH_SIZE = 1000
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '5432')))
+    parser.add_argument('--username', default=os.getenv('DB_USER', 'postgres'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'postgres'))
+    parser.add_argument('--tables', type=int, default=20000, help="Number of synthetic tables")
+    parser.add_argument('--sample', type=int, default=200, help="Tables probed one by one")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic schema")
+    return parser.parse_args()
+
+def make_database(args: argparse.Namespace, introspection: str) -> PostgreSQLDatabase:
+    """
+    Create a connected database instance using the given catalog backend
+
+    The catalog snapshot and metadata caches are disabled so every call
+    reaches the catalog queries being compared.
+    """
+    database = PostgreSQLDatabase({
+        'db_type': 'postgresql',
+        'host': args.host,
+        'port': args.port,
+        'username': args.username,
+        'password': args.password,
+        'database': args.database,
+        'introspection': introspection,
+        'catalog_cache': False,
+        'metadata_cache_size': 0,
+        'metadata_cache_ttl': 0
+    }, ui=None)
+    database.connect()
+    return database
+
+def drop_schema(database: PostgreSQLDatabase):
+    """Drop the synthetic schema in batches to stay under lock limits"""
+    tables = [t['name'] for t in database.get_tables(BENCH_SCHEMA)]
+    for start in range(0, len(tables), BATCH_SIZE):
+        batch = ", ".join(f"{BENCH_SCHEMA}.{t}" for t in tables[start:start + BATCH_SIZE])
+        database.execute_query(f"DROP TABLE IF EXISTS {batch} CASCADE")
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+
+def create_schema(database: PostgreSQLDatabase, table_count: int):
+    """Create the synthetic schema in batches to stay under lock limits"""
+    drop_schema(database)
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+
+    for start in range(0, table_count, BATCH_SIZE):
+        end = min(start + BATCH_SIZE, table_count)
+        database.execute_query(f"""
+        DO $$
+        BEGIN
+            FOR i IN {start}..{end - 1} LOOP
+                EXECUTE format(
+                    'CREATE TABLE {BENCH_SCHEMA}.t_%s (
+                        id BIGINT PRIMARY KEY,
+                        name VARCHAR(100) NOT NULL,
+                        amount NUMERIC(12, 2),
+                        payload JSONB,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )', i);
+            END LOOP;
+        END $$;
+        """)
+        print(f"  created {end}/{table_count} tables", end="\r")
+    print()
+
+def timed(func: Callable[[], Any]) -> float:
+    """Return wall-clock seconds for a single call"""
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def run_backend(database: PostgreSQLDatabase, sample: List[str]) -> Dict[str, float]:
+    """Time every introspection call for one backend"""
+    return {
+        'get_tables': timed(lambda: database.get_tables(BENCH_SCHEMA)),
+        'get_table_columns x sample': timed(
+            lambda: [database.get_table_columns(BENCH_SCHEMA, t) for t in sample]
+        ),
+        'get_table_constraints x sample': timed(
+            lambda: [database.get_table_constraints(BENCH_SCHEMA, t) for t in sample]
+        ),
+        'get_schema_columns (sample)': timed(
+            lambda: database.get_schema_columns(BENCH_SCHEMA, sample)
+        ),
+        'get_schema_columns (all)': timed(
+            lambda: database.get_schema_columns(BENCH_SCHEMA)
+        ),
+    }
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+
+    setup_db = make_database(args, 'pg_catalog')
+    print(f"Creating {args.tables} tables in schema '{BENCH_SCHEMA}'...")
+    create_schema(setup_db, args.tables)
+    setup_db.execute_query("ANALYZE")
+
+    sample = [f"t_{i}" for i in range(0, args.tables, max(1, args.tables // args.sample))]
+
+    results = {}
+    for backend in ('information_schema', 'pg_catalog'):
+        database = make_database(args, backend)
+        try:
+            results[backend] = run_backend(database, sample)
+        finally:
+            database.disconnect()
+
+    print(f"\n{'Operation':<34}{'information_schema':>20}{'pg_catalog':>14}{'speedup':>10}")
+    for operation in results['pg_catalog']:
+        slow = results['information_schema'][operation]
+        fast = results['pg_catalog'][operation]
+        speedup = slow / fast if fast else float('inf')
+        print(f"{operation:<34}{slow:>19.3f}s{fast:>13.3f}s{speedup:>9.1f}x")
+
+    if not args.keep:
+        drop_schema(setup_db)
+    setup_db.disconnect()
+
+if __name__ == "__main__":
+    main()
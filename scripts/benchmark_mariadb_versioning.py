@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compare MariaDB system versioning with trigger-based history capture
+
+Applies history to a synthetic table with capture_mode=row (BEFORE
+UPDATE/DELETE triggers writing a _hst table), capture_mode=system_versioned
+and system_versioned partitioned BY SYSTEM_TIME, then runs the same
+workload on each: concurrent sessions issuing single-row UPDATEs on
+disjoint rows (reported as updates per second), a bulk UPDATE and a bulk
+DELETE. A run without history is the baseline.
+
+Usage:
+    python scripts/benchmark_mariadb_versioning.py --host localhost --username root \
+        --database mysql --rows 200000 --clients 16 --updates 1000
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_versioning"
+BENCH_TABLE = "orders"
+
+CASES = [
+    ('none', None),
+    ('row triggers', {'capture_mode': 'row'}),
+    ('system versioned', {'capture_mode': 'system_versioned'}),
+    ('system versioned, monthly partitions', {'capture_mode': 'system_versioned', 'partition_by': 'month'}),
+]
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser, db_type='mariadb')
+    parser.add_argument('--rows', type=int, default=200000, help="Rows in the synthetic table")
+    parser.add_argument('--clients', type=int, default=16, help="Concurrent sessions")
+    parser.add_argument('--updates', type=int, default=1000, help="UPDATEs per session")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load the table"""
+    database.execute_query(f"DROP DATABASE IF EXISTS {BENCH_SCHEMA}")
+    database.execute_query(f"CREATE DATABASE {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        customer_id BIGINT NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        total DECIMAL(12, 2),
+        note VARCHAR(64)
+    ) ENGINE=InnoDB
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT seq, seq % 10000, 'new', seq % 1000, MD5(seq) FROM seq_1_to_{rows}
+    """)
+    database.execute_query(f"ANALYZE TABLE {BENCH_SCHEMA}.{BENCH_TABLE}")
+
+def run_client(database, client: int, clients: int, updates: int, rows: int):
+    """One session updating its own rows, one committed UPDATE at a time"""
+    with database.pooled_connection():
+        for i in range(updates):
+            database.execute_query(
+                f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET total = total + 1 WHERE id = %s",
+                ((i * clients + client) % rows + 1,)
+            )
+
+def run_workload(database, clients: int, updates: int, rows: int):
+    """All sessions at once"""
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        futures = [
+            executor.submit(run_client, database, client, clients, updates, rows)
+            for client in range(clients)
+        ]
+        for future in futures:
+            future.result()
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args, pool_size=args.clients)
+    total = args.clients * args.updates
+    rows = []
+
+    for label, settings in CASES:
+        reset_table(database, args.rows)
+        if settings is not None:
+            manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config(**settings))
+            manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        concurrent = timed(lambda: run_workload(database, args.clients, args.updates, args.rows))
+        bulk_update = timed(lambda: database.execute_query(
+            f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'shipped'"
+        ))
+        bulk_delete = timed(lambda: database.execute_query(
+            f"DELETE FROM {BENCH_SCHEMA}.{BENCH_TABLE}"
+        ))
+
+        rows.append([
+            label,
+            f"{total / concurrent:.0f}/s",
+            f"{bulk_update:.2f}s",
+            f"{bulk_delete:.2f}s"
+        ])
+
+    print_table(["Capture", "Concurrent UPDATEs", "Bulk UPDATE", "Bulk DELETE"], rows)
+
+    database.execute_query(f"DROP DATABASE IF EXISTS {BENCH_SCHEMA}")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
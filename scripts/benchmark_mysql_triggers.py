@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark MySQL history triggers with and without no-op update guards
+
+Runs the same workload against a synthetic table with no history, with
+unconditional BEFORE UPDATE/DELETE triggers and with skip_unchanged_updates
+(the update trigger compares OLD and NEW with <=> first): single-row
+UPDATEs of which a share leave the row unchanged, then a bulk UPDATE that
+rewrites every row with its current values and a bulk DELETE. Reports
+timings and the history rows each case wrote.
+
+Usage:
+    python scripts/benchmark_mysql_triggers.py --host localhost --username root \
+        --database mysql --rows 200000 --single 5000 --noop-pct 50
+"""
+
+import argparse
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_mysql_triggers"
+BENCH_TABLE = "orders"
+
+CASES = [
+    ('none', None),
+    ('unconditional', False),
+    ('no-op guard', True),
+]
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser, db_type='mysql')
+    parser.add_argument('--rows', type=int, default=200000, help="Rows in the synthetic table")
+    parser.add_argument('--single', type=int, default=5000, help="Single-row UPDATEs to time")
+    parser.add_argument('--noop-pct', type=int, default=50,
+                        help="Percentage of single-row UPDATEs that change nothing")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load the table"""
+    database.execute_query(f"DROP DATABASE IF EXISTS {BENCH_SCHEMA}")
+    database.execute_query(f"CREATE DATABASE {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        customer_id BIGINT NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        total DECIMAL(12, 2),
+        note VARCHAR(64)
+    ) ENGINE=InnoDB
+    """)
+    database.execute_query(f"SET SESSION cte_max_recursion_depth = {rows + 1}")
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    WITH RECURSIVE seq (i) AS (
+        SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < {rows}
+    )
+    SELECT i, i % 10000, 'new', i % 1000, MD5(i) FROM seq
+    """)
+    database.execute_query(f"ANALYZE TABLE {BENCH_SCHEMA}.{BENCH_TABLE}")
+
+def history_rows(database) -> int:
+    """Rows written to the history table (0 when there is none)"""
+    tables = {table['name'] for table in database.get_tables(BENCH_SCHEMA)}
+    history_table = f"{BENCH_TABLE}_hst"
+    if history_table not in tables:
+        return 0
+    return database.execute_query(
+        f"SELECT COUNT(*) AS n FROM {BENCH_SCHEMA}.{history_table}"
+    )[0]['n']
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args)
+    rows = []
+
+    for label, skip_unchanged in CASES:
+        reset_table(database, args.rows)
+        if skip_unchanged is not None:
+            manager = HistoryManager(
+                database, HeadlessUI(BENCH_SCHEMA),
+                app_config(skip_unchanged_updates=skip_unchanged)
+            )
+            manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        step = max(1, args.rows // max(1, args.single))
+
+        def single_updates():
+            for i in range(args.single):
+                # noop_pct of every hundred UPDATEs write the current value back
+                status = "status" if i % 100 < args.noop_pct else "'paid'"
+                database.execute_query(
+                    f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = {status} WHERE id = %s",
+                    (i * step + 1,)
+                )
+
+        single = timed(single_updates)
+        bulk_update = timed(lambda: database.execute_query(
+            f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET total = total"
+        ))
+        bulk_delete = timed(lambda: database.execute_query(
+            f"DELETE FROM {BENCH_SCHEMA}.{BENCH_TABLE}"
+        ))
+
+        rows.append([
+            label,
+            f"{single / args.single * 1000:.2f} ms",
+            f"{bulk_update:.2f}s",
+            f"{bulk_delete:.2f}s",
+            history_rows(database)
+        ])
+
+    print_table(["Triggers", "Single UPDATE", "Bulk no-op UPDATE", "Bulk DELETE", "History rows"], rows)
+
+    database.execute_query(f"DROP DATABASE IF EXISTS {BENCH_SCHEMA}")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark history growth from no-op updates with skip_unchanged_updates
+
+Applies history to a synthetic table with skip_unchanged_updates off and
+on, then runs a workload in which most UPDATEs rewrite rows with their
+current values (as ORMs do), and reports history rows, history table size
+and workload time for both capture modes.
+
+Usage:
+    python scripts/benchmark_noop_updates.py --host localhost --username postgres --rows 200000
+"""
+
+import argparse
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_noop"
+BENCH_TABLE = "accounts"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--rows', type=int, default=200000, help="Rows in the synthetic table")
+    parser.add_argument('--changed-pct', type=int, default=10,
+                        help="Percentage of updated rows whose values actually change")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load the table"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        owner VARCHAR(100) NOT NULL,
+        balance NUMERIC(12, 2),
+        notes TEXT
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT i, 'owner_' || i, i % 5000, repeat('x', 200)
+    FROM generate_series(1, {rows}) AS i
+    """)
+
+def run_workload(database, changed_pct: int):
+    """Full-row UPDATE of every row; only changed_pct percent change a value"""
+    database.execute_query(f"""
+    UPDATE {BENCH_SCHEMA}.{BENCH_TABLE}
+    SET owner = owner,
+        balance = CASE WHEN id % 100 < {changed_pct} THEN balance + 1 ELSE balance END,
+        notes = notes
+    """)
+
+def history_size(database):
+    """Rows and on-disk size of the history table"""
+    row = database.execute_query(f"""
+    SELECT count(*) AS n,
+           pg_size_pretty(pg_total_relation_size('{BENCH_SCHEMA}.{BENCH_TABLE}_hst')) AS size
+    FROM {BENCH_SCHEMA}.{BENCH_TABLE}_hst
+    """)[0]
+    return row['n'], row['size']
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args)
+    rows = []
+
+    for capture_mode in ('row', 'statement'):
+        for skip_unchanged in (False, True):
+            reset_table(database, args.rows)
+            manager = HistoryManager(
+                database, HeadlessUI(BENCH_SCHEMA),
+                app_config(capture_mode=capture_mode, skip_unchanged_updates=skip_unchanged)
+            )
+            manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+            elapsed = timed(lambda: run_workload(database, args.changed_pct))
+            captured, size = history_size(database)
+            rows.append([capture_mode, skip_unchanged, args.rows, captured, size, f"{elapsed:.2f}s"])
+
+    print_table(
+        ["Capture mode", "Skip unchanged", "Rows updated", "History rows", "History size", "Time"],
+        rows
+    )
+
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
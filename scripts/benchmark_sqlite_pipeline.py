@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HistoryManager pipeline on SQLite, in-process with no server
+
+Creates synthetic tables in a SQLite file or :memory: database and times
+apply_tables over all of them, then measures what the generated triggers
+cost on DML: single-row UPDATEs, a bulk UPDATE and a bulk DELETE against a
+loaded table with no history, with history and with skip_unchanged_updates.
+
+Usage:
+    python scripts/benchmark_sqlite_pipeline.py --tables 2000 --columns 50 --rows 200000
+    python scripts/benchmark_sqlite_pipeline.py --database /tmp/bench.db
+"""
+
+import argparse
+import os
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "main"
+BENCH_TABLE = "bench_orders"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser, db_type='sqlite')
+    parser.set_defaults(database=os.getenv('DB_NAME', ':memory:'))
+    parser.add_argument('--tables', type=int, default=2000, help="Synthetic tables to apply history to")
+    parser.add_argument('--columns', type=int, default=50, help="Columns per synthetic table")
+    parser.add_argument('--rows', type=int, default=200000, help="Rows in the DML benchmark table")
+    parser.add_argument('--single', type=int, default=5000, help="Single-row UPDATEs to time")
+    return parser.parse_args()
+
+def drop_bench_tables(database):
+    """Drop the tables (and with them the triggers) of earlier runs"""
+    for table in database.get_tables(BENCH_SCHEMA):
+        if table['name'].startswith('bench_'):
+            database.execute_query(f"DROP TABLE IF EXISTS {BENCH_SCHEMA}.{table['name']}")
+    database.invalidate_metadata(BENCH_SCHEMA)
+
+def create_tables(database, tables: int, columns: int):
+    """Create synthetic tables with an integer key and mixed column types"""
+    column_defs = ", ".join(
+        f"col_{i} {'INTEGER' if i % 3 == 0 else 'VARCHAR(100)'}" for i in range(1, columns)
+    )
+    with database.transaction():
+        for i in range(tables):
+            database.execute_query(
+                f"CREATE TABLE {BENCH_SCHEMA}.bench_table_{i} (id INTEGER PRIMARY KEY, {column_defs})"
+            )
+    database.invalidate_metadata(BENCH_SCHEMA)
+
+def load_dml_table(database, rows: int):
+    """Recreate and load the DML benchmark table"""
+    drop_bench_tables(database)
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id INTEGER PRIMARY KEY,
+        customer_id INTEGER NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        total NUMERIC(12, 2),
+        note TEXT
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    WITH RECURSIVE seq (i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < {rows})
+    SELECT i, i % 10000, 'new', i % 1000, hex(randomblob(16)) FROM seq
+    """)
+    database.invalidate_metadata(BENCH_SCHEMA)
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args)
+    drop_bench_tables(database)
+
+    # 1. The pipeline itself: introspection, DDL generation and execution
+    create_tables(database, args.tables, args.columns)
+    tables = [f"bench_table_{i}" for i in range(args.tables)]
+    manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config())
+    results = []
+    elapsed = timed(lambda: results.extend(manager.apply_tables(tables, BENCH_SCHEMA)))
+    failed = sum(1 for result in results if result['status'] != 'SUCCESS')
+    print_table(
+        ["Tables", "Columns", "Failed", "Apply time", "Throughput"],
+        [[args.tables, args.columns, failed, f"{elapsed:.2f}s", f"{args.tables / elapsed:.0f} tables/s"]]
+    )
+
+    # 2. Trigger overhead on DML
+    rows = []
+    for label, settings in (
+        ('none', None),
+        ('history', {}),
+        ('history, skip unchanged', {'skip_unchanged_updates': True}),
+    ):
+        load_dml_table(database, args.rows)
+        if settings is not None:
+            HistoryManager(
+                database, HeadlessUI(BENCH_SCHEMA), app_config(**settings)
+            ).apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        step = max(1, args.rows // max(1, args.single))
+
+        def single_updates():
+            for i in range(args.single):
+                database.execute_query(
+                    f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'paid' WHERE id = ?",
+                    (i * step + 1,)
+                )
+
+        single = timed(single_updates)
+        bulk_update = timed(lambda: database.execute_query(
+            f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'shipped' WHERE id % 2 = 0"
+        ))
+        bulk_delete = timed(lambda: database.execute_query(
+            f"DELETE FROM {BENCH_SCHEMA}.{BENCH_TABLE} WHERE id % 2 = 1"
+        ))
+        rows.append([
+            label,
+            f"{single / args.single * 1e6:.0f} us",
+            f"{bulk_update:.2f}s",
+            f"{bulk_delete:.2f}s"
+        ])
+
+    print_table(["Triggers", "Single UPDATE", "Bulk UPDATE", "Bulk DELETE"], rows)
+
+    drop_bench_tables(database)
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
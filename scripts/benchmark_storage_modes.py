@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark history storage modes: full-row snapshots vs jsonb deltas
+
+Loads a wide synthetic table, applies history with storage_mode=full and
+then storage_mode=delta, and runs rounds of updates that each touch one
+small column. Reports update throughput, history table size and the time
+to rebuild sample versions with the delta reconstruction function.
+
+Usage:
+    python scripts/benchmark_storage_modes.py --host localhost --username postgres \
+        --rows 100000 --rounds 5
+"""
+
+import argparse
+import time
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_storage"
+BENCH_TABLE = "documents"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--rows', type=int, default=100000, help="Rows in the synthetic table")
+    parser.add_argument('--rounds', type=int, default=5, help="Update rounds over all rows")
+    parser.add_argument('--samples', type=int, default=200, help="Versions rebuilt in delta mode")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load a wide table"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        status VARCHAR(20) NOT NULL,
+        title VARCHAR(200),
+        body TEXT,
+        metadata JSONB,
+        revision INTEGER NOT NULL
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT i, 'draft', 'Document ' || i, repeat(md5(i::text), 30),
+           jsonb_build_object('tags', jsonb_build_array('a', 'b', 'c'), 'n', i), 0
+    FROM generate_series(1, {rows}) AS i
+    """)
+
+def history_stats(database):
+    """Rows and on-disk size of the history table"""
+    row = database.execute_query(f"""
+    SELECT count(*) AS n,
+           pg_total_relation_size('{BENCH_SCHEMA}.{BENCH_TABLE}_hst') AS bytes
+    FROM {BENCH_SCHEMA}.{BENCH_TABLE}_hst
+    """)[0]
+    return row['n'], row['bytes']
+
+def rebuild_versions(database, samples: int) -> float:
+    """Seconds spent rebuilding sample versions through the reconstruction function"""
+    started = time.perf_counter()
+    database.execute_query(f"""
+    SELECT {BENCH_SCHEMA}.{BENCH_TABLE}_hst_version(hist_id)
+    FROM {BENCH_SCHEMA}.{BENCH_TABLE}_hst
+    ORDER BY hist_id
+    LIMIT {samples}
+    """)
+    return time.perf_counter() - started
+
+def main():
+    """Benchmark entry point"""
+    args = parse_args()
+    database = connect(args)
+    rows = []
+
+    for storage_mode in ('full', 'delta'):
+        reset_table(database, args.rows)
+        manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config(storage_mode=storage_mode))
+        manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        elapsed = timed(lambda: [
+            database.execute_query(
+                f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET revision = revision + 1"
+            )
+            for _ in range(args.rounds)
+        ])
+        captured, size = history_stats(database)
+        rebuild = f"{rebuild_versions(database, args.samples):.3f}s" if storage_mode == 'delta' else "-"
+        rows.append([
+            storage_mode, captured, f"{size / 1024 / 1024:.1f} MB", f"{size / max(captured, 1):.0f} B",
+            f"{captured / elapsed:.0f} rows/s", rebuild
+        ])
+
+    print_table(
+        ["Storage mode", "History rows", "History size", "Bytes/row", "Update throughput",
+         f"Rebuild {args.samples} versions"],
+        rows
+    )
+
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.disconnect()
+
+if __name__ == "__main__":
+    main()
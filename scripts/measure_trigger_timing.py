@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Measure history trigger overhead with BEFORE vs AFTER row triggers
+
+Runs the same workload against a synthetic table with no history,
+trigger_timing=before and trigger_timing=after: single-row UPDATEs (per
+statement latency percentiles) followed by a bulk UPDATE and a bulk DELETE.
+AFTER row triggers queue one event per row until the end of the statement,
+so bulk statements are where the two differ; the peak memory of the server
+backend is reported from /proc when the server runs on this host.
+
+Usage:
+    python scripts/measure_trigger_timing.py --host localhost --username postgres \
+        --rows 500000 --single 2000
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Optional
+
+from bench_common import HeadlessUI, add_connection_args, app_config, connect, print_table, timed
+from core.history_manager import HistoryManager
+
+BENCH_SCHEMA = "bench_timing"
+BENCH_TABLE = "orders"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_connection_args(parser)
+    parser.add_argument('--rows', type=int, default=500000, help="Rows in the synthetic table")
+    parser.add_argument('--single', type=int, default=2000, help="Single-row UPDATEs to time")
+    parser.add_argument('--bulk-pct', type=int, default=50,
+                        help="Percentage of rows touched by the bulk UPDATE and DELETE")
+    return parser.parse_args()
+
+def reset_table(database, rows: int):
+    """Recreate the synthetic schema and load the table"""
+    database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    database.execute_query(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    database.execute_query(f"""
+    CREATE TABLE {BENCH_SCHEMA}.{BENCH_TABLE} (
+        id BIGINT PRIMARY KEY,
+        customer_id BIGINT NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        total NUMERIC(12, 2),
+        note TEXT
+    )
+    """)
+    database.execute_query(f"""
+    INSERT INTO {BENCH_SCHEMA}.{BENCH_TABLE}
+    SELECT i, i % 10000, 'new', i % 1000, md5(i::text)
+    FROM generate_series(1, {rows}) AS i
+    """)
+    database.execute_query(f"ANALYZE {BENCH_SCHEMA}.{BENCH_TABLE}")
+
+def backend_peak_memory(database) -> Optional[float]:
+    """Peak resident memory of the server backend in MB (None unless the server is local)"""
+    pid = database.execute_query("SELECT pg_backend_pid() AS pid")[0]['pid']
+    status = Path(f"/proc/{pid}/status")
+    try:
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def main():
+    """Measurement entry point"""
+    args = parse_args()
+    rows = []
+
+    for timing in ('none', 'before', 'after'):
+        # A fresh backend per case so its peak memory belongs to this workload
+        database = connect(args)
+        reset_table(database, args.rows)
+        if timing != 'none':
+            manager = HistoryManager(database, HeadlessUI(BENCH_SCHEMA), app_config(trigger_timing=timing))
+            manager.apply_tables([BENCH_TABLE], BENCH_SCHEMA)
+
+        latencies = []
+        step = max(1, args.rows // max(1, args.single))
+        for i in range(args.single):
+            started = time.perf_counter()
+            database.execute_query(
+                f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'paid' WHERE id = %s",
+                (i * step + 1,)
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        bulk_update = timed(lambda: database.execute_query(
+            f"UPDATE {BENCH_SCHEMA}.{BENCH_TABLE} SET status = 'shipped' WHERE id % 100 < {args.bulk_pct}"
+        ))
+        bulk_delete = timed(lambda: database.execute_query(
+            f"DELETE FROM {BENCH_SCHEMA}.{BENCH_TABLE} WHERE id % 100 < {args.bulk_pct}"
+        ))
+        peak = backend_peak_memory(database)
+
+        rows.append([
+            timing,
+            f"{percentile(latencies, 50):.2f} ms",
+            f"{percentile(latencies, 95):.2f} ms",
+            f"{bulk_update:.2f}s",
+            f"{bulk_delete:.2f}s",
+            f"{peak:.0f} MB" if peak is not None else "n/a"
+        ])
+        database.execute_query(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        database.disconnect()
+
+    print_table(
+        ["Trigger timing", "Single p50", "Single p95", "Bulk UPDATE", "Bulk DELETE", "Backend peak memory"],
+        rows
+    )
+
+if __name__ == "__main__":
+    main()
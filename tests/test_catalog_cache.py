@@ -0,0 +1,143 @@
+"""
+MetadataCache eviction, expiry and invalidation tests, and catalog
+snapshot reuse against SQLite
+"""
+
+import pytest
+
+from core import catalog_cache
+from core.catalog_cache import MetadataCache
+from core.database import DatabaseFactory
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(catalog_cache.time, 'monotonic', fake)
+    return fake
+
+def test_miss_returns_sentinel_and_none_is_cached():
+    cache = MetadataCache()
+
+    assert cache.get(('tables', 's')) is MetadataCache.MISSING
+    cache.put(('tables', 's'), None)
+    assert cache.get(('tables', 's')) is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MetadataCache(maxsize=2)
+    cache.put(('columns', 's', 'a'), 'a')
+    cache.put(('columns', 's', 'b'), 'b')
+    # Reading a makes b the least recently used entry
+    cache.get(('columns', 's', 'a'))
+    cache.put(('columns', 's', 'c'), 'c')
+
+    assert cache.get(('columns', 's', 'b')) is MetadataCache.MISSING
+    assert cache.get(('columns', 's', 'a')) == 'a'
+    assert cache.get(('columns', 's', 'c')) == 'c'
+    assert cache.stats()['evictions'] == 1
+
+def test_entries_expire_after_ttl(clock):
+    cache = MetadataCache(ttl=10)
+    cache.put(('tables', 's'), ['t'])
+
+    clock.now += 9.9
+    assert cache.get(('tables', 's')) == ['t']
+    clock.now += 0.1
+    assert cache.get(('tables', 's')) is MetadataCache.MISSING
+    assert cache.stats()['size'] == 0
+
+def test_no_ttl_never_expires(clock):
+    cache = MetadataCache(ttl=None)
+    cache.put(('tables', 's'), ['t'])
+
+    clock.now += 10 ** 9
+    assert cache.get(('tables', 's')) == ['t']
+
+def test_zero_ttl_disables_caching():
+    cache = MetadataCache(ttl=0)
+    cache.put(('tables', 's'), ['t'])
+
+    assert cache.get(('tables', 's')) is MetadataCache.MISSING
+
+def test_invalidate_table_keeps_other_tables_but_drops_table_list():
+    cache = MetadataCache()
+    cache.put(('tables', 's'), ['a', 'b'])
+    cache.put(('columns', 's', 'a'), 'a')
+    cache.put(('columns', 's', 'b'), 'b')
+    cache.put(('columns', 'other', 'a'), 'other a')
+
+    cache.invalidate('s', 'a')
+
+    assert cache.get(('columns', 's', 'a')) is MetadataCache.MISSING
+    assert cache.get(('tables', 's')) is MetadataCache.MISSING
+    assert cache.get(('columns', 's', 'b')) == 'b'
+    assert cache.get(('columns', 'other', 'a')) == 'other a'
+
+def test_invalidate_schema_and_everything():
+    cache = MetadataCache()
+    cache.put(('columns', 's', 'a'), 'a')
+    cache.put(('columns', 'other', 'a'), 'other a')
+
+    cache.invalidate('s')
+    assert cache.get(('columns', 's', 'a')) is MetadataCache.MISSING
+    assert cache.get(('columns', 'other', 'a')) == 'other a'
+
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
+
+def sqlite_database(database: str, cache_dir):
+    """Connected SQLite database with the on-disk snapshot cache enabled"""
+    db = DatabaseFactory.create_database(
+        {'db_type': 'sqlite', 'database': database, 'catalog_cache': True,
+         'catalog_cache_dir': str(cache_dir)},
+        ui=None
+    )
+    db.connect()
+    return db
+
+def test_memory_databases_bypass_the_snapshot_cache(tmp_path):
+    for table_name in ('first', 'second'):
+        db = sqlite_database(':memory:', tmp_path)
+        db.execute_query(f"CREATE TABLE {table_name} (id INTEGER PRIMARY KEY)")
+
+        assert db.get_catalog_version('main') is None
+        assert [table['name'] for table in db.get_tables('main')] == [table_name]
+        db.disconnect()
+
+    assert list(tmp_path.iterdir()) == []
+
+def test_recreated_file_does_not_reuse_the_snapshot(tmp_path):
+    path = tmp_path / 'app.db'
+    cache_dir = tmp_path / 'cache'
+    for table_name in ('first', 'second'):
+        # Both files end at the same schema_version
+        db = sqlite_database(str(path), cache_dir)
+        db.execute_query(f"CREATE TABLE {table_name} (id INTEGER PRIMARY KEY)")
+
+        assert [table['name'] for table in db.get_tables('main')] == [table_name]
+        assert list(db.get_schema_columns('main')) == [table_name]
+        db.disconnect()
+        path.unlink()
+
+    assert any(cache_dir.iterdir())
+
+def test_unchanged_file_reuses_the_snapshot(tmp_path):
+    path = str(tmp_path / 'app.db')
+    db = sqlite_database(path, tmp_path / 'cache')
+    db.execute_query("CREATE TABLE orders (id INTEGER PRIMARY KEY)")
+    db.get_tables('main')
+    db.disconnect()
+
+    db = sqlite_database(path, tmp_path / 'cache')
+    db._fetch_tables = None  # a snapshot miss would fail here
+    assert [table['name'] for table in db.get_tables('main')] == ['orders']
+    db.disconnect()
@@ -0,0 +1,172 @@
+"""
+ConnectionPool sizing, recycling, validation and timeout tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from core import connection_pool
+from core.connection_pool import ConnectionPool, PoolTimeoutError
+
+class FakeConnection:
+    """Driver connection stand-in"""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed = False
+        self.healthy = True
+        self.resets = 0
+
+class FakeDriver:
+    """Creates and closes FakeConnections and records what happened"""
+
+    def __init__(self):
+        self.created = []
+
+    def create(self) -> FakeConnection:
+        connection = FakeConnection(len(self.created) + 1)
+        self.created.append(connection)
+        return connection
+
+    @staticmethod
+    def close(connection: FakeConnection):
+        connection.closed = True
+
+    @staticmethod
+    def validate(connection: FakeConnection) -> bool:
+        return connection.healthy
+
+    @staticmethod
+    def reset(connection: FakeConnection):
+        connection.resets += 1
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+def make_pool(driver: FakeDriver, **kwargs) -> ConnectionPool:
+    """Pool over a fake driver with validation and reset enabled"""
+    kwargs.setdefault('acquire_timeout', 1.0)
+    return ConnectionPool(
+        create=driver.create, close=driver.close,
+        validate=driver.validate, reset=driver.reset, **kwargs
+    )
+
+def test_connections_are_created_lazily_and_reused(driver):
+    pool = make_pool(driver, max_size=3)
+    assert driver.created == []
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(driver.created) == 1
+    assert first.resets == 1
+    assert pool.stats()['checkouts'] == 2
+
+def test_pool_never_exceeds_max_size(driver):
+    pool = make_pool(driver, max_size=2, acquire_timeout=0.05)
+    held = [pool.acquire(), pool.acquire()]
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    stats = pool.stats()
+    assert len(driver.created) == 2
+    assert stats['in_use'] == 2
+    assert stats['timeouts'] == 1
+    for connection in held:
+        pool.release(connection)
+
+def test_waiter_gets_released_connection(driver):
+    pool = make_pool(driver, max_size=1, acquire_timeout=2.0)
+    held = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(held,)).start()
+
+    started = time.monotonic()
+    connection = pool.acquire()
+
+    assert connection is held
+    assert time.monotonic() - started >= 0.04
+    stats = pool.stats()
+    assert stats['waits'] == 1
+    assert stats['wait_time_max'] > 0
+
+def test_expired_connections_are_recycled(driver, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(connection_pool.time, 'monotonic', lambda: now[0])
+    pool = make_pool(driver, max_lifetime=60)
+
+    first = pool.acquire()
+    pool.release(first)
+    now[0] += 61
+    second = pool.acquire()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()['recycled'] == 1
+
+def test_connection_expiring_while_in_use_is_closed_on_release(driver, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(connection_pool.time, 'monotonic', lambda: now[0])
+    pool = make_pool(driver, max_lifetime=60)
+
+    connection = pool.acquire()
+    now[0] += 61
+    pool.release(connection)
+
+    assert connection.closed
+    assert pool.stats()['idle'] == 0
+
+def test_broken_connections_are_replaced_on_borrow(driver):
+    pool = make_pool(driver)
+    first = pool.acquire()
+    pool.release(first)
+    first.healthy = False
+
+    second = pool.acquire()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()['invalidated'] == 1
+
+def test_connection_is_discarded_when_broken_inside_context(driver):
+    pool = make_pool(driver)
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as connection:
+            connection.healthy = False
+            raise RuntimeError("driver failure")
+
+    assert connection.closed
+    assert pool.stats()['in_use'] == 0
+    assert pool.stats()['idle'] == 0
+
+def test_failed_create_frees_the_slot(driver):
+    attempts = []
+
+    def create():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("connection refused")
+        return driver.create()
+
+    pool = ConnectionPool(create=create, close=driver.close, max_size=1, acquire_timeout=0.05)
+
+    with pytest.raises(OSError):
+        pool.acquire()
+    assert pool.acquire() is driver.created[0]
+
+def test_closed_pool_refuses_checkouts(driver):
+    pool = make_pool(driver)
+    idle = pool.acquire()
+    pool.release(idle)
+
+    pool.close()
+
+    assert idle.closed
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
@@ -0,0 +1,178 @@
+"""
+HistoryManager pipeline tests against an in-process SQLite database
+"""
+
+from dataclasses import asdict
+
+import pytest
+from rich.console import Console
+
+from config.settings import AppConfig
+from core.database import DatabaseFactory
+from core.history_manager import HistoryManager
+
+SCHEMA = "main"
+
+class StubUI:
+    """Non-interactive UI that confirms everything"""
+
+    def __init__(self):
+        self.console = Console(quiet=True)
+        self.current_schema = SCHEMA
+        self.messages = []
+
+    def display_header(self, title: str):
+        pass
+
+    def display_message(self, message: str, msg_type: str = "info"):
+        self.messages.append((msg_type, message))
+
+    def display_error(self, error: str):
+        self.messages.append(("error", error))
+
+    def confirm_action(self, message: str, default: bool = False) -> bool:
+        return True
+
+@pytest.fixture
+def database():
+    """Fresh :memory: database with an orders table"""
+    db = DatabaseFactory.create_database(
+        {'db_type': 'sqlite', 'database': ':memory:', 'catalog_cache': False}, ui=None
+    )
+    db.connect()
+    db.execute_query("""
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY,
+        status VARCHAR(20) NOT NULL,
+        note TEXT
+    )
+    """)
+    for order_id in range(1, 4):
+        db.execute_query("INSERT INTO orders VALUES (?, 'new', NULL)", (order_id,))
+    yield db
+    db.disconnect()
+
+def make_manager(database, **settings) -> HistoryManager:
+    """HistoryManager with default app settings plus overrides"""
+    app = asdict(AppConfig())
+    app.update(settings)
+    return HistoryManager(database, StubUI(), {'app': app})
+
+def history_rows(database):
+    """Rows of the orders history table in capture order"""
+    return database.execute_query(
+        "SELECT * FROM orders_hst ORDER BY hist_id"
+    )
+
+def history_columns(database):
+    """Column names of the orders history table"""
+    return [row['name'] for row in database.execute_query("PRAGMA table_info(orders_hst)")]
+
+def triggers(database):
+    """Names of the triggers in the database"""
+    return sorted(
+        row['name'] for row in database.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        )
+    )
+
+def test_apply_captures_updates_and_deletes(database):
+    results = make_manager(database).apply_tables(['orders'], SCHEMA)
+
+    assert [(r['table'], r['status']) for r in results] == [('orders', 'SUCCESS')]
+    assert triggers(database) == ['orders_history_delete', 'orders_history_update']
+
+    database.execute_query("UPDATE orders SET status = 'paid' WHERE id = 1")
+    database.execute_query("DELETE FROM orders WHERE id = 2")
+
+    rows = history_rows(database)
+    assert [(r['id'], r['status'], r['history_operation']) for r in rows] == [
+        (1, 'new', 'UPDATE'),
+        (2, 'new', 'DELETE'),
+    ]
+    assert all(r['history_timestamp'] for r in rows)
+
+def test_apply_is_repeatable(database):
+    make_manager(database).apply_tables(['orders'], SCHEMA)
+    results = make_manager(database).apply_tables(['orders'], SCHEMA)
+
+    assert results[0]['status'] == 'SUCCESS'
+    database.execute_query("UPDATE orders SET status = 'paid' WHERE id = 1")
+    assert len(history_rows(database)) == 1
+
+def test_updates_are_recorded_even_when_unchanged_by_default(database):
+    make_manager(database).apply_tables(['orders'], SCHEMA)
+
+    database.execute_query("UPDATE orders SET status = status")
+
+    assert len(history_rows(database)) == 3
+
+def test_skip_unchanged_updates(database):
+    make_manager(database, skip_unchanged_updates=True).apply_tables(['orders'], SCHEMA)
+
+    database.execute_query("UPDATE orders SET status = status")
+    database.execute_query("UPDATE orders SET note = NULL")
+    assert history_rows(database) == []
+
+    database.execute_query("UPDATE orders SET note = 'x' WHERE id = 3")
+    assert [(r['id'], r['note']) for r in history_rows(database)] == [(3, None)]
+
+def test_exclude_columns(database):
+    make_manager(database, exclude_columns=['note']).apply_tables(['orders'], SCHEMA)
+
+    assert 'note' not in history_columns(database)
+
+    database.execute_query("UPDATE orders SET note = 'x' WHERE id = 1")
+    assert history_rows(database) == []
+
+    database.execute_query("UPDATE orders SET status = 'paid' WHERE id = 1")
+    assert [(r['id'], r['status']) for r in history_rows(database)] == [(1, 'new')]
+
+def test_include_columns_keep_primary_key(database):
+    make_manager(database, include_columns=['status']).apply_tables(['orders'], SCHEMA)
+
+    assert history_columns(database)[:3] == ['hist_id', 'id', 'status']
+    assert 'note' not in history_columns(database)
+
+    database.execute_query("UPDATE orders SET note = 'x'")
+    database.execute_query("UPDATE orders SET status = 'paid' WHERE id = 2")
+    assert [(r['id'], r['status']) for r in history_rows(database)] == [(2, 'new')]
+
+def test_global_lists_skip_columns_a_table_lacks(database):
+    results = make_manager(database, exclude_columns=['missing', 'note']).apply_tables(['orders'], SCHEMA)
+
+    assert results[0]['status'] == 'SUCCESS'
+    assert 'note' not in history_columns(database)
+
+def test_unknown_override_columns_fail_the_table(database):
+    manager = make_manager(database, tables={'orders': {'exclude_columns': ['missing']}})
+    results = manager.apply_tables(['orders'], SCHEMA)
+
+    assert results[0]['status'] == 'FAILED'
+    assert 'missing' in results[0]['error']
+    assert triggers(database) == []
+
+def test_rollback_drops_triggers_and_keeps_history(database):
+    manager = make_manager(database)
+    manager.apply_tables(['orders'], SCHEMA)
+    database.execute_query("UPDATE orders SET status = 'paid' WHERE id = 1")
+
+    manager._execute_rollback()
+
+    assert triggers(database) == []
+    assert manager._changes_applied == []
+    database.execute_query("UPDATE orders SET status = 'shipped' WHERE id = 1")
+    assert [(r['id'], r['status']) for r in history_rows(database)] == [(1, 'new')]
+
+def test_key_columns_follow_primary_key_order(database):
+    database.execute_query("""
+    CREATE TABLE order_lines (
+        line_no INTEGER NOT NULL,
+        order_id INTEGER NOT NULL,
+        sku TEXT,
+        PRIMARY KEY (order_id, line_no)
+    )
+    """)
+    columns = database.get_schema_columns(SCHEMA, ['order_lines'])['order_lines']
+
+    assert make_manager(database)._key_columns(SCHEMA, 'order_lines', columns) == ['order_id', 'line_no']
@@ -0,0 +1,77 @@
+"""
+History partition ranges and partition DDL tests
+"""
+
+from datetime import date
+
+import pytest
+
+from core.trigger_generator import PostgreSQLTriggerGenerator, partition_ranges
+
+def test_day_ranges_cross_a_leap_day():
+    assert partition_ranges('day', date(2024, 2, 28), 3) == [
+        (date(2024, 2, 28), date(2024, 2, 29)),
+        (date(2024, 2, 29), date(2024, 3, 1)),
+        (date(2024, 3, 1), date(2024, 3, 2)),
+    ]
+
+def test_week_ranges_start_on_monday_and_cross_the_year():
+    # 2026-12-31 is a Thursday
+    assert partition_ranges('week', date(2026, 12, 31), 2) == [
+        (date(2026, 12, 28), date(2027, 1, 4)),
+        (date(2027, 1, 4), date(2027, 1, 11)),
+    ]
+
+def test_week_range_of_a_monday_starts_that_day():
+    assert partition_ranges('week', date(2026, 10, 12), 1) == [(date(2026, 10, 12), date(2026, 10, 19))]
+
+def test_month_ranges_start_on_the_first_and_cross_the_year():
+    assert partition_ranges('month', date(2026, 11, 30), 3) == [
+        (date(2026, 11, 1), date(2026, 12, 1)),
+        (date(2026, 12, 1), date(2027, 1, 1)),
+        (date(2027, 1, 1), date(2027, 2, 1)),
+    ]
+
+def test_month_ranges_cover_february():
+    lower, upper = partition_ranges('month', date(2024, 2, 15), 1)[0]
+    assert (upper - lower).days == 29
+
+def test_ranges_are_contiguous():
+    ranges = partition_ranges('week', date(2026, 1, 1), 60)
+    assert all(upper == next_lower for (_, upper), (next_lower, _) in zip(ranges, ranges[1:]))
+
+def test_unknown_granularity_is_rejected():
+    with pytest.raises(ValueError):
+        partition_ranges('year', date(2026, 1, 1), 1)
+
+def test_partition_ddl_creates_premade_partitions():
+    generator = PostgreSQLTriggerGenerator(None)
+    ddl = generator.generate_partition_ddl(
+        'public', 'orders_hst', {'partition_by': 'month', 'partition_premake': 2},
+        start=date(2026, 12, 15)
+    )
+
+    assert ddl.count("PARTITION OF public.orders_hst") == 3
+    assert "public.orders_hst_p20261201" in ddl
+    assert "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')" in ddl
+    assert "FOR VALUES FROM ('2027-02-01') TO ('2027-03-01')" in ddl
+    assert "partrelid = 'public.orders_hst'::regclass" in ddl
+
+def test_partition_ddl_uses_week_boundaries_and_storage_clause():
+    generator = PostgreSQLTriggerGenerator(None)
+    ddl = generator.generate_partition_ddl(
+        'public', 'orders_hst',
+        {'partition_by': 'week', 'storage_profile': 'append_only', 'history_tablespace': 'archive'},
+        start=date(2026, 12, 31), count=1
+    )
+
+    assert "public.orders_hst_p20261228" in ddl
+    assert "FOR VALUES FROM ('2026-12-28') TO ('2027-01-04')" in ddl
+    assert "WITH (fillfactor = 100" in ddl
+    assert "TABLESPACE archive;" in ddl
+
+def test_partition_ddl_rejects_unknown_partition_by():
+    with pytest.raises(ValueError, match="public.orders_hst"):
+        PostgreSQLTriggerGenerator(None).generate_partition_ddl(
+            'public', 'orders_hst', {'partition_by': 'year'}, start=date(2026, 1, 1)
+        )
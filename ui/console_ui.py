@@ -39,9 +39,16 @@ class ConsoleUI:
                 choices=['PostgreSQL', 'MySQL', 'SQL Server', 'SQLite', 'Oracle'],
                 default=default_config.get('database', {}).get('type', 'PostgreSQL')
             ),
+            # SQLite opens a file instead of connecting to a server
+            inquirer.Text('database',
+                message="Database file (or :memory:)",
+                default=default_config.get('database', {}).get('database', ':memory:'),
+                ignore=lambda answers: answers['db_type'] != 'SQLite'
+            ),
             inquirer.Text('host',
                 message="Host address",
-                default=default_config.get('database', {}).get('host', 'localhost')
+                default=default_config.get('database', {}).get('host', 'localhost'),
+                ignore=lambda answers: answers['db_type'] == 'SQLite'
             ),
             inquirer.Text('port',
                 message="Port",
@@ -49,31 +56,37 @@ class ConsoleUI:
                     {'PostgreSQL': '5432', 'MySQL': '3306', 'SQL Server': '1433'}.get(
                         default_config.get('database', {}).get('type', 'PostgreSQL'), '5432'
                     )
-                )
+                ),
+                ignore=lambda answers: answers['db_type'] == 'SQLite'
             ),
             inquirer.Text('username',
                 message="Username",
-                default=default_config.get('database', {}).get('username', '')
+                default=default_config.get('database', {}).get('username', ''),
+                ignore=lambda answers: answers['db_type'] == 'SQLite'
             ),
             inquirer.Password('password',
-                message="Password"
+                message="Password",
+                ignore=lambda answers: answers['db_type'] == 'SQLite'
             ),
             inquirer.Confirm('ssl',
                 message="Use SSL?",
-                default=default_config.get('database', {}).get('ssl', False)
+                default=default_config.get('database', {}).get('ssl', False),
+                ignore=lambda answers: answers['db_type'] == 'SQLite'
             )
         ]
         
         answers = inquirer.prompt(questions)
         
         config = {
-            'db_type': answers['db_type'].lower(),
+            'db_type': answers['db_type'].lower().replace(' ', ''),  # 'SQL Server' -> 'sqlserver'
             'host': answers['host'],
             'port': int(answers['port']),
             'username': answers['username'],
             'password': answers['password'],
             'ssl_enabled': answers['ssl']
         }
+        if answers['db_type'] == 'SQLite':
+            config['database'] = answers['database']
         
         return config
     
@@ -164,13 +177,14 @@ class ConsoleUI:
         menu.add_row("1", "Preview changes")
         menu.add_row("2", "Apply changes")
         menu.add_row("3", "Rollback changes")
-        menu.add_row("4", "Configure settings")
-        menu.add_row("5", "Exit")
+        menu.add_row("4", "Pre-create partitions")
+        menu.add_row("5", "Configure settings")
+        menu.add_row("6", "Exit")
         
         self.console.print(menu)
         print()
         
-        choices = ["1", "2", "3", "4", "5"]
+        choices = ["1", "2", "3", "4", "5", "6"]
         choice = Prompt.ask(
             "Select option",
             choices=choices,
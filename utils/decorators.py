@@ -3,13 +3,15 @@ Utility decorators for the application
 """
 
 import functools
+import random
 import time
 from typing import Callable, Any, Optional
 from datetime import datetime
 from .logger import get_logger
 
 def retry(max_attempts: int = 3, delay: float = 1.0, 
-          backoff: float = 2.0, exceptions: tuple = (Exception,)):
+          backoff: float = 2.0, exceptions: tuple = (Exception,),
+          jitter: float = 0.0):
     """
     Retry decorator with exponential backoff
     
@@ -18,6 +20,8 @@ def retry(max_attempts: int = 3, delay: float = 1.0,
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch and retry
+        jitter: Fraction of each delay that is randomized (0 to 1), so
+            concurrent callers don't retry in lockstep
     """
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -33,14 +37,18 @@ def retry(max_attempts: int = 3, delay: float = 1.0,
                     if attempt == max_attempts - 1:  # Last attempt
                         raise
                     
+                    wait = current_delay
+                    if jitter:
+                        wait = current_delay * (1 - jitter + random.random() * jitter)
+                    
                     # Log retry attempt
                     logger = get_logger()
                     logger.warning(
                         f"Retry {attempt + 1}/{max_attempts} for {func.__name__}: "
-                        f"{str(e)}. Waiting {current_delay} seconds..."
+                        f"{str(e)}. Waiting {wait:.2f} seconds..."
                     )
                     
-                    time.sleep(current_delay)
+                    time.sleep(wait)
                     current_delay *= backoff
             
             # This should never be reached